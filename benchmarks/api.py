@@ -0,0 +1,223 @@
+"""API latency, throughput, Redis commands and memory at several keyspace sizes.
+
+For every size, starts from an empty local redis-server, loads a synthetic
+dataset (see redislens.generator) and drives each endpoint of the real
+``redislens.api:app`` at every concurrency level, recording:
+
+* p50 / p99 latency and throughput;
+* Redis commands per request, from INFO commandstats deltas, broken down by
+  command so an extra KEYS or SCAN per request shows up even when latency
+  hides it at small sizes;
+* resident set size of the API process after the run.
+
+Results can be saved as a baseline and later runs compared against it; the
+script exits with status 1 when any metric regressed beyond the tolerance.
+
+Usage::
+
+    python benchmarks/api.py --sizes 10000 1000000 --save-baseline baseline.json
+    python benchmarks/api.py --sizes 10000 1000000 --baseline baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import redis
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import (  # noqa: E402
+    api_server,
+    command_calls,
+    command_delta,
+    process_rss,
+    redis_server,
+    run_load,
+    seed_dataset,
+    seed_strings,
+)
+
+ENDPOINTS = ("info", "keys", "key", "execute", "delete")
+DELETE_PREFIX = "bench:delete"
+# Metrics compared with the baseline and whether a higher value is worse
+METRICS = {
+    "p50_ms": True,
+    "p99_ms": True,
+    "throughput_rps": False,
+    "commands_per_request": True,
+    "rss_bytes": True,
+}
+
+
+def sample_keys(port: int, count: int) -> List[str]:
+    """Up to count distinct existing keys, picked with RANDOMKEY."""
+    client = redis.Redis(port=port, decode_responses=True)
+    pipe = client.pipeline(transaction=False)
+    for _ in range(count):
+        pipe.randomkey()
+    return sorted({key for key in pipe.execute() if key is not None})
+
+
+def delete_key(i: int) -> str:
+    """Name of the i-th key seeded by seed_strings under DELETE_PREFIX."""
+    return f"{DELETE_PREFIX}:{i // 1000}:{i}"
+
+
+def request_factory(endpoint: str, query: Dict[str, Any], keys: List[str], delete_batch: int, offset: int = 0):
+    """make_request for run_load; offset shifts the delete key range so warm-up keys are not reused."""
+    if endpoint == "info":
+        return lambda i: {"method": "POST", "url": "/api/info", "params": query}
+    if endpoint == "keys":
+        return lambda i: {"method": "POST", "url": "/api/keys", "params": dict(query, cursor="0")}
+    if endpoint == "key":
+        return lambda i: {"method": "POST", "url": f"/api/key/{keys[i % len(keys)]}", "params": query}
+    if endpoint == "execute":
+        return lambda i: {
+            "method": "POST", "url": "/api/execute", "params": query,
+            "json": {"command": "TYPE", "args": [keys[i % len(keys)]]},
+        }
+    return lambda i: {
+        "method": "POST", "url": "/api/keys/delete", "params": query,
+        "json": {"keys": [delete_key((offset + i) * delete_batch + j) for j in range(delete_batch)]},
+    }
+
+
+def measure(base_url: str, redis_port: int, api_pid: int, endpoint: str, concurrency: int,
+            requests: int, warmup: int, keys: List[str], delete_batch: int) -> Dict[str, Any]:
+    query = {"port": redis_port}
+    if endpoint == "delete":
+        seed_strings(redis_port, (warmup + requests) * delete_batch, prefix=DELETE_PREFIX)
+    # Warm up pools, caches and the interpreter before anything is counted
+    if warmup:
+        asyncio.run(run_load(base_url, request_factory(endpoint, query, keys, delete_batch), concurrency, warmup))
+
+    stats = redis.Redis(port=redis_port)
+    before = command_calls(stats)
+    result = asyncio.run(run_load(
+        base_url, request_factory(endpoint, query, keys, delete_batch, offset=warmup), concurrency, requests
+    ))
+    commands = command_delta(before, command_calls(stats))
+    stats.close()
+
+    issued = max(result["requests"], 1)
+    return {
+        "endpoint": endpoint,
+        "concurrency": concurrency,
+        **result,
+        "commands_per_request": round(sum(commands.values()) / issued, 3),
+        "commands": {name: round(calls / issued, 3) for name, calls in sorted(commands.items())},
+        **process_rss(api_pid),
+    }
+
+
+def result_id(row: Dict[str, Any]) -> str:
+    return f"{row['keys']}/{row['endpoint']}/{row['concurrency']}"
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float) -> List[str]:
+    """Describe every metric that is worse than the baseline by more than tolerance (a fraction)."""
+    previous = {result_id(row): row for row in baseline}
+    regressions = []
+    for row in results:
+        old = previous.get(result_id(row))
+        if old is None:
+            continue
+        for metric, higher_is_worse in METRICS.items():
+            new_value, old_value = row.get(metric), old.get(metric)
+            if not new_value or not old_value:
+                continue
+            change = (new_value - old_value) / old_value
+            if (change if higher_is_worse else -change) > tolerance:
+                regressions.append(f"{result_id(row)} {metric}: {old_value:g} -> {new_value:g} ({change:+.0%})")
+        if row["errors"] > old.get("errors", 0):
+            regressions.append(f"{result_id(row)} errors: {old.get('errors', 0)} -> {row['errors']}")
+        new_commands = sorted(set(row["commands"]) - set(old.get("commands", {})))
+        if new_commands:
+            regressions.append(f"{result_id(row)} new Redis commands: {', '.join(new_commands)}")
+    return regressions
+
+
+def format_bytes(size: Optional[int]) -> str:
+    return f"{size / (1 << 20):.0f}M" if size else "-"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 1000000, 10000000],
+                        help="Keyspace sizes to test (default: 10000 1000000 10000000)")
+    parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, default=list(ENDPOINTS))
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--requests", type=int, default=2000, help="Measured requests per run (default: 2000)")
+    parser.add_argument("--warmup", type=int, default=100, help="Unmeasured requests before each run (default: 100)")
+    parser.add_argument("--sample-keys", type=int, default=1000,
+                        help="Existing keys read by the key and execute runs (default: 1000)")
+    parser.add_argument("--delete-batch", type=int, default=10, help="Keys per delete request (default: 10)")
+    parser.add_argument("--seed", type=int, default=0, help="Dataset seed (default: 0)")
+    parser.add_argument("--processes", type=int, help="Dataset generator processes (default: CPU count)")
+    parser.add_argument("-o", "--output", help="Write the results as JSON to this file")
+    parser.add_argument("--baseline", help="Compare against results saved with --save-baseline")
+    parser.add_argument("--save-baseline", help="Save the results as a baseline to this file")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative regression before a metric is reported (default: 0.2)")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    results = []
+    print(f"{'keys':>9} {'endpoint':<8} {'conc':>5} {'rps':>8} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'cmds/req':>9} {'rss':>6} {'errors':>7}")
+    with redis_server() as redis_port:
+        for size in args.sizes:
+            started = time.monotonic()
+            seed_dataset(redis_port, size, seed=args.seed, processes=args.processes)
+            print(f"# seeded {size} keys in {time.monotonic() - started:.1f}s", file=sys.stderr)
+            keys = sample_keys(redis_port, args.sample_keys)
+            # A fresh API process per size, so RSS reflects this keyspace only
+            with api_server("redislens.api:app") as (api_port, api_pid):
+                for endpoint in args.endpoints:
+                    for concurrency in args.concurrency:
+                        row = {"keys": size, **measure(
+                            f"http://127.0.0.1:{api_port}", redis_port, api_pid, endpoint, concurrency,
+                            args.requests, args.warmup, keys, args.delete_batch,
+                        )}
+                        results.append(row)
+                        print(
+                            f"{size:>9} {endpoint:<8} {concurrency:>5} {row['throughput_rps']:>8.0f} "
+                            f"{row['p50_ms']:>8.2f} {row['p99_ms']:>8.2f} {row['commands_per_request']:>9.2f} "
+                            f"{format_bytes(row['rss_bytes']):>6} {row['errors']:>7}"
+                        )
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "settings": {key: value for key, value in vars(args).items()
+                     if key not in ("output", "baseline", "save_baseline")},
+        "results": results,
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""Helpers shared by the RedisLens benchmarks.
+
+These start throwaway redis-server / uvicorn processes on free ports and drive
+HTTP load with httpx. They are development tools and are not installed with
+the package.
+"""
+
+import asyncio
+import contextlib
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import redis
+import redis.cluster
+
+from redislens.generator import DatasetGenerator, DatasetSpec
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - benchmark-only dependency
+    httpx = None
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    """Get a TCP port that is currently free on localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.05)
+    raise RuntimeError(f"Nothing listening on port {port} after {timeout}s")
+
+
+@contextlib.contextmanager
+def redis_server(port: Optional[int] = None, binary: str = "redis-server"):
+    """Run a persistence-less redis-server for the duration of the block."""
+    if shutil.which(binary) is None:
+        raise RuntimeError(f"{binary} not found on PATH")
+    port = port or free_port()
+    proc = subprocess.Popen(
+        [binary, "--port", str(port), "--save", "", "--appendonly", "no"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_port(port)
+        yield port
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+@contextlib.contextmanager
+def cluster_servers(nodes: int = 3, binary: str = "redis-server", cli: str = "redis-cli"):
+    """Run a local Redis Cluster of nodes primaries (no replicas) for the duration of the block.
+
+    Yields the ports of the nodes; any of them works as the seed for cluster mode.
+    """
+    for tool in (binary, cli):
+        if shutil.which(tool) is None:
+            raise RuntimeError(f"{tool} not found on PATH")
+    ports = [free_port() for _ in range(nodes)]
+    with tempfile.TemporaryDirectory(prefix="redislens-cluster-") as workdir:
+        procs = [
+            subprocess.Popen(
+                [
+                    binary, "--port", str(port),
+                    "--cluster-enabled", "yes",
+                    "--cluster-config-file", f"nodes-{port}.conf",
+                    "--save", "", "--appendonly", "no",
+                ],
+                cwd=workdir,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            for port in ports
+        ]
+        try:
+            for port in ports:
+                wait_for_port(port)
+            subprocess.run(
+                [cli, "--cluster", "create", *(f"127.0.0.1:{port}" for port in ports), "--cluster-yes"],
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+            # Slots are assigned asynchronously; wait until every node agrees the cluster is up
+            deadline = time.monotonic() + 30
+            while any(
+                redis.Redis(port=port).cluster("info").get("cluster_state") != "ok" for port in ports
+            ):
+                if time.monotonic() > deadline:
+                    raise RuntimeError("Redis Cluster did not come up within 30s")
+                time.sleep(0.1)
+            yield ports
+        finally:
+            for proc in procs:
+                proc.terminate()
+            for proc in procs:
+                proc.wait(timeout=10)
+
+
+@contextlib.contextmanager
+def api_server(app: str, port: Optional[int] = None, app_dir: str = ROOT_DIR, workers: int = 1):
+    """Run a uvicorn server for app ("module:attr") for the duration of the block."""
+    port = port or free_port()
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", app,
+            "--port", str(port),
+            "--app-dir", app_dir,
+            "--workers", str(workers),
+            "--log-level", "warning",
+        ],
+    )
+    try:
+        wait_for_port(port)
+        yield port, proc.pid
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of values (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run_load(
+    base_url: str,
+    make_request: Callable[[int], Dict[str, Any]],
+    concurrency: int,
+    total_requests: int,
+) -> Dict[str, Any]:
+    """Send total_requests requests with at most concurrency in flight.
+
+    make_request(i) returns the keyword arguments for httpx.AsyncClient.request.
+    """
+    if httpx is None:
+        raise RuntimeError("The benchmarks need httpx: pip install httpx")
+
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(total_requests))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        async def worker():
+            nonlocal errors
+            for i in counter:
+                started = time.perf_counter()
+                try:
+                    response = await client.request(**make_request(i))
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed_s": elapsed,
+        "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def seed_strings(port: int, count: int, prefix: str = "bench", batch: int = 10000):
+    """Fill the server with count small string keys using pipelined SET."""
+    client = redis.Redis(port=port)
+    for start in range(0, count, batch):
+        pipe = client.pipeline(transaction=False)
+        for i in range(start, min(start + batch, count)):
+            pipe.set(f"{prefix}:{i // 1000}:{i}", i)
+        pipe.execute()
+
+
+def seed_cluster_strings(port: int, count: int, prefix: str = "bench", batch: int = 10000):
+    """Fill a Redis Cluster through the seed node on port with count small string keys."""
+    client = redis.cluster.RedisCluster(port=port)
+    try:
+        for start in range(0, count, batch):
+            pipe = client.pipeline(transaction=False)
+            for i in range(start, min(start + batch, count)):
+                pipe.set(f"{prefix}:{i // 1000}:{i}", i)
+            pipe.execute()
+    finally:
+        client.close()
+
+
+def seed_dataset(port: int, keys: int, seed: int = 0, processes: Optional[int] = None) -> Dict[str, Any]:
+    """Flush the server and load keys keys of the default synthetic type mix (see redislens.generator)."""
+    generator = DatasetGenerator(DatasetSpec(keys=keys, seed=seed), port=port, processes=processes)
+    generator.flush()
+    return generator.run()
+
+
+def command_calls(client: redis.Redis) -> Dict[str, int]:
+    """Calls per command name from INFO commandstats."""
+    return {
+        name[len("cmdstat_"):]: stats["calls"]
+        for name, stats in client.info("commandstats").items()
+        if name.startswith("cmdstat_")
+    }
+
+
+def command_delta(before: Dict[str, int], after: Dict[str, int]) -> Dict[str, int]:
+    """Commands processed between two command_calls snapshots taken on the same connection.
+
+    The INFO issued by the first snapshot is counted in the second one and is
+    left out of the result.
+    """
+    delta = {name: calls - before.get(name, 0) for name, calls in after.items()}
+    delta["info"] = delta.get("info", 0) - 1
+    return {name: calls for name, calls in delta.items() if calls > 0}
+
+
+def process_rss(pid: int) -> Dict[str, Optional[int]]:
+    """Current and peak resident set size of a process in bytes (None where /proc is unavailable)."""
+    fields = {"VmRSS": None, "VmHWM": None}
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                name, _, value = line.partition(":")
+                if name in fields:
+                    fields[name] = int(value.split()[0]) * 1024
+    except OSError:
+        pass
+    return {"rss_bytes": fields["VmRSS"], "peak_rss_bytes": fields["VmHWM"]}
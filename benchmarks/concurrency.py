@@ -0,0 +1,95 @@
+"""Request concurrency of the async API compared with the old sync handlers.
+
+Starts a local redis-server, then runs the same endpoints twice:
+
+* ``sync``  - a FastAPI app with blocking ``def`` handlers on RedisClient, the
+  way redislens/api.py worked before the asyncio backend (each request holds a
+  threadpool worker for the whole Redis round trip);
+* ``async`` - the real ``redislens.api:app`` on AsyncRedisClient.
+
+Usage::
+
+    python benchmarks/concurrency.py --keys 100000 --concurrency 1 16 64 256
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+from fastapi import Depends, FastAPI
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import api_server, redis_server, run_load, seed_strings  # noqa: E402
+from redislens.api import RedisConnection  # noqa: E402
+from redislens.connection_pool import registry  # noqa: E402
+from redislens.redis_client import RedisClient  # noqa: E402
+
+# Blocking variant served by uvicorn as "benchmarks.concurrency:sync_app"
+sync_app = FastAPI()
+
+
+def get_sync_client(conn: RedisConnection = Depends()):
+    return RedisClient(connection_pool=registry.get_pool(conn.host, conn.port, conn.db, conn.password))
+
+
+@sync_app.post("/api/info")
+def sync_info(client: RedisClient = Depends(get_sync_client)):
+    return {"info": client.get_info()}
+
+
+@sync_app.post("/api/keys")
+def sync_keys(pattern: str = "*", cursor: str = "0", per_page: int = 50,
+              client: RedisClient = Depends(get_sync_client)):
+    return client.scan_keys_page(pattern, cursor=cursor, per_page=per_page)
+
+
+@sync_app.post("/api/key/{key}")
+def sync_key(key: str, client: RedisClient = Depends(get_sync_client)):
+    metadata = client.get_key_metadata(key)
+    return {"key": key, **metadata, **client.get_value_page(key, key_type=metadata["type"])}
+
+
+APPS = {
+    "sync": "benchmarks.concurrency:sync_app",
+    "async": "redislens.api:app",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=100000, help="Keys to seed (default: 100000)")
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per run (default: 5000)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64, 256])
+    parser.add_argument("--endpoint", choices=["info", "keys", "key"], default="keys")
+    args = parser.parse_args()
+
+    with redis_server() as redis_port:
+        seed_strings(redis_port, args.keys)
+        query = {"port": redis_port}
+        paths = {
+            "info": "/api/info",
+            "keys": "/api/keys",
+            "key": "/api/key/bench:0:0",
+        }
+
+        def make_request(i):
+            params = dict(query, cursor="0") if args.endpoint == "keys" else query
+            return {"method": "POST", "url": paths[args.endpoint], "params": params}
+
+        print(f"{'backend':<8} {'conc':>5} {'rps':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+        for name, app in APPS.items():
+            with api_server(app) as (api_port, _):
+                for concurrency in args.concurrency:
+                    result = asyncio.run(run_load(
+                        f"http://127.0.0.1:{api_port}", make_request, concurrency, args.requests
+                    ))
+                    print(
+                        f"{name:<8} {concurrency:>5} {result['throughput_rps']:>9.0f} "
+                        f"{result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} {result['errors']:>7}"
+                    )
+
+
+if __name__ == "__main__":
+    main()
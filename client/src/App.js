@@ -3,6 +3,8 @@ import Sidebar from './components/SideBar';
 import KeysView from './components/KeysView';
 import InfoView from './components/InfoView';
 import CommandView from './components/CommandView';
+import MemoryView from './components/MemoryView';
+import LatencyView from './components/LatencyView';
 import ToastMessage from './components/ToastMessage';
 import LoadingOverlay from './components/LoadingOverlay';
 import Header from './components/Header';
@@ -16,7 +18,8 @@ const App = () => {
     host: 'localhost',
     port: 6379,
     db: 0,
-    password: ''
+    password: '',
+    cluster: false
   });
   const [isLoading, setIsLoading] = useState(false);
   const [toast, setToast] = useState({ show: false, title: '', message: '', isError: false });
@@ -85,6 +88,8 @@ const App = () => {
       window.dispatchEvent(new CustomEvent('refreshInfo', { detail: { isConnected } }));
     } else if (activeView === 'command-view') {
       window.dispatchEvent(new CustomEvent('refreshCommand', { detail: { isConnected } }));
+    } else if (activeView === 'latency-view') {
+      window.dispatchEvent(new CustomEvent('refreshLatency', { detail: { isConnected } }));
     }
   };
 
@@ -168,6 +173,24 @@ const App = () => {
               theme={theme}
             />
           )}
+          {activeView === 'memory-view' && (
+            <MemoryView 
+              isConnected={isConnected}
+              connectionConfig={connectionConfig}
+              showToast={showToast}
+              setIsLoading={setIsLoading}
+              theme={theme}
+            />
+          )}
+          {activeView === 'latency-view' && (
+            <LatencyView 
+              isConnected={isConnected}
+              connectionConfig={connectionConfig}
+              showToast={showToast}
+              setIsLoading={setIsLoading}
+              theme={theme}
+            />
+          )}
         </main>
       </div>
 
@@ -4,9 +4,11 @@ const CommandView = ({ isConnected, connectionConfig, showToast, setIsLoading, t
   const [inputValue, setInputValue] = useState('');
   const [commandHistory, setCommandHistory] = useState([]);
   const [historyIndex, setHistoryIndex] = useState(-1);
+  const [useTransaction, setUseTransaction] = useState(false);
   const [terminalOutput, setTerminalOutput] = useState([
     { type: 'system', content: 'Redis Command Terminal - Type commands to interact with Redis server' },
-    { type: 'system', content: 'Type HELP for available commands or CLEAR to clear terminal' }
+    { type: 'system', content: 'Type HELP for available commands or CLEAR to clear terminal' },
+    { type: 'system', content: 'Paste several lines to run them as one pipelined batch' }
   ]);
   
   const terminalRef = useRef(null);
@@ -175,6 +177,67 @@ const CommandView = ({ isConnected, connectionConfig, showToast, setIsLoading, t
     }
   };
   
+  // Run a pasted multi-line script as one pipeline (MULTI/EXEC when the transaction toggle is on)
+  const executeScript = async (script) => {
+    const lines = script.split(/\r?\n/).map(line => line.trim()).filter(line => line);
+    if (!lines.length) return;
+    
+    setTerminalOutput(prev => [...prev, ...lines.map(line => ({ type: 'command', content: line }))]);
+    
+    if (!isConnected) {
+      setTerminalOutput(prev => [...prev, { 
+        type: 'error', 
+        content: 'Error: Not connected to Redis server. Please connect first.' 
+      }]);
+      return;
+    }
+    
+    try {
+      setIsLoading(true);
+      
+      const response = await fetch('/api/execute/batch', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+          ...connectionConfig,
+          commands: lines.map(parseCommand),
+          transaction: useTransaction
+        })
+      });
+      
+      const data = await response.json();
+      
+      if (response.ok) {
+        setTerminalOutput(prev => [
+          ...prev,
+          ...data.results.map((row, index) => (
+            row.error !== undefined
+              ? { type: 'error', content: `${lines[index]}: Error: ${row.error}` }
+              : { type: 'result', content: formatResult(row.result) }
+          )),
+          {
+            type: 'system',
+            content: `${data.count} commands${data.transaction ? ' (MULTI/EXEC)' : ''}, ${data.errors} errors in ${data.elapsed_ms} ms`
+          }
+        ]);
+      } else {
+        setTerminalOutput(prev => [...prev, { 
+          type: 'error', 
+          content: `Error: ${data.detail || 'Unknown error'}` 
+        }]);
+      }
+    } catch (error) {
+      setTerminalOutput(prev => [...prev, { 
+        type: 'error', 
+        content: `Error: ${error.message || 'Unknown error'}` 
+      }]);
+    } finally {
+      setIsLoading(false);
+    }
+  };
+  
   const parseCommand = (cmdStr) => {
     const parts = cmdStr.trim().split(/\s+/);
     if (parts.length === 0) return { command: '', args: [] };
@@ -246,7 +309,10 @@ const CommandView = ({ isConnected, connectionConfig, showToast, setIsLoading, t
       '',
       'Terminal Commands:',
       '  CLEAR                  - Clear terminal output',
-      '  HELP                   - Show this help message'
+      '  HELP                   - Show this help message',
+      '',
+      'Paste a multi-line script to send it as one pipeline; turn on',
+      'MULTI/EXEC in the toolbar to run it as a transaction.'
     ];
     
     setTerminalOutput(prev => [...prev, { 
@@ -259,6 +325,14 @@ const CommandView = ({ isConnected, connectionConfig, showToast, setIsLoading, t
     setInputValue(e.target.value);
   };
   
+  const handlePaste = (e) => {
+    const text = e.clipboardData.getData('text');
+    if (/\r?\n/.test(text.trim())) {
+      e.preventDefault();
+      executeScript(text);
+    }
+  };
+  
   const handleKeyDown = (e) => {
     // Handle up/down arrow for command history navigation
     if (e.key === 'ArrowUp') {
@@ -297,6 +371,17 @@ const CommandView = ({ isConnected, connectionConfig, showToast, setIsLoading, t
         </h1>
         
         <div className="flex gap-2">
+          <button
+            onClick={() => setUseTransaction(!useTransaction)}
+            className={`px-3 py-1.5 rounded text-sm flex items-center gap-1.5 transition-colors ${
+              useTransaction ? 'bg-cyan-600 hover:bg-cyan-700 text-white' : styles.button.default
+            }`}
+            title="Run pasted scripts atomically inside MULTI/EXEC"
+          >
+            <i className="fas fa-layer-group"></i>
+            MULTI/EXEC
+          </button>
+          
           <button
             onClick={() => {
               setTerminalOutput([
@@ -341,6 +426,7 @@ const CommandView = ({ isConnected, connectionConfig, showToast, setIsLoading, t
             value={inputValue}
             onChange={handleInputChange}
             onKeyDown={handleKeyDown}
+            onPaste={handlePaste}
             className={`flex-1 ${styles.terminal.input} border-none outline-none focus:ring-0`}
             placeholder="Type command here..."
             autoFocus
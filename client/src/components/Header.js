@@ -20,6 +20,8 @@ const Header = ({
       case 'keys-view': return 'Keys Explorer';
       case 'info-view': return 'Server Dashboard';
       case 'command-view': return 'Command Terminal';
+      case 'memory-view': return 'Memory Analysis';
+      case 'latency-view': return 'Latency';
       default: return 'Redis Explorer';
     }
   };
@@ -29,6 +31,8 @@ const Header = ({
       case 'keys-view': return 'database';
       case 'info-view': return 'chart-line';
       case 'command-view': return 'terminal';
+      case 'memory-view': return 'memory';
+      case 'latency-view': return 'stopwatch';
       default: return 'cube';
     }
   };
@@ -6,7 +6,7 @@ const InfoView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
   const [opsHistory, setOpsHistory] = useState([]);
   const [memoryHistory, setMemoryHistory] = useState([]);
   const [autoRefresh, setAutoRefresh] = useState(false);
-  const [refreshInterval, setRefreshInterval] = useState(null);
+  const eventSourceRef = useRef(null);
   const [refreshSpeed, setRefreshSpeed] = useState(3000); // 3 seconds
   const [selectedMetric, setSelectedMetric] = useState(null);
   const [showInfoPanel, setShowInfoPanel] = useState(false);
@@ -175,43 +175,40 @@ const InfoView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
 
     try {
       setIsLoading(true);
-      const response = await fetch('/api/info', {
+      // Served from the shared server-side sampler, so open tabs don't each run INFO
+      const response = await fetch('/api/metrics', {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
         },
-        body: JSON.stringify(connectionConfig)
+        body: JSON.stringify({
+          ...connectionConfig,
+          window: 300,
+          points: 60,
+          fields: 'ops_per_sec,used_memory,used_memory_rss'
+        })
       });
       
       const data = await response.json();
-      const infoData = data.info || {};
+      const infoData = data.latest || {};
       setInfo(infoData);
       
-      // Update operations history for chart
-      const timestamp = new Date().toLocaleTimeString([], { hour: '2-digit', minute: '2-digit', second: '2-digit' });
+      const series = data.series || {};
+      const formatTime = (seconds) => new Date(seconds * 1000).toLocaleTimeString([], { hour: '2-digit', minute: '2-digit', second: '2-digit' });
       
       // Update operations chart data
-      setOpsHistory(prev => {
-        const newHistory = [...prev, {
-          timestamp,
-          ops: parseInt(infoData.instantaneous_ops_per_sec || 0)
-        }];
-        
-        // Keep only the last 20 data points
-        return newHistory.slice(-20);
-      });
+      setOpsHistory((series.ops_per_sec || []).map(([time, value]) => ({
+        timestamp: formatTime(time),
+        ops: value
+      })));
       
-      // Update memory chart data
-      setMemoryHistory(prev => {
-        const newHistory = [...prev, {
-          timestamp,
-          used: parseFloat(convertToMB(infoData.used_memory || 0)),
-          rss: parseFloat(convertToMB(infoData.used_memory_rss || 0)),
-        }];
-        
-        // Keep only the last 20 data points
-        return newHistory.slice(-20);
-      });
+      // Update memory chart data (used and RSS share timestamps)
+      const rss = series.used_memory_rss || [];
+      setMemoryHistory((series.used_memory || []).map(([time, value], index) => ({
+        timestamp: formatTime(time),
+        used: parseFloat(convertToMB(value)),
+        rss: parseFloat(convertToMB(rss[index] ? rss[index][1] : 0)),
+      })));
     } catch (error) {
       showToast('Error', 'Failed to fetch server info.', true);
     } finally {
@@ -241,31 +238,76 @@ const InfoView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
     return uptime;
   };
   
+  // Live updates are pushed over server-sent events; the server merges
+  // whatever changed between events, so a slower refresh speed just means
+  // fewer, larger updates
+  const closeStream = () => {
+    if (eventSourceRef.current) {
+      eventSourceRef.current.close();
+      eventSourceRef.current = null;
+    }
+  };
+
+  const openStream = () => {
+    closeStream();
+    const params = new URLSearchParams({
+      host: connectionConfig.host,
+      port: connectionConfig.port,
+      db: connectionConfig.db,
+      min_interval: refreshSpeed / 1000
+    });
+    if (connectionConfig.password) {
+      params.set('password', connectionConfig.password);
+    }
+    if (connectionConfig.cluster) {
+      params.set('cluster', 'true');
+    }
+    
+    const source = new EventSource(`/api/stats/stream?${params.toString()}`);
+    source.onmessage = (event) => {
+      const update = JSON.parse(event.data);
+      setInfo(prev => ({ ...prev, ...update.info }));
+      if (!update.metrics) return;
+      
+      const timestamp = new Date(update.time * 1000).toLocaleTimeString([], { hour: '2-digit', minute: '2-digit', second: '2-digit' });
+      setOpsHistory(prev => [...prev, {
+        timestamp,
+        ops: update.metrics.ops_per_sec
+      }].slice(-60));
+      setMemoryHistory(prev => [...prev, {
+        timestamp,
+        used: parseFloat(convertToMB(update.metrics.used_memory)),
+        rss: parseFloat(convertToMB(update.metrics.used_memory_rss)),
+      }].slice(-60));
+    };
+    source.onerror = () => {
+      // EventSource reconnects by itself unless the server refused the stream
+      if (source.readyState === EventSource.CLOSED) {
+        closeStream();
+        setAutoRefresh(false);
+        showToast('Error', 'Live stats stream was closed.', true);
+      }
+    };
+    eventSourceRef.current = source;
+  };
+
   // Toggle auto-refresh
   const toggleAutoRefresh = () => {
     if (autoRefresh) {
       // Turn off auto-refresh
-      if (refreshInterval) {
-        clearInterval(refreshInterval);
-        setRefreshInterval(null);
-      }
+      closeStream();
       setAutoRefresh(false);
     } else {
       // Turn on auto-refresh
-      const interval = setInterval(fetchInfo, refreshSpeed);
-      setRefreshInterval(interval);
+      openStream();
       setAutoRefresh(true);
     }
   };
 
-  // Update refresh interval when speed changes
+  // Reopen the stream when the refresh speed changes
   useEffect(() => {
     if (autoRefresh) {
-      if (refreshInterval) {
-        clearInterval(refreshInterval);
-      }
-      const interval = setInterval(fetchInfo, refreshSpeed);
-      setRefreshInterval(interval);
+      openStream();
     }
   }, [refreshSpeed]);
   
@@ -305,12 +347,8 @@ const InfoView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
       fetchInfo();
     }
     
-    // Cleanup interval on unmount
-    return () => {
-      if (refreshInterval) {
-        clearInterval(refreshInterval);
-      }
-    };
+    // Close the live stream on unmount
+    return closeStream;
   }, [isConnected]);
 
   // Render value with formatting if applicable
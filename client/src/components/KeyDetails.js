@@ -7,6 +7,9 @@ const KeyDetails = ({ keyDetails, onDelete, connectionConfig, showToast, setIsLo
   const [editValue, setEditValue] = useState('');
   const [copyAnimations, setCopyAnimations] = useState({});
   const valueRef = useRef(null);
+  // Collections arrive one window at a time; these hold what has been loaded so far
+  const [loadedValue, setLoadedValue] = useState(null);
+  const [valueCursor, setValueCursor] = useState(null);
   
   // Set TTL value when keyDetails changes
   useEffect(() => {
@@ -15,6 +18,12 @@ const KeyDetails = ({ keyDetails, onDelete, connectionConfig, showToast, setIsLo
     }
   }, [keyDetails]);
   
+  // Reset the loaded window when a different key is shown
+  useEffect(() => {
+    setLoadedValue(keyDetails ? keyDetails.value : null);
+    setValueCursor(keyDetails ? keyDetails.cursor || null : null);
+  }, [keyDetails]);
+  
   // Auto-clear copy animations after a delay
   useEffect(() => {
     const timers = Object.keys(copyAnimations).map(key => {
@@ -213,6 +222,62 @@ const KeyDetails = ({ keyDetails, onDelete, connectionConfig, showToast, setIsLo
     }
   };
   
+  // Fetch the next window of a large collection and append it
+  const loadMoreValues = async () => {
+    if (!keyDetails || !valueCursor) return;
+    
+    try {
+      setIsLoading(true);
+      
+      const response = await fetch(`/api/key/${encodeURIComponent(keyDetails.key)}`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+          ...connectionConfig,
+          cursor: valueCursor
+        })
+      });
+      
+      const data = await response.json();
+      
+      if (response.ok) {
+        setLoadedValue(prev => keyDetails.type === 'hash'
+          ? { ...prev, ...data.value }
+          : [...(prev || []), ...(data.value || [])]
+        );
+        setValueCursor(data.cursor || null);
+      } else {
+        showToast('Error', data.detail || 'Failed to load more values.', true);
+      }
+    } catch (error) {
+      showToast('Error', 'An error occurred while loading more values.', true);
+    } finally {
+      setIsLoading(false);
+    }
+  };
+  
+  // Shown under collection values while more elements remain on the server
+  const renderLoadMore = () => {
+    if (!valueCursor || !loadedValue) return null;
+    const loadedCount = Array.isArray(loadedValue) ? loadedValue.length : Object.keys(loadedValue).length;
+    
+    return (
+      <div className={`flex items-center justify-between p-3 border-t ${styles.border}`}>
+        <span className={`text-sm ${styles.text.secondary}`}>
+          Showing {loadedCount} of {keyDetails.length} elements
+        </span>
+        <button
+          onClick={loadMoreValues}
+          className={`px-3 py-1.5 rounded text-sm ${styles.button.secondary}`}
+        >
+          Load more
+        </button>
+      </div>
+    );
+  };
+  
   // Delete key with confirmation
   const handleDelete = () => {
     if (keyDetails && keyDetails.key) {
@@ -292,7 +357,9 @@ const KeyDetails = ({ keyDetails, onDelete, connectionConfig, showToast, setIsLo
 
   const renderValue = () => {
     if (!keyDetails) return null;
-    const { type, value } = keyDetails;
+    const { type } = keyDetails;
+    const value = type === 'string' ? keyDetails.value : loadedValue;
+    if (value === null && type !== 'string') return null;
 
     if (type === 'string') {
       // Check if editing
@@ -404,6 +471,7 @@ const KeyDetails = ({ keyDetails, onDelete, connectionConfig, showToast, setIsLo
               })}
             </tbody>
           </table>
+          {renderLoadMore()}
         </div>
       );
     } else if (type === 'set') {
@@ -436,6 +504,7 @@ const KeyDetails = ({ keyDetails, onDelete, connectionConfig, showToast, setIsLo
               })}
             </tbody>
           </table>
+          {renderLoadMore()}
         </div>
       );
     } else if (type === 'zset') {
@@ -474,6 +543,7 @@ const KeyDetails = ({ keyDetails, onDelete, connectionConfig, showToast, setIsLo
               })}
             </tbody>
           </table>
+          {renderLoadMore()}
         </div>
       );
     } else if (type === 'hash') {
@@ -508,6 +578,7 @@ const KeyDetails = ({ keyDetails, onDelete, connectionConfig, showToast, setIsLo
               })}
             </tbody>
           </table>
+          {renderLoadMore()}
         </div>
       );
     } else {
@@ -619,7 +690,9 @@ const KeyDetails = ({ keyDetails, onDelete, connectionConfig, showToast, setIsLo
   
   const renderActions = () => {
     if (!keyDetails) return null;
-    const { key, type, value } = keyDetails;
+    const { key, type } = keyDetails;
+    // Exports cover the elements loaded so far
+    const value = type === 'string' ? keyDetails.value : loadedValue;
     
     // IDs for copy animations
     const exportJsonId = 'export-json';
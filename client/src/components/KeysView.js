@@ -8,17 +8,21 @@ const KeysView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
   const [selectedKeys, setSelectedKeys] = useState(new Set());
   const [selectAll, setSelectAll] = useState(false);
   const [keyDetails, setKeyDetails] = useState(null);
+  const [keysMetadata, setKeysMetadata] = useState({}); // key -> type, ttl, encoding, length, memory
   const [viewMode, setViewMode] = useState('list'); // 'list' or 'grid'
   const [sortBy, setSortBy] = useState('name'); // 'name', 'type'
   const [sortDir, setSortDir] = useState('asc'); // 'asc', 'desc'
   const [searchDebounce, setSearchDebounce] = useState(null);
   const searchInputRef = useRef(null);
+  const importInputRef = useRef(null);
   
   // Pagination states
   const [currentPage, setCurrentPage] = useState(1);
   const [keysPerPage, setKeysPerPage] = useState(50);
   const [totalKeys, setTotalKeys] = useState(0);
-  const [totalPages, setTotalPages] = useState(0);
+  // Cursor tokens that start each page we have visited, and the token for the next page
+  const [pageCursors, setPageCursors] = useState(["0"]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [isInitialLoad, setIsInitialLoad] = useState(true);
 
   // Theme-dependent styles
@@ -79,35 +83,84 @@ const KeysView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
     }
   };
 
-  const fetchKeys = async (pattern = "*", page = 1, perPage = keysPerPage) => {
-    if (!isConnected) {
-      showToast("Not Connected", "Please connect to Redis server first.", true);
-      return;
+  // The API reads connection settings and paging options from the query string, not the body
+  const connectionParams = (extra = {}) => {
+    const params = new URLSearchParams({
+      host: connectionConfig.host,
+      port: connectionConfig.port,
+      db: connectionConfig.db,
+      ...extra
+    });
+    if (connectionConfig.password) {
+      params.set('password', connectionConfig.password);
+    }
+    if (connectionConfig.cluster) {
+      params.set('cluster', 'true');
     }
+    return params.toString();
+  };
 
+  // Type, TTL and size for the visible page in one batched request
+  const fetchKeysMetadata = async (pageKeys) => {
+    if (pageKeys.length === 0) {
+      setKeysMetadata({});
+      return;
+    }
+    
     try {
-      setIsLoading(true);
-      
-      const response = await fetch('/api/keys', {
+      const response = await fetch(`/api/keys/metadata?${connectionParams()}`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
         },
         body: JSON.stringify({
-          ...connectionConfig,
-          pattern,
-          page,
-          per_page: perPage
+          keys: pageKeys
         })
       });
       
       const data = await response.json();
+      const metadata = {};
+      (data.keys || []).forEach((row) => {
+        metadata[row.key] = row;
+      });
+      setKeysMetadata(metadata);
+    } catch (error) {
+      // Types are optional decoration; the key list is still usable without them
+      setKeysMetadata({});
+    }
+  };
+
+  const fetchKeys = async (pattern = "*", page = 1, perPage = keysPerPage, cursor = "0") => {
+    if (!isConnected) {
+      showToast("Not Connected", "Please connect to Redis server first.", true);
+      return;
+    }
+
+    try {
+      setIsLoading(true);
+      
+      const query = connectionParams({ pattern, cursor, per_page: perPage });
+      const response = await fetch(`/api/keys?${query}`, {
+        method: 'POST'
+      });
+      
+      const data = await response.json();
+      if (!response.ok) {
+        showToast("Error", data.detail || "Failed to fetch keys.", true);
+        return;
+      }
       
       // Set the keys from the server response
       setKeys(data.keys || []);
-      setTotalKeys(data.total || 0);
-      setTotalPages(data.total_pages || 0);
-      setCurrentPage(data.page || 1);
+      fetchKeysMetadata(data.keys || []);
+      setTotalKeys(data.total ?? null);
+      setNextCursor(data.cursor || null);
+      setCurrentPage(page);
+      setPageCursors((prev) => {
+        const cursors = prev.slice(0, page);
+        cursors[page - 1] = cursor;
+        return cursors;
+      });
       
       // Update selected keys to remove any that are no longer present
       const newSelectedKeys = new Set(
@@ -130,12 +183,18 @@ const KeysView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
     }
   };
 
+  // Cursor that starts a page: visited pages are remembered, the next one comes from the server
+  const cursorForPage = (pageNumber) => {
+    if (pageNumber === currentPage + 1) return nextCursor;
+    return pageCursors[pageNumber - 1] || null;
+  };
+
   // Function to load a specific page of keys
   const loadPage = (pageNumber) => {
-    if (pageNumber < 1 || pageNumber > totalPages) return;
+    const cursor = cursorForPage(pageNumber);
+    if (pageNumber < 1 || cursor === null) return;
     
-    setCurrentPage(pageNumber);
-    fetchKeys(pattern, pageNumber, keysPerPage);
+    fetchKeys(pattern, pageNumber, keysPerPage, cursor);
     scrollToTop();
   };
   
@@ -214,7 +273,7 @@ const KeysView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
 
       if (data.status === "ok") {
         showToast("Success", `Key '${key}' was deleted successfully.`);
-        fetchKeys(pattern, currentPage, keysPerPage);
+        fetchKeys(pattern, currentPage, keysPerPage, cursorForPage(currentPage) || "0");
         if (selectedKey === key) {
           setSelectedKey(null);
           setKeyDetails(null);
@@ -274,7 +333,7 @@ const KeysView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
           "Success",
           `Deleted ${data.deleted_count} of ${data.total_count} keys.`
         );
-        fetchKeys(pattern, currentPage, keysPerPage);
+        fetchKeys(pattern, currentPage, keysPerPage, cursorForPage(currentPage) || "0");
         setSelectedKeys(new Set());
         setSelectAll(false);
         if (selectedKey && keysToDelete.includes(selectedKey)) {
@@ -299,6 +358,68 @@ const KeysView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
     }
   };
 
+  const exportKeys = async () => {
+    try {
+      setIsLoading(true);
+      const response = await fetch(`/api/export?${connectionParams({ pattern: pattern || '*' })}`, {
+        method: 'POST'
+      });
+      if (!response.ok) {
+        const data = await response.json();
+        showToast("Error", data.detail || "Failed to export keys.", true);
+        return;
+      }
+      const blob = await response.blob();
+      const url = URL.createObjectURL(blob);
+      const link = document.createElement('a');
+      link.href = url;
+      link.download = `redislens-db${connectionConfig.db}.rldump.gz`;
+      link.click();
+      URL.revokeObjectURL(url);
+    } catch (error) {
+      showToast("Error", "An error occurred while exporting keys.", true);
+    } finally {
+      setIsLoading(false);
+    }
+  };
+
+  const importKeys = async (e) => {
+    const file = e.target.files[0];
+    e.target.value = '';
+    if (!file) return;
+
+    const replace = window.confirm(
+      `Import ${file.name}? Press OK to overwrite existing keys or Cancel to keep them.`
+    );
+    try {
+      setIsLoading(true);
+      const response = await fetch(`/api/import?${connectionParams({ replace })}`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/octet-stream',
+        },
+        body: file
+      });
+      const data = await response.json();
+      if (!response.ok) {
+        showToast("Error", data.detail || "Failed to import keys.", true);
+        return;
+      }
+      showToast(
+        data.failed > 0 ? "Import Finished With Errors" : "Success",
+        `Restored ${data.restored} of ${data.records} keys` +
+          (data.existing > 0 ? `, kept ${data.existing} existing` : '') +
+          (data.failed > 0 ? `, ${data.failed} failed: ${data.errors.map((row) => row.error).join(", ")}` : ''),
+        data.failed > 0
+      );
+      fetchKeys(pattern, 1, keysPerPage);
+    } catch (error) {
+      showToast("Error", "An error occurred while importing keys.", true);
+    } finally {
+      setIsLoading(false);
+    }
+  };
+
   const handleCheckboxChange = (key) => {
     const newSelectedKeys = new Set(selectedKeys);
     if (newSelectedKeys.has(key)) {
@@ -343,7 +464,14 @@ const KeysView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
           : b.localeCompare(a);
       }
       
-      // For sorting by other properties, we need key details
+      if (sortBy === 'type') {
+        const typeA = keyType(a) || '';
+        const typeB = keyType(b) || '';
+        return sortDir === 'asc' 
+          ? typeA.localeCompare(typeB) 
+          : typeB.localeCompare(typeA);
+      }
+      
       return 0;
     });
   };
@@ -356,11 +484,11 @@ const KeysView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
       
       if (detail.hasOwnProperty('isConnected')) {
         if (detail.isConnected) {
-          fetchKeys(pattern, currentPage, keysPerPage);
+          fetchKeys(pattern, currentPage, keysPerPage, cursorForPage(currentPage) || "0");
         }
       } else if (isConnected) {
         // Fallback to the prop if event doesn't have the detail
-        fetchKeys(pattern, currentPage, keysPerPage);
+        fetchKeys(pattern, currentPage, keysPerPage, cursorForPage(currentPage) || "0");
       }
     };
     
@@ -369,7 +497,7 @@ const KeysView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
     return () => {
       window.removeEventListener('refreshKeys', handleRefresh);
     };
-  }, [pattern, currentPage, keysPerPage, isConnected]);
+  }, [pattern, currentPage, pageCursors, keysPerPage, isConnected]);
 
   // When keys per page changes, reset to page 1
   useEffect(() => {
@@ -388,7 +516,7 @@ const KeysView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
   // When connection status changes, refresh data
   useEffect(() => {
     if (isConnected) {
-      fetchKeys(pattern, currentPage, keysPerPage);
+      fetchKeys(pattern, currentPage, keysPerPage, cursorForPage(currentPage) || "0");
     }
   }, [isConnected]);
 
@@ -415,13 +543,16 @@ const KeysView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
   };
 
   const keyType = (key) => {
+    if (keysMetadata[key] && keysMetadata[key].type) return keysMetadata[key].type;
     return keyDetails && keyDetails.key === key ? keyDetails.type : null;
   };
 
   // Render pagination controls
   const renderPagination = () => {
-    if (totalPages <= 1) return null;
+    const hasNext = nextCursor !== null;
+    if (currentPage === 1 && !hasNext) return null;
     
+    // Only pages we have already visited (plus the next one) can be jumped to
     const pageNumbers = [];
     
     // Add first page
@@ -433,27 +564,28 @@ const KeysView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
     }
     
     // Add pages around current page
-    for (let i = Math.max(2, currentPage - 1); i <= Math.min(totalPages - 1, currentPage + 1); i++) {
+    for (let i = Math.max(2, currentPage - 1); i <= currentPage + (hasNext ? 1 : 0); i++) {
       pageNumbers.push(i);
     }
     
-    // Add ellipsis if needed
-    if (currentPage < totalPages - 2) {
+    // More pages may follow the next one
+    if (hasNext) {
       pageNumbers.push('...');
     }
     
-    // Add last page if there are multiple pages
-    if (totalPages > 1) {
-      pageNumbers.push(totalPages);
-    }
+    const firstIndex = keys.length > 0 ? (currentPage - 1) * keysPerPage + 1 : 0;
     
     return (
       <div className={`flex items-center justify-between p-3 ${styles.panel} border-t ${styles.border}`}>
         <div className="flex items-center">
           <p className={`text-sm ${styles.text.secondary}`}>
-            <span className={styles.text.primary}>{keys.length > 0 ? (currentPage - 1) * keysPerPage + 1 : 0}</span> to{' '}
-            <span className={styles.text.primary}>{Math.min(currentPage * keysPerPage, totalKeys)}</span>{' '}
-            of <span className={styles.text.primary}>{totalKeys}</span> keys
+            <span className={styles.text.primary}>{firstIndex}</span> to{' '}
+            <span className={styles.text.primary}>{firstIndex + Math.max(keys.length - 1, 0)}</span>
+            {totalKeys !== null && (
+              <>
+                {' '}of <span className={styles.text.primary}>{totalKeys}</span> keys
+              </>
+            )}
           </p>
           
           <div className="flex items-center ml-6">
@@ -505,9 +637,9 @@ const KeysView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
             
             <button
               onClick={() => loadPage(currentPage + 1)}
-              disabled={currentPage === totalPages || totalPages === 0}
+              disabled={!hasNext}
               className={`relative inline-flex items-center px-2 py-2 rounded-r-md border text-sm font-medium ${
-                currentPage === totalPages || totalPages === 0
+                !hasNext
                   ? styles.pagination.disabled
                   : styles.pagination.item
               }`}
@@ -824,20 +956,41 @@ const KeysView = ({ isConnected, connectionConfig, showToast, setIsLoading, them
               </div>
               
               <div className={`text-sm ${styles.text.secondary}`}>
-                {totalKeys} keys
+                {totalKeys !== null ? `${totalKeys} keys` : `${keys.length}${nextCursor ? '+' : ''} keys`}
               </div>
             </div>
             
             {/* Bulk Actions */}
-            {selectedKeys.size > 0 && (
-              <button
-                onClick={deleteSelectedKeys}
-                className={`px-3 py-1.5 rounded-lg text-sm flex items-center gap-1.5 ${styles.button.danger}`}
-              >
-                <i className="fas fa-trash"></i>
-                Delete ({selectedKeys.size})
-              </button>
-            )}
+            <div className="flex items-center space-x-2">
+              {selectedKeys.size > 0 && (
+                <button
+                  onClick={deleteSelectedKeys}
+                  className={`px-3 py-1.5 rounded-lg text-sm flex items-center gap-1.5 ${styles.button.danger}`}
+                >
+                  <i className="fas fa-trash"></i>
+                  Delete ({selectedKeys.size})
+                </button>
+              )}
+              {!connectionConfig.cluster && (
+                <>
+                  <button
+                    onClick={exportKeys}
+                    className={`px-2.5 py-1.5 rounded-lg text-sm ${styles.button.secondary}`}
+                    title="Export keys matching the pattern"
+                  >
+                    <i className="fas fa-download"></i>
+                  </button>
+                  <button
+                    onClick={() => importInputRef.current.click()}
+                    className={`px-2.5 py-1.5 rounded-lg text-sm ${styles.button.secondary}`}
+                    title="Import a dump file"
+                  >
+                    <i className="fas fa-upload"></i>
+                  </button>
+                  <input ref={importInputRef} type="file" onChange={importKeys} className="hidden" />
+                </>
+              )}
+            </div>
           </div>
         </div>
         
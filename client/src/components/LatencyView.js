@@ -0,0 +1,237 @@
+import React, { useState, useEffect, useRef } from 'react';
+
+const LatencyView = ({ isConnected, connectionConfig, showToast, setIsLoading, theme }) => {
+  const [windowSeconds, setWindowSeconds] = useState(3600);
+  const [report, setReport] = useState(null);
+  const refreshRef = useRef(null);
+
+  const isDark = theme === 'dark';
+
+  // Theme-dependent styles
+  const styles = {
+    container: isDark ? 'bg-gray-900 text-gray-200' : 'bg-gray-50 text-gray-800',
+    panel: isDark ? 'bg-gray-800 border-gray-700' : 'bg-white border-gray-200',
+    border: isDark ? 'border-gray-700' : 'border-gray-200',
+    text: {
+      primary: isDark ? 'text-white' : 'text-gray-900',
+      secondary: isDark ? 'text-gray-400' : 'text-gray-500',
+      accent: isDark ? 'text-blue-400' : 'text-blue-600',
+    },
+    input: `${isDark ? 'bg-gray-800 border-gray-700 text-gray-200' : 'bg-white border-gray-300 text-gray-800'} focus:border-blue-500 focus:ring-blue-500`,
+    button: {
+      primary: 'bg-blue-600 hover:bg-blue-700 text-white',
+    },
+    table: {
+      header: isDark ? 'bg-gray-900/50 text-gray-400' : 'bg-gray-50 text-gray-500',
+      row: isDark ? 'hover:bg-gray-700/50' : 'hover:bg-gray-50',
+    },
+    bar: isDark ? 'bg-red-500/60' : 'bg-red-400/60',
+  };
+
+  const formatMicros = (us) => {
+    if (!us) return '0 µs';
+    if (us < 1000) return `${us} µs`;
+    if (us < 1000000) return `${(us / 1000).toFixed(2)} ms`;
+    return `${(us / 1000000).toFixed(2)} s`;
+  };
+
+  const fetchLatency = async (showSpinner = false) => {
+    if (!isConnected) return;
+    try {
+      if (showSpinner) setIsLoading(true);
+      const response = await fetch('/api/latency', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+          ...connectionConfig,
+          window: windowSeconds
+        })
+      });
+      const data = await response.json();
+      if (!response.ok) {
+        showToast('Error', data.detail || 'Failed to fetch latency data.', true);
+        return;
+      }
+      setReport(data);
+    } catch (error) {
+      showToast('Error', 'An error occurred while fetching latency data.', true);
+    } finally {
+      if (showSpinner) setIsLoading(false);
+    }
+  };
+
+  // The server samples every interval seconds, so polling faster gains nothing
+  useEffect(() => {
+    fetchLatency(true);
+    refreshRef.current = setInterval(() => fetchLatency(), 10000);
+    return () => clearInterval(refreshRef.current);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [isConnected, windowSeconds]);
+
+  // Handle refresh event from Header
+  useEffect(() => {
+    const handleRefresh = () => fetchLatency(true);
+    window.addEventListener('refreshLatency', handleRefresh);
+    return () => window.removeEventListener('refreshLatency', handleRefresh);
+  });
+
+  const renderGroupTable = (title, groups, nameOf) => {
+    if (!groups || groups.length === 0) return null;
+    const maxTotal = Math.max(...groups.map((group) => group.total_us), 1);
+
+    return (
+      <div className={`rounded-lg border ${styles.panel} overflow-hidden`}>
+        <div className={`px-4 py-3 border-b ${styles.border} font-medium ${styles.text.primary}`}>{title}</div>
+        <table className="min-w-full text-sm">
+          <thead className={styles.table.header}>
+            <tr>
+              <th className="py-2 px-4 text-left text-xs font-medium uppercase tracking-wider">Name</th>
+              <th className="py-2 px-4 text-right text-xs font-medium uppercase tracking-wider w-20">Count</th>
+              <th className="py-2 px-4 text-right text-xs font-medium uppercase tracking-wider w-24">p50</th>
+              <th className="py-2 px-4 text-right text-xs font-medium uppercase tracking-wider w-24">p99</th>
+              <th className="py-2 px-4 text-right text-xs font-medium uppercase tracking-wider w-24">Max</th>
+              <th className="py-2 px-4 w-1/4"></th>
+            </tr>
+          </thead>
+          <tbody>
+            {groups.map((group) => (
+              <tr key={nameOf(group)} className={styles.table.row}>
+                <td className={`py-2 px-4 font-mono break-all ${styles.text.primary}`}>{nameOf(group)}</td>
+                <td className={`py-2 px-4 text-right ${styles.text.secondary}`}>{group.count.toLocaleString()}</td>
+                <td className={`py-2 px-4 text-right ${styles.text.secondary}`}>{formatMicros(group.p50_us)}</td>
+                <td className={`py-2 px-4 text-right ${styles.text.accent}`}>{formatMicros(group.p99_us)}</td>
+                <td className={`py-2 px-4 text-right ${styles.text.secondary}`}>{formatMicros(group.max_us)}</td>
+                <td className="py-2 px-4">
+                  <div className={`h-2 rounded ${styles.bar}`} style={{ width: `${(group.total_us / maxTotal) * 100}%` }}></div>
+                </td>
+              </tr>
+            ))}
+          </tbody>
+        </table>
+      </div>
+    );
+  };
+
+  const slowlog = report && report.slowlog;
+  const events = report ? Object.entries(report.events) : [];
+
+  return (
+    <div className={`h-full overflow-auto p-6 space-y-6 ${styles.container}`}>
+      <div className={`rounded-lg border ${styles.panel} p-4 flex flex-wrap items-end gap-4`}>
+        <div>
+          <label className={`block text-xs uppercase mb-1 ${styles.text.secondary}`}>Window</label>
+          <select
+            value={windowSeconds}
+            onChange={(e) => setWindowSeconds(Number(e.target.value))}
+            className={`px-3 py-1.5 rounded border text-sm ${styles.input}`}
+          >
+            <option value={900}>Last 15 minutes</option>
+            <option value={3600}>Last hour</option>
+            <option value={21600}>Last 6 hours</option>
+          </select>
+        </div>
+        <button onClick={() => fetchLatency(true)} className={`px-4 py-1.5 rounded text-sm ${styles.button.primary}`}>
+          Refresh
+        </button>
+        {report && (
+          <div className={`text-sm ${styles.text.secondary}`}>
+            {slowlog.stored.toLocaleString()} slowlog entries collected, sampled every {report.interval}s
+            {report.error && <span className="text-red-500"> &middot; {report.error}</span>}
+          </div>
+        )}
+      </div>
+
+      {slowlog && (
+        <>
+          <div className={`rounded-lg border ${styles.panel} p-4 flex gap-8`}>
+            <div>
+              <div className={`text-xs uppercase ${styles.text.secondary}`}>Slow commands</div>
+              <div className={`text-2xl font-semibold ${styles.text.primary}`}>{slowlog.entries.toLocaleString()}</div>
+            </div>
+            <div>
+              <div className={`text-xs uppercase ${styles.text.secondary}`}>p50</div>
+              <div className={`text-2xl font-semibold ${styles.text.primary}`}>{formatMicros(slowlog.overall.p50_us)}</div>
+            </div>
+            <div>
+              <div className={`text-xs uppercase ${styles.text.secondary}`}>p99</div>
+              <div className={`text-2xl font-semibold ${styles.text.primary}`}>{formatMicros(slowlog.overall.p99_us)}</div>
+            </div>
+            <div>
+              <div className={`text-xs uppercase ${styles.text.secondary}`}>Total time</div>
+              <div className={`text-2xl font-semibold ${styles.text.primary}`}>{formatMicros(slowlog.overall.total_us)}</div>
+            </div>
+          </div>
+          <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+            {renderGroupTable('By command', slowlog.by_command, (group) => group.command)}
+            {renderGroupTable('By key pattern', slowlog.by_pattern,
+              (group) => `${group.command} ${group.key_pattern || ''}`.trim())}
+          </div>
+        </>
+      )}
+
+      {report && (
+        <div className={`rounded-lg border ${styles.panel} overflow-hidden`}>
+          <div className={`px-4 py-3 border-b ${styles.border} font-medium ${styles.text.primary}`}>Latency monitor events</div>
+          {!report.latency_monitor ? (
+            <div className={`px-4 py-3 text-sm ${styles.text.secondary}`}>LATENCY is not available on this server.</div>
+          ) : events.length === 0 ? (
+            <div className={`px-4 py-3 text-sm ${styles.text.secondary}`}>
+              No events recorded. The latency monitor only records events when latency-monitor-threshold is set.
+            </div>
+          ) : (
+            <table className="min-w-full text-sm">
+              <thead className={styles.table.header}>
+                <tr>
+                  <th className="py-2 px-4 text-left text-xs font-medium uppercase tracking-wider">Event</th>
+                  <th className="py-2 px-4 text-right text-xs font-medium uppercase tracking-wider">Spikes</th>
+                  <th className="py-2 px-4 text-right text-xs font-medium uppercase tracking-wider">Latest</th>
+                  <th className="py-2 px-4 text-right text-xs font-medium uppercase tracking-wider">p99</th>
+                  <th className="py-2 px-4 text-right text-xs font-medium uppercase tracking-wider">All-time max</th>
+                </tr>
+              </thead>
+              <tbody>
+                {events.map(([name, event]) => (
+                  <tr key={name} className={styles.table.row}>
+                    <td className={`py-2 px-4 font-mono ${styles.text.primary}`}>{name}</td>
+                    <td className={`py-2 px-4 text-right ${styles.text.secondary}`}>{event.spikes}</td>
+                    <td className={`py-2 px-4 text-right ${styles.text.secondary}`}>{event.latest_ms} ms</td>
+                    <td className={`py-2 px-4 text-right ${styles.text.accent}`}>{event.p99_ms} ms</td>
+                    <td className={`py-2 px-4 text-right ${styles.text.secondary}`}>{event.max_ms} ms</td>
+                  </tr>
+                ))}
+              </tbody>
+            </table>
+          )}
+        </div>
+      )}
+
+      {slowlog && slowlog.recent.length > 0 && (
+        <div className={`rounded-lg border ${styles.panel} overflow-hidden`}>
+          <div className={`px-4 py-3 border-b ${styles.border} font-medium ${styles.text.primary}`}>Recent slow commands</div>
+          <table className="min-w-full text-sm">
+            <thead className={styles.table.header}>
+              <tr>
+                <th className="py-2 px-4 text-left text-xs font-medium uppercase tracking-wider w-44">Time</th>
+                <th className="py-2 px-4 text-right text-xs font-medium uppercase tracking-wider w-28">Duration</th>
+                <th className="py-2 px-4 text-left text-xs font-medium uppercase tracking-wider">Command</th>
+              </tr>
+            </thead>
+            <tbody>
+              {slowlog.recent.map((entry) => (
+                <tr key={`${entry.id}-${entry.start_time}`} className={styles.table.row}>
+                  <td className={`py-2 px-4 ${styles.text.secondary}`}>{new Date(entry.start_time * 1000).toLocaleString()}</td>
+                  <td className={`py-2 px-4 text-right ${styles.text.accent}`}>{formatMicros(entry.duration_us)}</td>
+                  <td className={`py-2 px-4 font-mono break-all ${styles.text.primary}`}>{entry.args}</td>
+                </tr>
+              ))}
+            </tbody>
+          </table>
+        </div>
+      )}
+    </div>
+  );
+};
+
+export default LatencyView;
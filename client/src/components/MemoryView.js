@@ -0,0 +1,322 @@
+import React, { useState, useEffect, useRef } from 'react';
+
+const MemoryView = ({ isConnected, connectionConfig, showToast, setIsLoading, theme }) => {
+  const [pattern, setPattern] = useState('*');
+  const [sampleRate, setSampleRate] = useState(1);
+  const [prefixDepth, setPrefixDepth] = useState(1);
+  const [job, setJob] = useState(null);
+  const [loadedReport, setLoadedReport] = useState(null);
+  const pollRef = useRef(null);
+  const fileInputRef = useRef(null);
+
+  const isDark = theme === 'dark';
+
+  // Theme-dependent styles
+  const styles = {
+    container: isDark ? 'bg-gray-900 text-gray-200' : 'bg-gray-50 text-gray-800',
+    panel: isDark ? 'bg-gray-800 border-gray-700' : 'bg-white border-gray-200',
+    border: isDark ? 'border-gray-700' : 'border-gray-200',
+    text: {
+      primary: isDark ? 'text-white' : 'text-gray-900',
+      secondary: isDark ? 'text-gray-400' : 'text-gray-500',
+      accent: isDark ? 'text-blue-400' : 'text-blue-600',
+    },
+    input: `${isDark ? 'bg-gray-800 border-gray-700 text-gray-200' : 'bg-white border-gray-300 text-gray-800'} focus:border-blue-500 focus:ring-blue-500`,
+    button: {
+      primary: 'bg-blue-600 hover:bg-blue-700 text-white',
+      secondary: isDark ? 'bg-gray-700 hover:bg-gray-600 text-gray-200' : 'bg-gray-100 hover:bg-gray-200 text-gray-700',
+    },
+    table: {
+      header: isDark ? 'bg-gray-900/50 text-gray-400' : 'bg-gray-50 text-gray-500',
+      row: isDark ? 'hover:bg-gray-700/50' : 'hover:bg-gray-50',
+    },
+    bar: isDark ? 'bg-blue-500/60' : 'bg-blue-400/60',
+  };
+
+  const formatBytes = (bytes, decimals = 2) => {
+    if (!bytes) return '0 Bytes';
+    const k = 1024;
+    const sizes = ['Bytes', 'KB', 'MB', 'GB', 'TB'];
+    const i = Math.floor(Math.log(bytes) / Math.log(k));
+    return parseFloat((bytes / Math.pow(k, i)).toFixed(decimals)) + ' ' + sizes[i];
+  };
+
+  const stopPolling = () => {
+    if (pollRef.current) {
+      clearInterval(pollRef.current);
+      pollRef.current = null;
+    }
+  };
+
+  const pollJob = async (jobId) => {
+    try {
+      const response = await fetch(`/api/jobs/${jobId}`, { method: 'POST' });
+      const data = await response.json();
+      setJob(data);
+      if (data.status !== 'running' && data.status !== 'pending') {
+        stopPolling();
+        if (data.status === 'failed') {
+          showToast('Analysis Failed', data.error || 'Memory analysis failed.', true);
+        }
+      }
+    } catch (error) {
+      stopPolling();
+      showToast('Error', 'Lost track of the analysis job.', true);
+    }
+  };
+
+  const startAnalysis = async () => {
+    if (!isConnected) {
+      showToast('Not Connected', 'Please connect to Redis server first.', true);
+      return;
+    }
+
+    try {
+      setIsLoading(true);
+      stopPolling();
+
+      const response = await fetch('/api/analysis/memory', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+          ...connectionConfig,
+          pattern,
+          sample_rate: sampleRate,
+          prefix_depth: prefixDepth
+        })
+      });
+
+      const data = await response.json();
+      if (!response.ok) {
+        showToast('Error', data.detail || 'Failed to start memory analysis.', true);
+        return;
+      }
+      setLoadedReport(null);
+      setJob(data);
+      pollRef.current = setInterval(() => pollJob(data.id), 1000);
+    } catch (error) {
+      showToast('Error', 'An error occurred while starting the analysis.', true);
+    } finally {
+      setIsLoading(false);
+    }
+  };
+
+  // Reports written by `redislens rdb` have the same shape as live ones
+  const loadReport = (e) => {
+    const file = e.target.files[0];
+    e.target.value = '';
+    if (!file) return;
+    const reader = new FileReader();
+    reader.onload = () => {
+      try {
+        const data = JSON.parse(reader.result);
+        if (!data.totals || !data.by_prefix) {
+          throw new Error('not a memory report');
+        }
+        stopPolling();
+        setJob(null);
+        setLoadedReport({ ...data, fileName: file.name });
+      } catch (error) {
+        showToast('Error', `${file.name} is not a RedisLens memory report.`, true);
+      }
+    };
+    reader.readAsText(file);
+  };
+
+  const cancelAnalysis = async () => {
+    if (!job) return;
+    await fetch(`/api/jobs/${job.id}/cancel`, { method: 'POST' });
+    pollJob(job.id);
+  };
+
+  // Stop polling when the view is closed
+  useEffect(() => stopPolling, []);
+
+  const renderGroupTable = (title, groups) => {
+    if (!groups || groups.length === 0) return null;
+    const maxBytes = Math.max(...groups.map((group) => group.estimated_bytes), 1);
+
+    return (
+      <div className={`rounded-lg border ${styles.panel} overflow-hidden`}>
+        <div className={`px-4 py-3 border-b ${styles.border} font-medium ${styles.text.primary}`}>{title}</div>
+        <table className="min-w-full text-sm">
+          <thead className={styles.table.header}>
+            <tr>
+              <th className="py-2 px-4 text-left text-xs font-medium uppercase tracking-wider">Name</th>
+              <th className="py-2 px-4 text-right text-xs font-medium uppercase tracking-wider w-28">Keys</th>
+              <th className="py-2 px-4 text-right text-xs font-medium uppercase tracking-wider w-32">Memory</th>
+              <th className="py-2 px-4 w-1/3"></th>
+            </tr>
+          </thead>
+          <tbody>
+            {groups.map((group) => (
+              <tr key={group.name} className={styles.table.row}>
+                <td className={`py-2 px-4 font-mono break-all ${styles.text.primary}`}>{group.name}</td>
+                <td className={`py-2 px-4 text-right ${styles.text.secondary}`}>{group.estimated_keys.toLocaleString()}</td>
+                <td className={`py-2 px-4 text-right ${styles.text.accent}`}>{formatBytes(group.estimated_bytes)}</td>
+                <td className="py-2 px-4">
+                  <div className={`h-2 rounded ${styles.bar}`} style={{ width: `${(group.estimated_bytes / maxBytes) * 100}%` }}></div>
+                </td>
+              </tr>
+            ))}
+          </tbody>
+        </table>
+      </div>
+    );
+  };
+
+  const isRunning = job && (job.status === 'running' || job.status === 'pending');
+  const report = loadedReport || (job && job.result);
+  const biggestKeys = report && report.by_memory
+    ? Object.entries(report.by_memory)
+      .flatMap(([type, keys]) => keys.map((item) => ({ ...item, type })))
+      .sort((a, b) => b.value - a.value)
+      .slice(0, 20)
+    : [];
+  const progress = (job && job.progress) || {};
+
+  return (
+    <div className={`h-full overflow-auto p-6 space-y-6 ${styles.container}`}>
+      {/* Analysis options */}
+      <div className={`rounded-lg border ${styles.panel} p-4 flex flex-wrap items-end gap-4`}>
+        <div>
+          <label className={`block text-xs uppercase mb-1 ${styles.text.secondary}`}>Pattern</label>
+          <input
+            type="text"
+            value={pattern}
+            onChange={(e) => setPattern(e.target.value)}
+            className={`px-3 py-1.5 rounded border text-sm ${styles.input}`}
+          />
+        </div>
+        <div>
+          <label className={`block text-xs uppercase mb-1 ${styles.text.secondary}`}>Sample rate</label>
+          <select
+            value={sampleRate}
+            onChange={(e) => setSampleRate(Number(e.target.value))}
+            className={`px-3 py-1.5 rounded border text-sm ${styles.input}`}
+          >
+            <option value={1}>100%</option>
+            <option value={0.1}>10%</option>
+            <option value={0.01}>1%</option>
+            <option value={0.001}>0.1%</option>
+          </select>
+        </div>
+        <div>
+          <label className={`block text-xs uppercase mb-1 ${styles.text.secondary}`}>Prefix depth</label>
+          <select
+            value={prefixDepth}
+            onChange={(e) => setPrefixDepth(Number(e.target.value))}
+            className={`px-3 py-1.5 rounded border text-sm ${styles.input}`}
+          >
+            <option value={1}>1</option>
+            <option value={2}>2</option>
+            <option value={3}>3</option>
+          </select>
+        </div>
+        {isRunning ? (
+          <button onClick={cancelAnalysis} className={`px-4 py-1.5 rounded text-sm ${styles.button.secondary}`}>
+            Cancel
+          </button>
+        ) : (
+          <button onClick={startAnalysis} className={`px-4 py-1.5 rounded text-sm ${styles.button.primary}`}>
+            Analyze
+          </button>
+        )}
+        <button
+          onClick={() => fileInputRef.current.click()}
+          className={`px-4 py-1.5 rounded text-sm ${styles.button.secondary}`}
+        >
+          Load report
+        </button>
+        <input ref={fileInputRef} type="file" accept=".json,application/json" onChange={loadReport} className="hidden" />
+        {loadedReport && (
+          <div className={`text-sm ${styles.text.secondary}`}>
+            {loadedReport.fileName}
+            {loadedReport.source === 'rdb' && ` \u00b7 RDB v${loadedReport.rdb_version}, ${formatBytes(loadedReport.totals.file_bytes)} on disk`}
+          </div>
+        )}
+        {job && (
+          <div className={`text-sm ${styles.text.secondary}`}>
+            {job.status} &middot; {(progress.scanned || 0).toLocaleString()} keys scanned,{' '}
+            {(progress.sampled || 0).toLocaleString()} sampled in {progress.elapsed_s || 0}s
+          </div>
+        )}
+      </div>
+
+      {report && (
+        <>
+          <div className={`rounded-lg border ${styles.panel} p-4 flex gap-8`}>
+            <div>
+              <div className={`text-xs uppercase ${styles.text.secondary}`}>Estimated keys</div>
+              <div className={`text-2xl font-semibold ${styles.text.primary}`}>{report.totals.estimated_keys.toLocaleString()}</div>
+            </div>
+            <div>
+              <div className={`text-xs uppercase ${styles.text.secondary}`}>Estimated memory</div>
+              <div className={`text-2xl font-semibold ${styles.text.primary}`}>{formatBytes(report.totals.estimated_bytes)}</div>
+            </div>
+            <div>
+              <div className={`text-xs uppercase ${styles.text.secondary}`}>Prefixes</div>
+              <div className={`text-2xl font-semibold ${styles.text.primary}`}>{report.prefix_count.toLocaleString()}</div>
+            </div>
+          </div>
+          {renderGroupTable('By prefix', report.by_prefix)}
+          <div className="grid grid-cols-1 lg:grid-cols-3 gap-6">
+            {renderGroupTable('By type', report.by_type)}
+            {renderGroupTable('By encoding', report.by_encoding)}
+            {renderGroupTable('By TTL', report.by_ttl)}
+          </div>
+          {report.databases && report.databases.length > 0 && (
+            <div className={`rounded-lg border ${styles.panel} overflow-hidden`}>
+              <div className={`px-4 py-3 border-b ${styles.border} font-medium ${styles.text.primary}`}>Databases</div>
+              <table className="min-w-full text-sm">
+                <thead className={styles.table.header}>
+                  <tr>
+                    <th className="py-2 px-4 text-left text-xs font-medium uppercase tracking-wider">Database</th>
+                    <th className="py-2 px-4 text-right text-xs font-medium uppercase tracking-wider">Keys</th>
+                    <th className="py-2 px-4 text-right text-xs font-medium uppercase tracking-wider">Expiring</th>
+                  </tr>
+                </thead>
+                <tbody>
+                  {report.databases.map((db) => (
+                    <tr key={db.db} className={styles.table.row}>
+                      <td className={`py-2 px-4 font-mono ${styles.text.primary}`}>db{db.db}</td>
+                      <td className={`py-2 px-4 text-right ${styles.text.secondary}`}>{db.keys.toLocaleString()}</td>
+                      <td className={`py-2 px-4 text-right ${styles.text.secondary}`}>{db.expires.toLocaleString()}</td>
+                    </tr>
+                  ))}
+                </tbody>
+              </table>
+            </div>
+          )}
+          {biggestKeys.length > 0 && (
+            <div className={`rounded-lg border ${styles.panel} overflow-hidden`}>
+              <div className={`px-4 py-3 border-b ${styles.border} font-medium ${styles.text.primary}`}>Biggest keys</div>
+              <table className="min-w-full text-sm">
+                <thead className={styles.table.header}>
+                  <tr>
+                    <th className="py-2 px-4 text-left text-xs font-medium uppercase tracking-wider">Key</th>
+                    <th className="py-2 px-4 text-left text-xs font-medium uppercase tracking-wider w-28">Type</th>
+                    <th className="py-2 px-4 text-right text-xs font-medium uppercase tracking-wider w-32">Memory</th>
+                  </tr>
+                </thead>
+                <tbody>
+                  {biggestKeys.map((item) => (
+                    <tr key={`${item.type}-${item.key}`} className={styles.table.row}>
+                      <td className={`py-2 px-4 font-mono break-all ${styles.text.primary}`}>{item.key}</td>
+                      <td className={`py-2 px-4 ${styles.text.secondary}`}>{item.type}</td>
+                      <td className={`py-2 px-4 text-right ${styles.text.accent}`}>{formatBytes(item.value)}</td>
+                    </tr>
+                  ))}
+                </tbody>
+              </table>
+            </div>
+          )}
+        </>
+      )}
+    </div>
+  );
+};
+
+export default MemoryView;
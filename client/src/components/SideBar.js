@@ -16,10 +16,10 @@ const Sidebar = ({
   const [showConnectionForm, setShowConnectionForm] = useState(false);
 
   const handleInputChange = (e) => {
-    const { name, value } = e.target;
+    const { name, value, type, checked } = e.target;
     setFormData({
       ...formData,
-      [name]: name === 'port' || name === 'db' ? parseInt(value) : value
+      [name]: type === 'checkbox' ? checked : name === 'port' || name === 'db' ? parseInt(value) : value
     });
   };
 
@@ -70,6 +70,16 @@ const Sidebar = ({
       id: 'command-view',
       label: 'Command Terminal',
       icon: 'terminal'
+    },
+    {
+      id: 'memory-view',
+      label: 'Memory Analysis',
+      icon: 'memory'
+    },
+    {
+      id: 'latency-view',
+      label: 'Latency',
+      icon: 'stopwatch'
     }
   ];
 
@@ -204,6 +214,17 @@ const Sidebar = ({
               />
             </div>
 
+            <label className={`flex items-center text-xs font-medium ${styles.navItem}`}>
+              <input
+                type="checkbox"
+                name="cluster"
+                checked={!!formData.cluster}
+                onChange={handleInputChange}
+                className="mr-2"
+              />
+              Cluster mode (host is any cluster node)
+            </label>
+
             <button
               onClick={testConnection}
               className={`w-full py-2 px-4 rounded ${styles.button} transition-colors`}
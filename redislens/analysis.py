@@ -0,0 +1,341 @@
+import abc
+import heapq
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .redis_client import RedisClient, parse_keys_info, queue_keys_info
+
+# Prefix buckets beyond this many are folded into OTHER_PREFIX to bound memory
+DEFAULT_MAX_PREFIXES = 10000
+OTHER_PREFIX = "(other)"
+NO_PREFIX = "(no prefix)"
+
+# Upper bounds (seconds) of the TTL buckets, in order
+TTL_BUCKETS = [
+    (60, "< 1 minute"),
+    (3600, "< 1 hour"),
+    (86400, "< 1 day"),
+    (7 * 86400, "< 1 week"),
+]
+
+
+def key_prefix(key: str, separator: str = ":", depth: int = 1) -> str:
+    """Get the first depth segments of key, or NO_PREFIX if it has no separator."""
+    parts = key.split(separator, depth)
+    if len(parts) == 1:
+        return NO_PREFIX
+    return separator.join(parts[:depth])
+
+
+def ttl_bucket(ttl: Optional[int]) -> str:
+    """Name of the TTL bucket for a TTL in seconds (-1 means no expiry)."""
+    if ttl is None or ttl < 0:
+        return "no expiry"
+    for limit, name in TTL_BUCKETS:
+        if ttl < limit:
+            return name
+    return ">= 1 week"
+
+
+class _Aggregate:
+    """Key count and byte totals for one group."""
+
+    __slots__ = ("keys", "bytes")
+
+    def __init__(self):
+        self.keys = 0
+        self.bytes = 0
+
+    def add(self, size: int):
+        self.keys += 1
+        self.bytes += size
+
+
+class _KeyspaceScan(abc.ABC):
+    """SCAN the keyspace batch by batch with sampling, throttling and job progress.
+
+    Subclasses implement _process_batch and report; keys are never accumulated.
+    SCAN runs on the adaptive engine (see redis_client.ScanState), so
+    batches can be larger than batch_size; they are processed batch_size
+    keys at a time. time_budget stops the walk early with a partial report.
+    """
+
+    def __init__(
+        self,
+        client: RedisClient,
+        pattern: str = "*",
+        sample_rate: float = 1.0,
+        batch_size: int = 500,
+        max_keys_per_second: Optional[float] = None,
+        time_budget: Optional[float] = None,
+    ):
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1]")
+        self.client = client
+        self.pattern = pattern
+        self.sample_rate = sample_rate
+        self.batch_size = batch_size
+        self.max_keys_per_second = max_keys_per_second
+        self.scan = client.new_scan(pattern, count=batch_size, time_budget=time_budget)
+
+        self.scanned = 0
+        self.sampled = 0
+        self.elapsed = 0.0
+
+    @abc.abstractmethod
+    def _process_batch(self, keys: List[str]):
+        """Inspect one batch of at most batch_size (sampled) keys."""
+
+    def run(self, job=None) -> Dict[str, Any]:
+        """Scan the keyspace and return the report.
+
+        When a jobs.Job is given, progress is published on it after every batch
+        and the scan stops early if the job is cancelled.
+        """
+        started = time.monotonic()
+        for batch in self.client.iter_scan(self.scan):
+            self.scanned += len(batch)
+            if self.sample_rate < 1:
+                batch = [key for key in batch if random.random() < self.sample_rate]
+            for start in range(0, len(batch), self.batch_size):
+                self._process_batch(batch[start:start + self.batch_size])
+
+            self.elapsed = time.monotonic() - started
+            if self.max_keys_per_second:
+                min_elapsed = self.scanned / self.max_keys_per_second
+                if self.elapsed < min_elapsed:
+                    time.sleep(min_elapsed - self.elapsed)
+                    self.elapsed = min_elapsed
+            if job is not None:
+                job.progress = self.progress()
+                if job.cancelled:
+                    break
+        self.elapsed = time.monotonic() - started
+        return self.report()
+
+    def progress(self) -> Dict[str, Any]:
+        return {
+            "scanned": self.scanned,
+            "sampled": self.sampled,
+            "elapsed_s": round(self.elapsed, 3),
+            "keys_per_second": round(self.scanned / self.elapsed, 1) if self.elapsed else 0.0,
+            "complete": self.scan.complete,
+        }
+
+    @abc.abstractmethod
+    def report(self) -> Dict[str, Any]:
+        """Build the (possibly partial) result from what was scanned so far."""
+
+
+class MemoryBreakdown:
+    """Key and byte totals of metadata rows grouped by prefix, type, encoding and TTL bucket.
+
+    Only the aggregates are kept, never the keys themselves, so the footprint
+    depends on max_prefixes rather than on the number of rows recorded.
+    """
+
+    def __init__(self, separator: str = ":", prefix_depth: int = 1, max_prefixes: int = DEFAULT_MAX_PREFIXES):
+        self.separator = separator
+        self.prefix_depth = prefix_depth
+        self.max_prefixes = max_prefixes
+
+        self.keys = 0
+        self.bytes = 0
+        self.by_prefix: Dict[str, _Aggregate] = {}
+        self.by_type: Dict[str, _Aggregate] = {}
+        self.by_encoding: Dict[str, _Aggregate] = {}
+        self.by_ttl: Dict[str, _Aggregate] = {}
+
+    def _add(self, groups: Dict[str, _Aggregate], name: str, size: int):
+        aggregate = groups.get(name)
+        if aggregate is None:
+            aggregate = groups[name] = _Aggregate()
+        aggregate.add(size)
+
+    def record(self, row: Dict[str, Any]):
+        """Add one get_keys_metadata-style row (key, type, encoding, ttl, memory_usage)."""
+        size = row["memory_usage"] or 0
+        self.keys += 1
+        self.bytes += size
+
+        prefix = key_prefix(row["key"], self.separator, self.prefix_depth)
+        if prefix not in self.by_prefix and len(self.by_prefix) >= self.max_prefixes:
+            prefix = OTHER_PREFIX
+        self._add(self.by_prefix, prefix, size)
+        self._add(self.by_type, row["type"], size)
+        self._add(self.by_encoding, row["encoding"] or "unknown", size)
+        self._add(self.by_ttl, ttl_bucket(row["ttl"]), size)
+
+    def _groups(self, groups: Dict[str, _Aggregate], scale: float, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        ordered = sorted(groups.items(), key=lambda item: item[1].bytes, reverse=True)
+        if limit is not None:
+            ordered = ordered[:limit]
+        return [
+            {
+                "name": name,
+                "keys": aggregate.keys,
+                "bytes": aggregate.bytes,
+                "estimated_keys": int(aggregate.keys * scale),
+                "estimated_bytes": int(aggregate.bytes * scale),
+            }
+            for name, aggregate in ordered
+        ]
+
+    def report(self, top: Optional[int] = None, scale: float = 1.0) -> Dict[str, Any]:
+        """Groups sorted by bytes, with estimates multiplied by scale (1 / sample rate)."""
+        return {
+            "by_prefix": self._groups(self.by_prefix, scale, top),
+            "prefix_count": len(self.by_prefix),
+            "by_type": self._groups(self.by_type, scale),
+            "by_encoding": self._groups(self.by_encoding, scale),
+            "by_ttl": self._groups(self.by_ttl, scale),
+        }
+
+
+class KeyspaceMemoryAnalyzer(_KeyspaceScan):
+    """Aggregate memory usage of (a sample of) the keyspace by prefix, type, encoding and TTL.
+
+    Aggregation is done by a MemoryBreakdown, so the footprint depends on
+    max_prefixes rather than on the size of the database.
+    """
+
+    def __init__(
+        self,
+        client: RedisClient,
+        pattern: str = "*",
+        sample_rate: float = 1.0,
+        batch_size: int = 500,
+        separator: str = ":",
+        prefix_depth: int = 1,
+        max_prefixes: int = DEFAULT_MAX_PREFIXES,
+        max_keys_per_second: Optional[float] = None,
+        top: int = 100,
+        time_budget: Optional[float] = None,
+    ):
+        super().__init__(client, pattern, sample_rate, batch_size, max_keys_per_second, time_budget)
+        self.top = top
+        self.breakdown = MemoryBreakdown(separator, prefix_depth, max_prefixes)
+
+    @property
+    def sampled_bytes(self) -> int:
+        return self.breakdown.bytes
+
+    def _process_batch(self, keys: List[str]):
+        pipe = self.client.redis_client.pipeline(transaction=False)
+        queue_keys_info(pipe, keys)
+        for row in parse_keys_info(keys, pipe.execute(raise_on_error=False)):
+            # Keys can expire or be deleted between SCAN and the pipeline
+            if row["exists"]:
+                self.sampled += 1
+                self.breakdown.record(row)
+
+    def progress(self) -> Dict[str, Any]:
+        return {**super().progress(), "sampled_bytes": self.sampled_bytes}
+
+    def report(self) -> Dict[str, Any]:
+        """Build the result: totals plus groups sorted by bytes (estimates scaled by the sample rate)."""
+        scale = 1 / self.sample_rate
+        return {
+            "pattern": self.pattern,
+            "sample_rate": self.sample_rate,
+            "totals": {
+                **self.progress(),
+                "estimated_keys": int(self.sampled * scale),
+                "estimated_bytes": int(self.sampled_bytes * scale),
+            },
+            **self.breakdown.report(self.top, scale),
+        }
+
+
+class _TopK:
+    """Bounded min-heap keeping the k largest (value, key) pairs seen."""
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[Tuple[int, str]] = []
+
+    def push(self, value: int, key: str):
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, (value, key))
+        elif value > self._heap[0][0]:
+            heapq.heapreplace(self._heap, (value, key))
+
+    def items(self) -> List[Dict[str, Any]]:
+        return [{"key": key, "value": value} for value, key in sorted(self._heap, reverse=True)]
+
+
+class BigKeyDetector(_KeyspaceScan):
+    """Track the largest keys per type (by element count and by memory) and optionally the hottest keys.
+
+    Hot-key mode reads OBJECT FREQ, which only works when maxmemory-policy is
+    one of the LFU policies. Memory use is O(top_k) per type whatever the
+    keyspace size.
+    """
+
+    def __init__(
+        self,
+        client: RedisClient,
+        pattern: str = "*",
+        top_k: int = 20,
+        sample_rate: float = 1.0,
+        batch_size: int = 500,
+        max_keys_per_second: Optional[float] = None,
+        hot_keys: bool = False,
+        time_budget: Optional[float] = None,
+    ):
+        super().__init__(client, pattern, sample_rate, batch_size, max_keys_per_second, time_budget)
+        if top_k < 1:
+            raise ValueError("top_k must be positive")
+        self.top_k = top_k
+        self.hot_keys = hot_keys
+        self.by_length: Dict[str, _TopK] = {}
+        self.by_memory: Dict[str, _TopK] = {}
+        self.hottest = _TopK(top_k)
+
+    def _check_lfu(self):
+        policy = self.client.get_info().get("maxmemory_policy", "")
+        if "lfu" not in policy:
+            raise ValueError(
+                f"Hot key detection needs an LFU maxmemory-policy (current: {policy or 'unknown'})"
+            )
+
+    def _top(self, groups: Dict[str, _TopK], key_type: str) -> _TopK:
+        top = groups.get(key_type)
+        if top is None:
+            top = groups[key_type] = _TopK(self.top_k)
+        return top
+
+    def _process_batch(self, keys: List[str]):
+        for row in self.client.get_keys_metadata(keys, chunk_size=self.batch_size):
+            if not row["exists"]:
+                continue
+            self.sampled += 1
+            if row["length"] is not None:
+                self._top(self.by_length, row["type"]).push(row["length"], row["key"])
+            if row["memory_usage"] is not None:
+                self._top(self.by_memory, row["type"]).push(row["memory_usage"], row["key"])
+
+        if self.hot_keys:
+            pipe = self.client.redis_client.pipeline(transaction=False)
+            for key in keys:
+                pipe.object("freq", key)
+            for key, freq in zip(keys, pipe.execute(raise_on_error=False)):
+                if not isinstance(freq, Exception) and freq is not None:
+                    self.hottest.push(freq, key)
+
+    def run(self, job=None) -> Dict[str, Any]:
+        if self.hot_keys:
+            self._check_lfu()
+        return super().run(job)
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "pattern": self.pattern,
+            "sample_rate": self.sample_rate,
+            "top_k": self.top_k,
+            "totals": self.progress(),
+            "by_length": {key_type: top.items() for key_type, top in self.by_length.items()},
+            "by_memory": {key_type: top.items() for key_type, top in self.by_memory.items()},
+            "hot_keys": self.hottest.items() if self.hot_keys else None,
+        }
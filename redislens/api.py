@@ -1,15 +1,31 @@
 from fastapi import FastAPI, HTTPException, Query, Depends, Request, Response, Body
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, ContextManager, Dict, Hashable, List, Optional, Union
 from pydantic import BaseModel
+from contextlib import ExitStack, asynccontextmanager, nullcontext
 import os
 import json
+import asyncio
 import math
+import time
+
+import redis
 
 # Use relative import for RedisClient
-from .redis_client import RedisClient
+from .redis_client import DEFAULT_PAGE_BUDGET, DEFAULT_SEARCH_BUDGET, MAX_VALUE_PAGE, RedisClient, build_scan_page
+from .async_redis_client import AsyncRedisClient
+from .cluster_client import AsyncClusterClient, ClusterClient, async_cluster_registry, cluster_registry
+from .connection_pool import AsyncConnectionRegistry, ConnectionRegistry, PoolKey, registry, async_registry
+from .jobs import Job, JobLimitError, jobs
+from .analysis import BigKeyDetector, KeyspaceMemoryAnalyzer
+from .diff import DEFAULT_BUCKET_BITS, DEFAULT_MAX_REPORT, KeyspaceDiff
+from .metrics import SERIES, collector
+from .latency import latency_collector
+from .transfer import DEFAULT_TRANSFER_BATCH, DumpFormatError, KeyspaceExporter, async_import_dump
+from .cache import KeySnapshot, info_cache, key_snapshots
+from .key_index import decode_index_token, encode_index_token, is_index_token, key_indexes
 
 # Update paths to work with package structure
 package_dir = os.path.dirname(os.path.abspath(__file__))
@@ -17,7 +33,30 @@ client_build_dir = os.path.join(package_dir, "static")
 static_dir = os.path.join(client_build_dir, "static")
 assets_dir = os.path.join(client_build_dir, "assets")
 
-app = FastAPI(title="Redis Explorer API", description="API for exploring Redis server")
+# Seconds between keep-alive comments on otherwise idle event streams
+STATS_KEEPALIVE_SECONDS = 15
+# Most random keys /api/keyspace inspects per database
+MAX_KEYSPACE_SAMPLE = 10000
+# Most commands one /api/execute/batch request may pipeline
+MAX_BATCH_COMMANDS = 10000
+# Most keys one /api/keys page may hold
+MAX_PAGE_SIZE = 1000
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Health checks and idle pool eviction run in the background, not per request
+    registry.start()
+    async_registry.start()
+    yield
+    await key_indexes.stop_all()
+    await collector.stop()
+    await latency_collector.stop()
+    await async_registry.stop()
+    registry.stop()
+    await async_cluster_registry.close()
+    cluster_registry.close()
+
+app = FastAPI(title="Redis Explorer API", description="API for exploring Redis server", lifespan=lifespan)
 
 # Add CORS middleware for development
 app.add_middleware(
@@ -76,26 +115,100 @@ class RedisConnection(BaseModel):
     port: int = 6379
     db: int = 0
     password: Optional[str] = None
+    # Treat host:port as a seed node of a Redis Cluster and work across all its shards
+    cluster: bool = False
+
+class RedisTarget(BaseModel):
+    """The other side of a keyspace diff."""
+    host: str = "localhost"
+    port: int = 6379
+    db: int = 0
+    password: Optional[str] = None
 
 class RedisCommand(BaseModel):
     command: str
     args: List[str] = []
 
+class RedisCommandBatch(BaseModel):
+    commands: List[RedisCommand]
+    # Wrap the batch in MULTI/EXEC so it runs atomically
+    transaction: bool = False
+
 class PaginationParams(BaseModel):
     page: int = 1
     per_page: int = 50
     pattern: str = "*"
 
-def get_redis_client(conn: RedisConnection = Depends()):
-    client = RedisClient(
-        host=conn.host,
-        port=conn.port,
-        db=conn.db,
-        password=conn.password
-    )
-    if not client.ping():
+async def ndjson_stream(rows):
+    """Serialize an async iterator of dicts as newline-delimited JSON.
+
+    Errors raised after the response has started are reported as a final
+    {"error": ...} line since the status code has already been sent.
+    """
+    try:
+        async for row in rows:
+            yield json.dumps(row) + "\n"
+    except Exception as e:
+        yield json.dumps({"error": str(e)}) + "\n"
+
+def connection_key(conn: RedisConnection) -> Hashable:
+    """Cache key for a connection; a cluster sees every shard, so it never shares entries with a node."""
+    key = PoolKey(conn.host, conn.port, conn.db, conn.password)
+    return ("cluster", key) if conn.cluster else key
+
+async def check_connection(conn: RedisConnection):
+    if conn.cluster:
+        if conn.db != 0:
+            raise HTTPException(status_code=400, detail="Redis Cluster only has database 0")
+        try:
+            await async_cluster_registry.get(conn.host, conn.port, conn.password)
+        except Exception:
+            raise HTTPException(status_code=500, detail="Could not connect to Redis cluster")
+    elif not await async_registry.is_healthy(conn.host, conn.port, conn.db, conn.password):
+        raise HTTPException(status_code=500, detail="Could not connect to Redis server")
+
+async def get_redis_client(conn: RedisConnection = Depends()):
+    await check_connection(conn)
+    if conn.cluster:
+        return AsyncClusterClient(await async_cluster_registry.get(conn.host, conn.port, conn.password))
+    pool = async_registry.get_pool(conn.host, conn.port, conn.db, conn.password)
+    return AsyncRedisClient(connection_pool=pool)
+
+def get_sync_redis_client(conn: RedisConnection = Depends()):
+    """Blocking client for work that runs on background job threads."""
+    if conn.cluster:
+        if conn.db != 0:
+            raise HTTPException(status_code=400, detail="Redis Cluster only has database 0")
+        try:
+            return ClusterClient(cluster_registry.get(conn.host, conn.port, conn.password))
+        except Exception:
+            raise HTTPException(status_code=500, detail="Could not connect to Redis cluster")
+    if not registry.is_healthy(conn.host, conn.port, conn.db, conn.password):
         raise HTTPException(status_code=500, detail="Could not connect to Redis server")
-    return client
+    pool = registry.get_pool(conn.host, conn.port, conn.db, conn.password)
+    return RedisClient(connection_pool=pool)
+
+def holding_pool(pools: Union[ConnectionRegistry, AsyncConnectionRegistry], conn: RedisConnection) -> ContextManager:
+    """Keep conn's pool from being evicted while a job or stream runs (cluster clients never are)."""
+    if conn.cluster:
+        return nullcontext()
+    return pools.hold(conn.host, conn.port, conn.db, conn.password)
+
+def holding_pools(target: Callable[[Job], Any], *connections: RedisConnection) -> Callable[[Job], Any]:
+    """Wrap a job target so the sync pools of connections are held until it finishes."""
+    def run(job: Job):
+        with ExitStack() as stack:
+            for conn in connections:
+                stack.enter_context(holding_pool(registry, conn))
+            return target(job)
+    return run
+
+def submit_job(kind: str, target: Callable[[Job], Any], params: Dict[str, Any]) -> Job:
+    """Start a background job, answering 429 while the maximum number of jobs are running."""
+    try:
+        return jobs.submit(kind, target, params)
+    except JobLimitError as e:
+        raise HTTPException(status_code=429, detail=str(e))
 
 @app.get("/", response_class=FileResponse)
 async def get_index():
@@ -106,6 +219,46 @@ async def get_index():
     else:
         raise HTTPException(status_code=404, detail="Client build not found.")
 
+# Server-sent events need GET (EventSource), so this is defined BEFORE the catch-all route
+@app.get("/api/stats/stream")
+async def stream_stats(
+    request: Request,
+    min_interval: float = 0,
+    conn: RedisConnection = Depends()
+):
+    """Push INFO changes for a connection as server-sent events.
+
+    The first event carries the full INFO reply, later ones only the fields
+    that changed plus the latest metrics point. All subscribers share the
+    connection's sampler, so Redis sees one INFO per interval however many
+    tabs are open. min_interval throttles a subscriber; updates it misses
+    meanwhile are merged into the next event.
+    """
+    await check_connection(conn)
+    
+    sampler = await collector.get_sampler(conn.host, conn.port, conn.db, conn.password, conn.cluster)
+    subscription = sampler.subscribe()
+    
+    async def events():
+        try:
+            while not await request.is_disconnected():
+                update = await subscription.get(timeout=STATS_KEEPALIVE_SECONDS)
+                if update is None:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"data: {json.dumps(update)}\n\n"
+                if min_interval > 0:
+                    await asyncio.sleep(min_interval)
+        finally:
+            sampler.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/{catch_all:path}", response_class=FileResponse)
 async def catch_all(catch_all: str):
     """Serve the main UI page for any non-API route for client-side routing."""
@@ -119,124 +272,703 @@ async def catch_all(catch_all: str):
         raise HTTPException(status_code=404, detail="Client build not found.")
 
 @app.post("/api/ping")
-def ping(conn: RedisConnection):
-    client = RedisClient(
-        host=conn.host,
-        port=conn.port,
-        db=conn.db,
-        password=conn.password
-    )
-    if client.ping():
+async def ping(conn: RedisConnection):
+    # An explicit ping always goes to the server rather than the cached health state
+    if conn.cluster:
+        await check_connection(conn)
+        client = AsyncClusterClient(await async_cluster_registry.get(conn.host, conn.port, conn.password))
+        if await client.ping():
+            return {"status": "ok", "message": "Connected to Redis cluster"}
+        raise HTTPException(status_code=500, detail="Could not connect to Redis cluster")
+    # Recorded on the pool, so the other endpoints agree with the answer right away
+    if await async_registry.check(conn.host, conn.port, conn.db, conn.password):
         return {"status": "ok", "message": "Connected to Redis server"}
     raise HTTPException(status_code=500, detail="Could not connect to Redis server")
 
 @app.post("/api/info")
-def get_info(client: RedisClient = Depends(get_redis_client)):
+async def get_info(conn: RedisConnection = Depends(), client: AsyncRedisClient = Depends(get_redis_client)):
     try:
-        return {"info": client.get_info()}
+        info = info_cache.get(connection_key(conn))
+        if info is None:
+            info = await client.get_info()
+            info_cache.set(connection_key(conn), info)
+        return {"info": info}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching Redis info: {str(e)}")
 
+@app.post("/api/keyspace")
+async def get_keyspace_overview(
+    sample: int = 0,
+    conn: RedisConnection = Depends(),
+    client: AsyncRedisClient = Depends(get_redis_client)
+):
+    """Key counts, expiring-key ratio and average TTL of every populated database.
+
+    INFO keyspace covers all databases in one call, whichever db the connection
+    selects. With sample > 0, that many random keys of each database are also
+    inspected (types, TTLs, memory), all databases in parallel over their pools.
+    """
+    if not 0 <= sample <= MAX_KEYSPACE_SAMPLE:
+        raise HTTPException(status_code=400, detail=f"sample must be between 0 and {MAX_KEYSPACE_SAMPLE}")
+    try:
+        databases = await client.get_keyspace()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching keyspace: {str(e)}")
+    
+    async def sample_database(database: Dict[str, Any]):
+        if conn.cluster:
+            db_client = client
+        else:
+            pool = async_registry.get_pool(conn.host, conn.port, database["db"], conn.password)
+            db_client = AsyncRedisClient(connection_pool=pool)
+        try:
+            summary = await db_client.sample_keyspace(sample)
+        except Exception as e:
+            database["sample"] = {"error": str(e)}
+            return
+        average = summary["avg_memory_bytes"]
+        summary["estimated_bytes"] = int(average * database["keys"]) if average is not None else None
+        database["sample"] = summary
+    
+    if sample:
+        await asyncio.gather(*(sample_database(database) for database in databases))
+    total_keys = sum(database["keys"] for database in databases)
+    total_expires = sum(database["expires"] for database in databases)
+    return {
+        "databases": databases,
+        "populated": len(databases),
+        "total_keys": total_keys,
+        "total_expires": total_expires,
+        "expiring_ratio": total_expires / total_keys if total_keys else 0.0,
+        "sample": sample,
+    }
+
+@app.post("/api/metrics")
+async def get_metrics(
+    window: int = 300,
+    points: int = 120,
+    fields: Optional[str] = None,
+    conn: RedisConnection = Depends()
+):
+    """Windowed, downsampled INFO series from the shared per-connection sampler.
+
+    Any number of viewers read the same ring buffer; Redis only sees one INFO
+    per sampling interval. fields is an optional comma-separated subset of SERIES.
+    """
+    selected = fields.split(",") if fields else SERIES
+    unknown = [field for field in selected if field not in SERIES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown metric fields: {', '.join(unknown)}")
+    await check_connection(conn)
+    
+    sampler = await collector.get_sampler(conn.host, conn.port, conn.db, conn.password, conn.cluster)
+    return sampler.window(window, points, selected)
+
+@app.post("/api/latency")
+async def get_latency(
+    window: int = 3600,
+    top: int = 20,
+    recent: int = 50,
+    conn: RedisConnection = Depends()
+):
+    """Slowlog groups (by command and by key pattern) with percentiles, plus LATENCY events.
+
+    A shared per-server sampler polls SLOWLOG GET and the latency monitor and
+    keeps a bounded, de-duplicated history, so the window can reach further
+    back than the server's own slowlog-max-len entries.
+    """
+    if conn.cluster:
+        raise HTTPException(status_code=400, detail="Latency analysis is not available in cluster mode")
+    await check_connection(conn)
+    try:
+        sampler = await latency_collector.get_sampler(conn.host, conn.port, conn.db, conn.password)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error collecting latency data: {str(e)}")
+    return sampler.report(window, top, recent)
+
 @app.post("/api/keys")
-def get_keys(
+async def get_keys(
     pattern: str = "*", 
-    page: int = 1, 
-    per_page: int = 50,
-    client: RedisClient = Depends(get_redis_client)
+    page: int = Query(1, ge=1),
+    per_page: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    refresh: bool = False,
+    time_budget: float = DEFAULT_PAGE_BUDGET,
+    conn: RedisConnection = Depends(),
+    client: AsyncRedisClient = Depends(get_redis_client)
 ):
     try:
-        # Get all keys matching the pattern
-        all_keys = client.get_keys(pattern)
-        total_keys = len(all_keys)
-        
-        # Calculate pagination
-        total_pages = math.ceil(total_keys / per_page) if total_keys > 0 else 0
-        start_index = (page - 1) * per_page
-        end_index = min(start_index + per_page, total_keys)
-        
-        # Get the paginated slice of keys
-        paginated_keys = all_keys[start_index:end_index] if all_keys else []
+        index = None if conn.cluster else key_indexes.ready(conn.host, conn.port, conn.db, conn.password)
+        # Cursor mode: page through SCAN with an opaque continuation token ("0" starts)
+        if cursor is not None:
+            if is_index_token(cursor) and index is None:
+                raise ValueError("The key index is no longer available; restart from cursor 0")
+            if index is not None and (not cursor or cursor == "0" or is_index_token(cursor)):
+                after = decode_index_token(cursor) if is_index_token(cursor) else None
+                keys, last_key = index.page(pattern, after=after, count=per_page)
+                next_token = encode_index_token(last_key) if last_key is not None else None
+                return {**build_scan_page(keys, next_token, per_page, index.count(pattern)), "source": "index"}
+            return await client.scan_keys_page(pattern, cursor=cursor, per_page=per_page, time_budget=time_budget)
         
+        if index is not None:
+            keys, _ = index.page(pattern, count=per_page, offset=(page - 1) * per_page)
+            total_keys = index.count(pattern)
+            return {
+                "keys": keys,
+                "count": len(keys),
+                "total": total_keys,
+                "page": page,
+                "per_page": per_page,
+                # count() is None for patterns the index can't count without a full pass
+                "total_pages": math.ceil(total_keys / per_page) if total_keys is not None else None,
+                "cached": False,
+                "source": "index"
+            }
+
+        # Page mode walks SCAN only as far as this page and keeps what it read, so
+        # page N+1 continues from there instead of rescanning (or running KEYS)
+        snapshot = None if refresh else key_snapshots.get_keys(connection_key(conn), pattern)
+        cached = snapshot is not None
+        keys, token = (snapshot.keys, snapshot.cursor) if cached else ([], "0")
+        end_index = page * per_page
+        timed_out = False
+        # The total is only known once the walk is done, except for '*' (DBSIZE)
+        total_keys = None
+        if token is not None and len(keys) < end_index:
+            walked = await client.scan_keys_page(
+                pattern, cursor=token, per_page=end_index - len(keys), time_budget=time_budget
+            )
+            keys, token, timed_out = keys + walked["keys"], walked["cursor"], walked["timed_out"]
+            total_keys = walked["total"]
+            key_snapshots.set_keys(connection_key(conn), pattern, KeySnapshot(keys, token))
+            cached = False
+        if token is None:
+            total_keys = len(keys)
+        elif total_keys is None and pattern == "*":
+            total_keys = await client.redis_client.dbsize()
+        paginated_keys = keys[(page - 1) * per_page:end_index]
+
         return {
             "keys": paginated_keys,
             "count": len(paginated_keys),
             "total": total_keys,
             "page": page,
             "per_page": per_page,
-            "total_pages": total_pages
+            "total_pages": math.ceil(total_keys / per_page) if total_keys is not None else None,
+            "has_more": token is not None or len(keys) > end_index,
+            # A page cut short by the time budget fills up on the next request
+            "timed_out": timed_out,
+            "cached": cached
         }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching keys: {str(e)}")
 
+@app.post("/api/keys/search")
+async def search_keys(
+    prefix: str,
+    limit: int = 100,
+    time_budget: float = DEFAULT_SEARCH_BUDGET,
+    conn: RedisConnection = Depends(),
+    client: AsyncRedisClient = Depends(get_redis_client)
+):
+    """Find keys starting with prefix, from the key index when one is ready.
+
+    Without an index this is a SCAN that stops at limit matches or after
+    time_budget seconds; more_available says whether it stopped early.
+    """
+    if limit < 1:
+        raise HTTPException(status_code=400, detail="limit must be positive")
+    index = None if conn.cluster else key_indexes.ready(conn.host, conn.port, conn.db, conn.password)
+    if index is not None:
+        keys = index.search_prefix(prefix, limit + 1)
+        return {
+            "keys": keys[:limit],
+            "count": min(len(keys), limit),
+            "more_available": len(keys) > limit,
+            "timed_out": False,
+            "source": "index"
+        }
+    try:
+        return {**await client.scan_prefix(prefix, limit, time_budget), "source": "redis"}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching keys: {str(e)}")
+
+@app.post("/api/keys/metadata")
+async def get_keys_metadata(
+    data: dict = Body(...),
+    chunk_size: int = 200,
+    client: AsyncRedisClient = Depends(get_redis_client)
+):
+    """Type, TTL, encoding, element count and memory usage for a list of keys."""
+    keys = data.get("keys", [])
+    if not keys:
+        raise HTTPException(status_code=400, detail="No keys provided")
+    if chunk_size < 1:
+        raise HTTPException(status_code=400, detail="chunk_size must be positive")
+    
+    try:
+        rows = await client.get_keys_metadata(keys, chunk_size=chunk_size)
+        return {"keys": rows, "count": len(rows)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching key metadata: {str(e)}")
+
+@app.post("/api/keys/stream")
+async def stream_keys(
+    pattern: str = "*",
+    scan_count: int = 1000,
+    time_budget: Optional[float] = None,
+    max_rows: Optional[int] = None,
+    conn: RedisConnection = Depends(),
+    client: AsyncRedisClient = Depends(get_redis_client)
+):
+    """Stream keys matching pattern as NDJSON, one SCAN batch per line.
+
+    The walk ends early once time_budget seconds pass or max_rows keys were
+    sent; the final line says whether it completed and carries scan stats.
+    """
+    async def rows():
+        with holding_pool(async_registry, conn):
+            scan = client.new_scan(pattern, count=scan_count, time_budget=time_budget, max_rows=max_rows)
+            async for batch in client.iter_scan(scan):
+                yield {"keys": batch}
+            yield {"done": True, "total": scan.rows, "complete": scan.complete, "scan": scan.stats()}
+    
+    return StreamingResponse(ndjson_stream(rows()), media_type="application/x-ndjson")
+
+@app.post("/api/key/{key}/stream")
+async def stream_key_value(
+    key: str,
+    count: int = Query(1000, ge=1, le=MAX_VALUE_PAGE),
+    conn: RedisConnection = Depends(),
+    client: AsyncRedisClient = Depends(get_redis_client)
+):
+    """Stream a key's value as NDJSON: a metadata line, then one line per chunk."""
+    try:
+        metadata = await client.get_key_metadata(key)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching key details: {str(e)}")
+    if metadata is None:
+        raise HTTPException(status_code=404, detail=f"Key '{key}' not found")
+    
+    async def rows():
+        with holding_pool(async_registry, conn):
+            yield {"key": key, **metadata}
+            async for chunk in client.iter_value(key, key_type=metadata["type"], count=count):
+                yield {"value": chunk}
+            yield {"done": True}
+    
+    return StreamingResponse(ndjson_stream(rows()), media_type="application/x-ndjson")
+
 @app.post("/api/key/{key}")
-def get_key(key: str, client: RedisClient = Depends(get_redis_client)):
+async def get_key(
+    key: str,
+    cursor: Optional[str] = None,
+    count: int = Query(100, ge=1, le=MAX_VALUE_PAGE),
+    min_score: Optional[float] = None,
+    max_score: Optional[float] = None,
+    client: AsyncRedisClient = Depends(get_redis_client)
+):
     try:
-        keys = client.get_keys()
-        if key not in keys:
+        metadata = await client.get_key_metadata(key)
+        if metadata is None:
             raise HTTPException(status_code=404, detail=f"Key '{key}' not found")
         
-        key_type = client.redis_client.type(key)
-        value = client.get_value(key)
-        ttl = client.get_ttl(key)
-        memory = client.get_memory_usage(key)
+        # Collections are returned one window at a time; pass the cursor back for more
+        page = await client.get_value_page(
+            key,
+            key_type=metadata["type"],
+            cursor=cursor,
+            count=count,
+            min_score=min_score,
+            max_score=max_score
+        )
         
         return {
             "key": key,
-            "type": key_type,
-            "value": value,
-            "ttl": ttl,
-            "memory_usage": memory
+            "type": metadata["type"],
+            "value": page["value"],
+            "length": page["length"],
+            "cursor": page["cursor"],
+            "has_more": page["has_more"],
+            "ttl": metadata["ttl"],
+            "memory_usage": metadata["memory_usage"]
         }
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching key details: {str(e)}")
 
 @app.delete("/api/key/{key}")
-def delete_key(key: str, client: RedisClient = Depends(get_redis_client)):
+async def delete_key(key: str, conn: RedisConnection = Depends(),
+                     client: AsyncRedisClient = Depends(get_redis_client)):
     try:
-        keys = client.get_keys()
-        if key not in keys:
+        # DEL reports how many keys it removed, so it doubles as the existence check
+        if not await client.delete_key(key):
             raise HTTPException(status_code=404, detail=f"Key '{key}' not found")
-        
-        result = client.delete_key(key)
-        if result:
-            return {"status": "ok", "message": f"Successfully deleted key: {key}"}
-        raise HTTPException(status_code=500, detail=f"Failed to delete key: {key}")
+        key_snapshots.remove_keys(connection_key(conn), [key])
+        return {"status": "ok", "message": f"Successfully deleted key: {key}"}
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting key: {str(e)}")
 
 @app.post("/api/execute")
-def execute_command(command_data: RedisCommand, client: RedisClient = Depends(get_redis_client)):
+async def execute_command(command_data: RedisCommand, conn: RedisConnection = Depends(),
+                          client: AsyncRedisClient = Depends(get_redis_client)):
     try:
-        result = client.execute_command(command_data.command, *command_data.args)
+        result = await client.execute_command(command_data.command, *command_data.args)
+        # Arbitrary commands may write anywhere, so key listings are rebuilt next time
+        key_snapshots.invalidate_connection(connection_key(conn))
         return {"result": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error executing command: {str(e)}")
 
+@app.post("/api/execute/batch")
+async def execute_batch(batch: RedisCommandBatch, conn: RedisConnection = Depends(),
+                        client: AsyncRedisClient = Depends(get_redis_client)):
+    """Run a list of commands in one pipeline round trip, optionally as a MULTI/EXEC transaction.
+
+    Results (or errors) come back in command order. Outside a transaction a
+    failing command doesn't stop the rest; in one, a command Redis rejects
+    while queueing aborts the whole batch.
+    """
+    if not batch.commands:
+        raise HTTPException(status_code=400, detail="No commands given")
+    if len(batch.commands) > MAX_BATCH_COMMANDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_COMMANDS} commands per batch")
+    started = time.perf_counter()
+    try:
+        results = await client.execute_batch(
+            [(command.command, command.args) for command in batch.commands], transaction=batch.transaction
+        )
+    except redis.ResponseError as e:
+        # EXECABORT: a queued command was rejected, so nothing ran
+        raise HTTPException(status_code=400, detail=f"Transaction aborted: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error executing commands: {str(e)}")
+    finally:
+        key_snapshots.invalidate_connection(connection_key(conn))
+    return {
+        "results": results,
+        "count": len(results),
+        "errors": sum(1 for row in results if "error" in row),
+        "transaction": batch.transaction,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+    }
+
 @app.post("/api/keys/delete")
-def delete_multiple_keys(data: dict = Body(...), client: RedisClient = Depends(get_redis_client)):
+async def delete_multiple_keys(
+    data: dict = Body(...),
+    chunk_size: int = 500,
+    conn: RedisConnection = Depends(),
+    client: AsyncRedisClient = Depends(get_redis_client)
+):
     keys = data.get("keys", [])
     if not keys:
         raise HTTPException(status_code=400, detail="No keys provided")
-        
+    if chunk_size < 1:
+        raise HTTPException(status_code=400, detail="chunk_size must be positive")
+    
+    try:
+        results = await client.unlink_keys(keys, chunk_size=chunk_size)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error deleting keys: {str(e)}")
+    key_snapshots.remove_keys(connection_key(conn), [row["key"] for row in results if row["deleted"]])
+    
     deleted_count = 0
     errors = []
-    
-    for key in keys:
-        try:
-            if client.delete_key(key):
-                deleted_count += 1
-            else:
-                errors.append(f"Key not found: {key}")
-        except Exception as e:
-            errors.append(f"Error deleting key '{key}': {str(e)}")
+    for row in results:
+        if row["deleted"]:
+            deleted_count += 1
+        elif row["error"]:
+            errors.append(f"Error deleting key '{row['key']}': {row['error']}")
+        else:
+            errors.append(f"Key not found: {row['key']}")
     
     return {
         "status": "ok" if not errors else "partial",
         "deleted_count": deleted_count,
         "total_count": len(keys),
-        "errors": errors
-    }
\ No newline at end of file
+        "errors": errors,
+        "results": results
+    }
+
+@app.post("/api/keys/delete-pattern")
+def start_delete_by_pattern(
+    pattern: str,
+    batch_size: int = 500,
+    max_keys_per_second: Optional[float] = None,
+    conn: RedisConnection = Depends(),
+    client: RedisClient = Depends(get_sync_redis_client)
+):
+    """Start a background job that unlinks every key matching pattern."""
+    if not pattern:
+        raise HTTPException(status_code=400, detail="A pattern is required")
+    if batch_size < 1:
+        raise HTTPException(status_code=400, detail="batch_size must be positive")
+    
+    def run(job: Job):
+        try:
+            for progress in client.iter_delete_by_pattern(
+                pattern, batch_size=batch_size, max_keys_per_second=max_keys_per_second
+            ):
+                job.progress = progress
+                if job.cancelled:
+                    break
+        finally:
+            key_snapshots.invalidate_connection(connection_key(conn))
+        return job.progress
+    
+    job = submit_job("delete_pattern", holding_pools(run, conn), {
+        "pattern": pattern,
+        "batch_size": batch_size,
+        "max_keys_per_second": max_keys_per_second,
+    })
+    return job.to_dict()
+
+@app.post("/api/analysis/memory")
+def start_memory_analysis(
+    pattern: str = "*",
+    sample_rate: float = 1.0,
+    batch_size: int = 500,
+    separator: str = ":",
+    prefix_depth: int = 1,
+    max_keys_per_second: Optional[float] = None,
+    time_budget: Optional[float] = None,
+    conn: RedisConnection = Depends(),
+    client: RedisClient = Depends(get_sync_redis_client)
+):
+    """Start a background job aggregating memory usage by prefix, type, encoding and TTL."""
+    try:
+        analyzer = KeyspaceMemoryAnalyzer(
+            client,
+            pattern=pattern,
+            sample_rate=sample_rate,
+            batch_size=batch_size,
+            separator=separator,
+            prefix_depth=prefix_depth,
+            max_keys_per_second=max_keys_per_second,
+            time_budget=time_budget,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    job = submit_job("memory_analysis", holding_pools(analyzer.run, conn), {
+        "pattern": pattern,
+        "sample_rate": sample_rate,
+        "batch_size": batch_size,
+        "separator": separator,
+        "prefix_depth": prefix_depth,
+        "max_keys_per_second": max_keys_per_second,
+        "time_budget": time_budget,
+    })
+    return job.to_dict()
+
+@app.post("/api/analysis/bigkeys")
+def start_big_key_scan(
+    pattern: str = "*",
+    top_k: int = 20,
+    sample_rate: float = 1.0,
+    batch_size: int = 500,
+    max_keys_per_second: Optional[float] = None,
+    hot_keys: bool = False,
+    time_budget: Optional[float] = None,
+    conn: RedisConnection = Depends(),
+    client: RedisClient = Depends(get_sync_redis_client)
+):
+    """Start a background job tracking the largest (and optionally hottest) keys per type."""
+    try:
+        detector = BigKeyDetector(
+            client,
+            pattern=pattern,
+            top_k=top_k,
+            sample_rate=sample_rate,
+            batch_size=batch_size,
+            max_keys_per_second=max_keys_per_second,
+            hot_keys=hot_keys,
+            time_budget=time_budget,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    job = submit_job("big_keys", holding_pools(detector.run, conn), {
+        "pattern": pattern,
+        "top_k": top_k,
+        "sample_rate": sample_rate,
+        "batch_size": batch_size,
+        "max_keys_per_second": max_keys_per_second,
+        "hot_keys": hot_keys,
+        "time_budget": time_budget,
+    })
+    return job.to_dict()
+
+@app.post("/api/diff")
+def start_keyspace_diff(
+    target: RedisTarget,
+    pattern: str = "*",
+    method: str = "auto",
+    bucket_bits: int = DEFAULT_BUCKET_BITS,
+    batch_size: int = 1000,
+    max_report: int = DEFAULT_MAX_REPORT,
+    conn: RedisConnection = Depends(),
+    client: RedisClient = Depends(get_sync_redis_client)
+):
+    """Start a background job listing keys missing from, extra in or changed on target.
+
+    The connection parameters are the source; target comes in the body and
+    can be another server or another database of the same one.
+    """
+    if conn.cluster:
+        raise HTTPException(status_code=400, detail="Keyspace diff is not available in cluster mode")
+    if not registry.is_healthy(target.host, target.port, target.db, target.password):
+        raise HTTPException(status_code=500, detail="Could not connect to target Redis server")
+    target_client = RedisClient(
+        connection_pool=registry.get_pool(target.host, target.port, target.db, target.password)
+    )
+    try:
+        differ = KeyspaceDiff(
+            client,
+            target_client,
+            pattern=pattern,
+            batch_size=batch_size,
+            bucket_bits=bucket_bits,
+            method=method,
+            max_report=max_report,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    target_conn = RedisConnection(host=target.host, port=target.port, db=target.db, password=target.password)
+    job = submit_job("diff", holding_pools(differ.run, conn, target_conn), {
+        "target": {"host": target.host, "port": target.port, "db": target.db},
+        "pattern": pattern,
+        "method": method,
+        "bucket_bits": bucket_bits,
+        "batch_size": batch_size,
+        "max_report": max_report,
+    })
+    return job.to_dict()
+
+@app.post("/api/export")
+def export_keys(
+    pattern: str = "*",
+    batch_size: int = DEFAULT_TRANSFER_BATCH,
+    compress: bool = True,
+    conn: RedisConnection = Depends(),
+    client: RedisClient = Depends(get_sync_redis_client)
+):
+    """Stream the keys matching pattern as a dump file download (see transfer.py for the format).
+
+    Keys are read with pipelined DUMP and PTTL batch by batch, so the server
+    never holds more than one batch whatever the size of the keyspace.
+    """
+    if conn.cluster:
+        raise HTTPException(status_code=400, detail="Export is not available in cluster mode")
+    try:
+        exporter = KeyspaceExporter(client, pattern=pattern, batch_size=batch_size, compress=compress)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    filename = f"redislens-db{conn.db}.rldump" + (".gz" if compress else "")
+
+    def chunks():
+        with holding_pool(registry, conn):
+            yield from exporter.iter_chunks()
+
+    return StreamingResponse(
+        chunks(),
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@app.post("/api/import")
+async def import_keys(
+    request: Request,
+    replace: bool = True,
+    batch_size: int = DEFAULT_TRANSFER_BATCH,
+    conn: RedisConnection = Depends(),
+    client: AsyncRedisClient = Depends(get_redis_client)
+):
+    """RESTORE a dump file sent as the raw request body, pipelining batch_size keys at a time.
+
+    The body is decoded as it arrives, so uploads of any size use flat memory.
+    Without replace, keys that already exist are kept and counted as existing.
+    """
+    if conn.cluster:
+        raise HTTPException(status_code=400, detail="Import is not available in cluster mode")
+    if batch_size < 1:
+        raise HTTPException(status_code=400, detail="batch_size must be positive")
+    try:
+        with holding_pool(async_registry, conn):
+            return await async_import_dump(client, request.stream(), replace=replace, batch_size=batch_size)
+    except DumpFormatError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid dump file: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error importing keys: {str(e)}")
+    finally:
+        key_snapshots.invalidate_connection(connection_key(conn))
+
+@app.post("/api/jobs")
+async def list_jobs(kind: Optional[str] = None):
+    return {"jobs": [job.to_dict(include_result=False) for job in jobs.list(kind)]}
+
+@app.post("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return job.to_dict()
+
+@app.post("/api/jobs/{job_id}/cancel")
+async def cancel_job(job_id: str):
+    job = jobs.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return job.to_dict()
+
+@app.post("/api/cache/stats")
+async def get_cache_stats():
+    """Hit/miss counters of the key snapshot and INFO caches."""
+    return {"key_snapshots": key_snapshots.stats(), "info": info_cache.stats()}
+
+@app.post("/api/cache/clear")
+async def clear_cache():
+    return {"key_snapshots": key_snapshots.invalidate(), "info": info_cache.invalidate()}
+
+@app.post("/api/index/start")
+async def start_key_index(configure_notifications: bool = False, conn: RedisConnection = Depends()):
+    """Build a sorted in-memory key index kept current by keyspace notifications.
+
+    Needs notify-keyspace-events to include keyevent notifications for all
+    classes; configure_notifications enables them with CONFIG SET.
+    """
+    if conn.cluster:
+        raise HTTPException(status_code=400, detail="The key index is not available in cluster mode")
+    if not await async_registry.is_healthy(conn.host, conn.port, conn.db, conn.password):
+        raise HTTPException(status_code=500, detail="Could not connect to Redis server")
+    try:
+        index = await key_indexes.start(
+            conn.host, conn.port, conn.db, conn.password, configure=configure_notifications
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error starting key index: {str(e)}")
+    return index.to_dict()
+
+@app.post("/api/index/status")
+async def get_key_index_status(conn: RedisConnection = Depends()):
+    index = key_indexes.get(conn.host, conn.port, conn.db, conn.password)
+    if index is None:
+        return {"status": "stopped"}
+    return index.to_dict()
+
+@app.post("/api/index/stop")
+async def stop_key_index(conn: RedisConnection = Depends()):
+    index = await key_indexes.stop(conn.host, conn.port, conn.db, conn.password)
+    if index is None:
+        raise HTTPException(status_code=404, detail="No key index for this connection")
+    return index.to_dict()
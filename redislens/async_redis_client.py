@@ -0,0 +1,322 @@
+import time
+import redis
+import redis.asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from .redis_client import (
+    DEFAULT_PAGE_BUDGET,
+    DEFAULT_SEARCH_BUDGET,
+    SCAN_MIN_COUNT,
+    ScanState,
+    apply_lengths,
+    build_prefix_search,
+    build_scan_page,
+    build_stats,
+    decode_scan_token,
+    encode_scan_token,
+    escape_glob,
+    is_unknown_command,
+    parse_key_metadata,
+    parse_command_results,
+    parse_keys_info,
+    parse_keyspace,
+    parse_restore,
+    parse_unlink,
+    parse_value_page,
+    parse_value_window,
+    queue_commands,
+    queue_key_metadata,
+    queue_keys_info,
+    queue_lengths,
+    queue_restore,
+    queue_unlink,
+    queue_value_page,
+    summarize_key_sample,
+)
+
+
+class AsyncRedisClient:
+    """asyncio counterpart of RedisClient with the same method surface."""
+
+    def __init__(self, host: str = 'localhost', port: int = 6379, db: int = 0, password: Optional[str] = None,
+                 connection_pool: Optional[redis.asyncio.ConnectionPool] = None):
+        if connection_pool is not None:
+            # Reuse a shared pool (see connection_pool.AsyncConnectionRegistry)
+            self.redis_client = redis.asyncio.Redis(connection_pool=connection_pool)
+            return
+        self.redis_client = redis.asyncio.Redis(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            decode_responses=True
+        )
+
+    async def ping(self) -> bool:
+        """Check if Redis server is accessible."""
+        try:
+            return await self.redis_client.ping()
+        except redis.ConnectionError:
+            return False
+
+    async def get_info(self) -> Dict[str, str]:
+        """Get Redis server info."""
+        return await self.redis_client.info()
+
+    async def get_keys(self, pattern: str = '*') -> List[str]:
+        """Get all keys matching pattern."""
+        try:
+            if pattern == '*':
+                # For large databases, use SCAN instead of KEYS
+                key_count = await self.redis_client.dbsize()
+                if key_count > 10000:
+                    return await self._scan_keys(pattern)
+
+            return await self.redis_client.keys(pattern)
+        except redis.ResponseError:
+            # Fall back to SCAN if KEYS fails or is disabled
+            return await self._scan_keys(pattern)
+
+    async def _scan_keys(self, pattern: str = '*') -> List[str]:
+        """Get keys using SCAN command (safer for production)."""
+        keys = []
+        async for batch in self.iter_keys(pattern):
+            keys.extend(batch)
+        return keys
+
+    async def get_keys_paginated(self, pattern: str = '*', page: int = 1, per_page: int = 50) -> Dict[str, Any]:
+        """Get paginated keys matching pattern."""
+        all_keys = await self.get_keys(pattern)
+        total_keys = len(all_keys)
+
+        start_index = (page - 1) * per_page
+        end_index = min(start_index + per_page, total_keys)
+        paginated_keys = all_keys[start_index:end_index] if all_keys else []
+
+        return {
+            "keys": paginated_keys,
+            "count": len(paginated_keys),
+            "total": total_keys,
+            "page": page,
+            "per_page": per_page,
+            "total_pages": (total_keys + per_page - 1) // per_page if total_keys > 0 else 0
+        }
+
+    async def scan_keys_page(self, pattern: str = '*', cursor: Optional[str] = None, per_page: int = 50,
+                             scan_count: int = 1000,
+                             time_budget: Optional[float] = DEFAULT_PAGE_BUDGET) -> Dict[str, Any]:
+        """Get one page of keys using SCAN, resuming from an opaque cursor token."""
+        scan_cursor, skip, count = decode_scan_token(cursor)
+        scan = ScanState(pattern, scan_cursor, count or scan_count, time_budget, max_rows=per_page + skip)
+        keys: List[str] = []
+        next_token = None
+        while True:
+            call_cursor, call_count = scan.cursor, scan.count
+            batch = (await self.scan_step(scan))[skip:]
+            needed = per_page - len(keys)
+            if len(batch) > needed:
+                keys.extend(batch[:needed])
+                next_token = encode_scan_token(call_cursor, skip + needed, call_count)
+                break
+            keys.extend(batch)
+            skip = 0
+            if scan.complete:
+                break
+            if scan.exhausted():
+                next_token = encode_scan_token(scan.cursor)
+                break
+
+        total = await self.redis_client.dbsize() if pattern == '*' else None
+        return build_scan_page(keys, next_token, per_page, total, scan)
+
+    async def get_key_metadata(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get type, TTL and memory usage of a key in one pipelined round trip."""
+        pipe = self.redis_client.pipeline(transaction=False)
+        queue_key_metadata(pipe, key)
+        return parse_key_metadata(await pipe.execute(raise_on_error=False))
+
+    async def get_keys_metadata(self, keys: List[str], chunk_size: int = 200) -> List[Dict[str, Any]]:
+        """Get type, TTL, encoding, element count and memory usage for many keys."""
+        rows: List[Dict[str, Any]] = []
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start:start + chunk_size]
+            pipe = self.redis_client.pipeline(transaction=False)
+            queue_keys_info(pipe, chunk)
+            chunk_rows = parse_keys_info(chunk, await pipe.execute(raise_on_error=False))
+
+            pipe = self.redis_client.pipeline(transaction=False)
+            queued = queue_lengths(pipe, chunk_rows)
+            if queued:
+                apply_lengths(queued, await pipe.execute(raise_on_error=False))
+            rows.extend(chunk_rows)
+        return rows
+
+    async def get_value(self, key: str, key_type: Optional[str] = None) -> Any:
+        """Get value for a specific key."""
+        if key_type is None:
+            key_type = await self.redis_client.type(key)
+
+        if key_type == 'string':
+            return await self.redis_client.get(key)
+        elif key_type == 'list':
+            return await self.redis_client.lrange(key, 0, -1)
+        elif key_type == 'set':
+            return list(await self.redis_client.smembers(key))
+        elif key_type == 'zset':
+            return await self.redis_client.zrange(key, 0, -1, withscores=True)
+        elif key_type == 'hash':
+            return await self.redis_client.hgetall(key)
+        else:
+            return None
+
+    async def get_value_page(self, key: str, key_type: Optional[str] = None, cursor: Optional[str] = None,
+                             count: int = 100, min_score: Optional[float] = None,
+                             max_score: Optional[float] = None) -> Dict[str, Any]:
+        """Get a bounded window of a key's value plus its element count."""
+        offset, count = parse_value_window(cursor, count)
+        if key_type is None:
+            key_type = await self.redis_client.type(key)
+        pipe = self.redis_client.pipeline(transaction=False)
+        queued = queue_value_page(pipe, key, key_type, offset, count, min_score, max_score)
+        return parse_value_page(key_type, offset, await pipe.execute() if queued else None)
+
+    def new_scan(self, pattern: str = '*', cursor: int = 0, count: int = 1000,
+                 time_budget: Optional[float] = None, max_rows: Optional[int] = None) -> ScanState:
+        """Create the state for an adaptive SCAN walk driven by scan_step/iter_scan."""
+        return ScanState(pattern, cursor, count, time_budget, max_rows)
+
+    async def scan_step(self, scan: ScanState) -> List[str]:
+        """Run one SCAN call for an adaptive walk and record it on the state."""
+        started = time.monotonic()
+        cursor, batch = await self.redis_client.scan(cursor=scan.cursor, match=scan.pattern, count=scan.count)
+        scan.record(cursor, batch, time.monotonic() - started)
+        return batch
+
+    async def iter_scan(self, scan: ScanState) -> AsyncIterator[List[str]]:
+        """Yield non-empty batches of an adaptive SCAN walk until its budgets run out."""
+        while not scan.exhausted():
+            batch = await self.scan_step(scan)
+            if batch:
+                yield batch
+
+    async def iter_keys(self, pattern: str = '*', scan_count: int = 1000) -> AsyncIterator[List[str]]:
+        """Yield batches of keys matching pattern as SCAN returns them."""
+        async for batch in self.iter_scan(self.new_scan(pattern, count=scan_count)):
+            yield batch
+
+    async def iter_value(self, key: str, key_type: Optional[str] = None, count: int = 1000) -> AsyncIterator[Any]:
+        """Yield a key's value in chunks of roughly count elements."""
+        if key_type is None:
+            key_type = await self.redis_client.type(key)
+        cursor = None
+        while True:
+            page = await self.get_value_page(key, key_type=key_type, cursor=cursor, count=count)
+            if page["value"]:
+                yield page["value"]
+            elif page["cursor"] == (cursor or "0"):
+                # An empty window that doesn't move the cursor would repeat forever
+                break
+            cursor = page["cursor"]
+            if cursor is None:
+                break
+
+    async def delete_key(self, key: str) -> bool:
+        """Delete a key."""
+        return bool(await self.redis_client.delete(key))
+
+    async def unlink_keys(self, keys: List[str], chunk_size: int = 500) -> List[Dict[str, Any]]:
+        """Delete keys with pipelined UNLINK (DEL on servers without it), one round trip per chunk."""
+        rows: List[Dict[str, Any]] = []
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start:start + chunk_size]
+            pipe = self.redis_client.pipeline(transaction=False)
+            queue_unlink(pipe, chunk)
+            results = await pipe.execute(raise_on_error=False)
+            if results and is_unknown_command(results[0]):
+                pipe = self.redis_client.pipeline(transaction=False)
+                queue_unlink(pipe, chunk, command='DEL')
+                results = await pipe.execute(raise_on_error=False)
+            rows.extend(parse_unlink(chunk, results))
+        return rows
+
+    async def execute_command(self, command: str, *args) -> Any:
+        """Execute arbitrary Redis command."""
+        return await self.redis_client.execute_command(command, *args)
+
+    async def execute_batch(self, commands: List[Tuple[str, List[str]]],
+                            transaction: bool = False) -> List[Dict[str, Any]]:
+        """Run commands in one pipeline (wrapped in MULTI/EXEC if transaction) and return a row per command."""
+        pipe = self.redis_client.pipeline(transaction=transaction)
+        queue_commands(pipe, commands)
+        return parse_command_results(await pipe.execute(raise_on_error=False))
+
+    async def restore_keys(self, records: List[Tuple[bytes, int, bytes]],
+                           replace: bool = True) -> List[Optional[str]]:
+        """RESTORE (key, pttl, payload) records in one round trip; see parse_restore for the result."""
+        pipe = self.redis_client.pipeline(transaction=False)
+        queue_restore(pipe, records, replace)
+        return parse_restore(await pipe.execute(raise_on_error=False))
+
+    async def get_memory_usage(self, key: str) -> int:
+        """Get memory usage of key in bytes."""
+        try:
+            return await self.redis_client.memory_usage(key)
+        except redis.ResponseError:
+            # Fall back for Redis servers that don't support MEMORY command
+            return 0
+
+    async def get_ttl(self, key: str) -> int:
+        """Get TTL of key in seconds."""
+        return await self.redis_client.ttl(key)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get additional statistics about the Redis server."""
+        return build_stats(await self.get_info(), await self.redis_client.dbsize())
+
+    async def get_slowlog(self, count: int = 128) -> List[Any]:
+        """Get the newest count raw SLOWLOG GET entries (see latency.parse_slowlog)."""
+        # Sent as separate words so redis-py returns the reply unparsed, with decoded arguments
+        return await self.redis_client.execute_command('SLOWLOG', 'GET', count)
+
+    async def get_latency_latest(self) -> List[Any]:
+        """Get the raw LATENCY LATEST reply."""
+        return await self.redis_client.execute_command('LATENCY', 'LATEST')
+
+    async def get_latency_histories(self, events: List[str]) -> Dict[str, List[Any]]:
+        """Get LATENCY HISTORY of several events in one round trip."""
+        pipe = self.redis_client.pipeline(transaction=False)
+        for event in events:
+            pipe.execute_command('LATENCY', 'HISTORY', event)
+        return dict(zip(events, await pipe.execute()))
+
+    async def get_keyspace(self) -> List[Dict[str, Any]]:
+        """Get key counts, expiring keys and average TTL of every populated database."""
+        return parse_keyspace(await self.redis_client.info('keyspace'))
+
+    async def random_keys(self, count: int) -> List[str]:
+        """Get up to count distinct keys picked with pipelined RANDOMKEY."""
+        pipe = self.redis_client.pipeline(transaction=False)
+        for _ in range(count):
+            pipe.randomkey()
+        return list(dict.fromkeys(key for key in await pipe.execute() if key is not None))
+
+    async def sample_keyspace(self, sample_size: int = 100) -> Dict[str, Any]:
+        """Summarize types, TTLs and memory of a random sample of this database's keys."""
+        keys = await self.random_keys(sample_size)
+        pipe = self.redis_client.pipeline(transaction=False)
+        queue_keys_info(pipe, keys)
+        return summarize_key_sample(parse_keys_info(keys, await pipe.execute(raise_on_error=False)))
+
+    async def scan_prefix(self, prefix: str, limit: int = 100,
+                          time_budget: float = DEFAULT_SEARCH_BUDGET) -> Dict[str, Any]:
+        """Find up to limit keys starting with prefix with SCAN, stopping early."""
+        scan = self.new_scan(escape_glob(prefix) + "*", count=SCAN_MIN_COUNT,
+                             time_budget=time_budget, max_rows=limit)
+        keys: List[str] = []
+        async for batch in self.iter_scan(scan):
+            keys.extend(batch)
+        return build_prefix_search(keys, limit, scan)
+
+    async def search_by_prefix(self, prefix: str, limit: int = 100) -> List[str]:
+        """Search keys by prefix, optimized for faster searching."""
+        return (await self.scan_prefix(prefix, limit))["keys"]
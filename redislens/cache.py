@@ -0,0 +1,135 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple
+
+from .connection_pool import PoolKey
+
+# Seconds a page-mode SCAN snapshot is reused for paging before it is rebuilt
+DEFAULT_SNAPSHOT_TTL = float(os.environ.get("REDISLENS_SNAPSHOT_TTL", "30"))
+DEFAULT_SNAPSHOT_ENTRIES = int(os.environ.get("REDISLENS_SNAPSHOT_ENTRIES", "32"))
+# Keys held by all snapshots together; least recently used snapshots go first past it
+DEFAULT_SNAPSHOT_KEYS = int(os.environ.get("REDISLENS_SNAPSHOT_KEYS", "1000000"))
+# INFO changes constantly, so it is only shared between near-simultaneous requests
+DEFAULT_INFO_TTL = float(os.environ.get("REDISLENS_INFO_TTL", "1"))
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries also expire after ttl seconds."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING and time.monotonic() - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not _MISSING:
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """Drop the entries whose key matches predicate (all of them without one)."""
+        with self._lock:
+            stale = [key for key in self._entries if predicate is None or predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def update(self, predicate: Callable[[Hashable], bool], patch: Callable[[Any], Any]):
+        """Replace matching values with patch(value), keeping their age."""
+        with self._lock:
+            for key, (created, value) in list(self._entries.items()):
+                if predicate(key):
+                    self._entries[key] = (created, patch(value))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class KeySnapshot(NamedTuple):
+    """The keys a page-mode walk has read so far and the SCAN cursor token to continue it (None once done)."""
+    keys: List[str]
+    cursor: Optional[str]
+
+
+class KeySnapshotCache(TTLCache):
+    """Partial key listings per (connection, pattern), so page N+1 continues the walk instead of rescanning.
+
+    Besides max_entries, the snapshots together hold at most max_keys keys.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_SNAPSHOT_ENTRIES, ttl: float = DEFAULT_SNAPSHOT_TTL,
+                 max_keys: int = DEFAULT_SNAPSHOT_KEYS):
+        super().__init__(max_entries, ttl)
+        self.max_keys = max_keys
+
+    def get_keys(self, connection: PoolKey, pattern: str) -> Optional[KeySnapshot]:
+        return self.get((connection, pattern))
+
+    def set_keys(self, connection: PoolKey, pattern: str, snapshot: KeySnapshot):
+        if len(snapshot.keys) > self.max_keys:
+            self.invalidate(lambda cache_key: cache_key == (connection, pattern))
+            return
+        self.set((connection, pattern), snapshot)
+        with self._lock:
+            total = sum(len(value.keys) for _, value in self._entries.values())
+            while total > self.max_keys:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                total -= len(evicted.keys)
+                self.evictions += 1
+
+    def remove_keys(self, connection: PoolKey, keys: Iterable[str]):
+        """Patch every snapshot of a connection after keys were deleted."""
+        removed = set(keys)
+        if removed:
+            self.update(
+                lambda cache_key: cache_key[0] == connection,
+                lambda snapshot: snapshot._replace(keys=[key for key in snapshot.keys if key not in removed]),
+            )
+
+    def invalidate_connection(self, connection: PoolKey) -> int:
+        return self.invalidate(lambda cache_key: cache_key[0] == connection)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        with self._lock:
+            stats["keys"] = sum(len(value.keys) for _, value in self._entries.values())
+        stats["max_keys"] = self.max_keys
+        return stats
+
+
+# Shared caches used by the API process
+key_snapshots = KeySnapshotCache()
+info_cache = TTLCache(max_entries=DEFAULT_SNAPSHOT_ENTRIES, ttl=DEFAULT_INFO_TTL)
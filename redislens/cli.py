@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import argparse
+import json
 import os
 import sys
 import webbrowser
@@ -19,6 +20,259 @@ def open_browser(host, port):
     webbrowser.open(url)
 
 
+def print_rdb_progress(position, size, keys):
+    """Report RDB parsing progress on stderr."""
+    percent = position / size * 100 if size else 100.0
+    print(f"\r{percent:5.1f}%  {keys:,} keys", end="", file=sys.stderr, flush=True)
+
+
+def analyze_rdb(args):
+    """Analyze an RDB file offline and write the JSON report."""
+    from .rdb import RdbAnalyzer, RdbError
+
+    keys_out = open(args.keys_out, "w") if args.keys_out else None
+    try:
+        analyzer = RdbAnalyzer(
+            args.path,
+            separator=args.separator,
+            prefix_depth=args.prefix_depth,
+            top=args.top,
+            top_k=args.top_k,
+            keys_out=keys_out,
+            progress=None if args.quiet else print_rdb_progress,
+        )
+        report = analyzer.run()
+    except (OSError, RdbError) as e:
+        print(f"\nError analyzing {args.path}: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if keys_out is not None:
+            keys_out.close()
+
+    if not args.quiet:
+        totals = report["totals"]
+        print(
+            f"\nParsed {totals['scanned']:,} keys in {totals['elapsed_s']}s",
+            file=sys.stderr,
+        )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+def add_connection_arguments(parser):
+    """Redis connection options shared by the commands that talk to one server."""
+    parser.add_argument("--host", default="localhost", help="Redis host (default: localhost)")
+    parser.add_argument("--port", type=int, default=6379, help="Redis port (default: 6379)")
+    parser.add_argument("--db", type=int, default=0, help="Redis database (default: 0)")
+    parser.add_argument(
+        "--password",
+        default=os.environ.get("REDISCLI_AUTH"),
+        help="Redis password (default: $REDISCLI_AUTH)",
+    )
+
+
+def add_transfer_arguments(parser):
+    """Options shared by the export and import commands."""
+    add_connection_arguments(parser)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Keys per DUMP/RESTORE pipeline (default: 1000)",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Don't print progress on stderr"
+    )
+
+
+def transfer_progress(quiet):
+    """Progress callback printing key rates on stderr at most once a second."""
+    last = 0.0
+
+    def report(progress):
+        nonlocal last
+        if quiet or time.monotonic() - last < 1:
+            return
+        last = time.monotonic()
+        keys = progress.get("exported", progress.get("restored", progress.get("keys", 0)))
+        print(
+            f"\r{keys:,} keys  {progress['bytes'] / 1048576:,.1f} MB  "
+            f"{progress['keys_per_second']:,.0f} keys/s",
+            end="",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    return report
+
+
+def export_keys(args):
+    """Export keys matching a pattern to a dump file."""
+    from .redis_client import RedisClient
+    from .transfer import KeyspaceExporter
+
+    client = RedisClient(args.host, args.port, args.db, args.password)
+    compress = args.compress or args.output.endswith(".gz")
+    exporter = KeyspaceExporter(
+        client, pattern=args.pattern, batch_size=args.batch_size, compress=compress
+    )
+    try:
+        if args.output == "-":
+            result = exporter.export(sys.stdout.buffer, transfer_progress(args.quiet))
+        else:
+            with open(args.output, "wb") as f:
+                result = exporter.export(f, transfer_progress(args.quiet))
+    except Exception as e:
+        print(f"\nError exporting keys: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not args.quiet:
+        print(
+            f"\nExported {result['exported']:,} keys ({result['bytes']:,} bytes) "
+            f"in {result['elapsed_s']}s",
+            file=sys.stderr,
+        )
+
+
+def import_keys(args):
+    """Restore the keys of a dump file."""
+    from .redis_client import RedisClient
+    from .transfer import import_dump
+
+    client = RedisClient(args.host, args.port, args.db, args.password)
+    try:
+        if args.path == "-":
+            result = import_dump(
+                client, sys.stdin.buffer, not args.no_replace, args.batch_size, transfer_progress(args.quiet)
+            )
+        else:
+            with open(args.path, "rb") as f:
+                result = import_dump(
+                    client, f, not args.no_replace, args.batch_size, transfer_progress(args.quiet)
+                )
+    except Exception as e:
+        print(f"\nError importing {args.path}: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not args.quiet:
+        print(
+            f"\nRestored {result['restored']:,} of {result['records']:,} keys "
+            f"in {result['elapsed_s']}s ({result['existing']:,} already existed, "
+            f"{result['failed']:,} failed)",
+            file=sys.stderr,
+        )
+        for error in result["errors"]:
+            print(f"  {error['count']:,} x {error['error']}", file=sys.stderr)
+    if result["failed"]:
+        sys.exit(1)
+
+
+def generate_dataset(args):
+    """Fill a database with a synthetic dataset."""
+    from .generator import (
+        DATA_TYPES,
+        DatasetGenerator,
+        DatasetSpec,
+        SizeDistribution,
+        parse_type_sizes,
+        parse_weights,
+    )
+
+    try:
+        spec = DatasetSpec(
+            keys=args.keys,
+            types=parse_weights(args.types, allowed=DATA_TYPES),
+            elements=parse_type_sizes(args.elements, "1-20"),
+            value_size=SizeDistribution.parse(args.value_size),
+            prefixes=parse_weights(args.prefixes) if args.prefixes else None,
+            depth=args.depth,
+            fanout=args.fanout,
+            ttl_ratio=args.ttl_ratio,
+            ttl=SizeDistribution.parse(args.ttl),
+            seed=args.seed,
+        )
+        generator = DatasetGenerator(
+            spec,
+            host=args.host,
+            port=args.port,
+            db=args.db,
+            password=args.password,
+            processes=args.processes,
+            batch_size=args.batch_size,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    try:
+        if args.flush:
+            generator.flush()
+        result = generator.run(None if args.quiet else transfer_progress(False))
+    except Exception as e:
+        print(f"\nError generating dataset: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not args.quiet:
+        by_type = ", ".join(f"{count:,} {key_type}" for key_type, count in result["by_type"].items())
+        print(
+            f"\nGenerated {result['keys']:,} keys ({by_type}) in {result['elapsed_s']}s "
+            f"using {result['processes']} process(es): {result['keys_per_second']:,.0f} keys/s",
+            file=sys.stderr,
+        )
+
+
+def parse_endpoint(value):
+    """Parse host[:port][/db] into (host, port, db)."""
+    address, _, db = value.partition("/")
+    host, _, port = address.rpartition(":") if ":" in address else (address, "", "")
+    try:
+        return host or "localhost", int(port or 6379), int(db or 0)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected host[:port][/db], got '{value}'")
+
+
+def diff_keyspaces(args):
+    """Compare the keys of two databases and write the JSON report."""
+    from .diff import KeyspaceDiff
+    from .redis_client import RedisClient
+
+    source = RedisClient(*args.source, password=args.source_password)
+    target = RedisClient(*args.target, password=args.target_password)
+    try:
+        differ = KeyspaceDiff(
+            source,
+            target,
+            pattern=args.pattern,
+            batch_size=args.batch_size,
+            bucket_bits=args.bucket_bits,
+            method=args.method,
+            max_report=args.max_report,
+        )
+        report = differ.run()
+    except Exception as e:
+        print(f"Error comparing keyspaces: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    totals = report["totals"]
+    if not args.quiet:
+        print(
+            f"{totals['source_keys']:,} source keys, {totals['target_keys']:,} target keys: "
+            f"{totals['missing']:,} missing, {totals['extra']:,} extra, "
+            f"{totals['changed']:,} changed ({totals['elapsed_s']}s, {report['method']})",
+            file=sys.stderr,
+        )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    # Like diff(1): 0 when identical, 1 when there are differences
+    if not totals["identical"]:
+        sys.exit(1)
+
+
 def main():
     """Main entry point for the Redis Lens CLI."""
     parser = argparse.ArgumentParser(
@@ -40,6 +294,169 @@ def main():
     start_parser.add_argument(
         "--no-browser", action="store_true", help="Don't open the browser automatically"
     )
+    start_parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=50,
+        help="Maximum Redis connections per pooled server (default: 50)",
+    )
+
+    # RDB analysis command
+    rdb_parser = subparsers.add_parser(
+        "rdb", help="Analyze an RDB snapshot offline, without touching the server"
+    )
+    rdb_parser.add_argument("path", help="Path to the RDB file (e.g. dump.rdb)")
+    rdb_parser.add_argument(
+        "-o", "--output", help="Write the JSON report here (default: stdout)"
+    )
+    rdb_parser.add_argument(
+        "--keys-out", help="Also write one JSON line per key to this file"
+    )
+    rdb_parser.add_argument(
+        "--separator", default=":", help="Key prefix separator (default: :)"
+    )
+    rdb_parser.add_argument(
+        "--prefix-depth",
+        type=int,
+        default=1,
+        help="Number of key segments that make up a prefix (default: 1)",
+    )
+    rdb_parser.add_argument(
+        "--top", type=int, default=100, help="Prefixes to report (default: 100)"
+    )
+    rdb_parser.add_argument(
+        "--top-k",
+        type=int,
+        default=20,
+        help="Largest keys to report per type (default: 20)",
+    )
+    rdb_parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Don't print progress on stderr"
+    )
+
+    # Export command
+    export_parser = subparsers.add_parser(
+        "export", help="Export keys to a dump file with DUMP/PTTL"
+    )
+    export_parser.add_argument(
+        "output", help="Dump file to write, '-' for stdout (.gz compresses)"
+    )
+    export_parser.add_argument(
+        "--pattern", default="*", help="Only export keys matching this pattern (default: *)"
+    )
+    export_parser.add_argument(
+        "-z", "--compress", action="store_true", help="gzip the dump"
+    )
+    add_transfer_arguments(export_parser)
+
+    # Import command
+    import_parser = subparsers.add_parser(
+        "import", help="Restore the keys of a dump file with RESTORE"
+    )
+    import_parser.add_argument("path", help="Dump file to read, '-' for stdin")
+    import_parser.add_argument(
+        "--no-replace",
+        action="store_true",
+        help="Keep keys that already exist instead of overwriting them",
+    )
+    add_transfer_arguments(import_parser)
+
+    # Generate command
+    generate_parser = subparsers.add_parser(
+        "generate", help="Fill a database with a synthetic dataset for testing"
+    )
+    generate_parser.add_argument(
+        "-n", "--keys", type=int, default=1000000, help="Number of keys (default: 1000000)"
+    )
+    generate_parser.add_argument(
+        "--types",
+        default="string=50,hash=20,list=10,set=10,zset=8,stream=2",
+        help="Type mix as type=weight pairs (default: string=50,hash=20,list=10,set=10,zset=8,stream=2)",
+    )
+    generate_parser.add_argument(
+        "--elements",
+        default="1-20",
+        help="Elements per collection: N, A-B or pareto:A-B, optionally per type "
+        "(e.g. 1-20,hash=pareto:1-1000; default: 1-20)",
+    )
+    generate_parser.add_argument(
+        "--value-size", default="8-64", help="Bytes per value: N, A-B or pareto:A-B (default: 8-64)"
+    )
+    generate_parser.add_argument(
+        "--prefixes",
+        help="Top-level key prefixes as name=weight pairs (default: the key's type)",
+    )
+    generate_parser.add_argument(
+        "--depth", type=int, default=1, help="Key segments below the prefix (default: 1)"
+    )
+    generate_parser.add_argument(
+        "--fanout", type=int, default=100, help="Distinct values per segment (default: 100)"
+    )
+    generate_parser.add_argument(
+        "--ttl-ratio", type=float, default=0.0, help="Share of keys with a TTL (default: 0)"
+    )
+    generate_parser.add_argument(
+        "--ttl", default="60-86400", help="TTL in seconds: N, A-B or pareto:A-B (default: 60-86400)"
+    )
+    generate_parser.add_argument(
+        "--seed", type=int, default=0, help="Random seed; the same seed gives the same dataset (default: 0)"
+    )
+    generate_parser.add_argument(
+        "--processes", type=int, help="Worker processes (default: CPU count)"
+    )
+    generate_parser.add_argument(
+        "--batch-size", type=int, default=1000, help="Keys per pipeline (default: 1000)"
+    )
+    generate_parser.add_argument(
+        "--flush", action="store_true", help="FLUSHDB the database first"
+    )
+    generate_parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Don't print progress on stderr"
+    )
+    add_connection_arguments(generate_parser)
+
+    # Diff command
+    diff_parser = subparsers.add_parser(
+        "diff", help="List keys missing, extra or changed between two databases"
+    )
+    diff_parser.add_argument(
+        "source", type=parse_endpoint, help="Source as host[:port][/db]"
+    )
+    diff_parser.add_argument(
+        "target", type=parse_endpoint, help="Target as host[:port][/db]"
+    )
+    diff_parser.add_argument("--source-password", help="Source Redis password")
+    diff_parser.add_argument("--target-password", help="Target Redis password")
+    diff_parser.add_argument(
+        "--pattern", default="*", help="Only compare keys matching this pattern (default: *)"
+    )
+    diff_parser.add_argument(
+        "--method",
+        choices=["auto", "digest", "dump"],
+        default="auto",
+        help="Value digests from DEBUG DIGEST-VALUE or from DUMP payloads (default: auto)",
+    )
+    diff_parser.add_argument(
+        "--bucket-bits",
+        type=int,
+        default=16,
+        help="Compare 2^N buckets of keys before listing keys (default: 16)",
+    )
+    diff_parser.add_argument(
+        "--batch-size", type=int, default=1000, help="Keys per pipeline (default: 1000)"
+    )
+    diff_parser.add_argument(
+        "--max-report",
+        type=int,
+        default=1000,
+        help="Keys listed per kind of difference (default: 1000)",
+    )
+    diff_parser.add_argument(
+        "-o", "--output", help="Write the JSON report here (default: stdout)"
+    )
+    diff_parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Don't print the summary on stderr"
+    )
 
     # Version command
     version_parser = subparsers.add_parser("version", help="Show version information")
@@ -53,11 +470,32 @@ def main():
         args.port = 8005
         args.debug = False
         args.no_browser = False
+        args.max_connections = 50
 
     if args.command == "version":
         print(f"Redis Lens v{__version__}")
         return
 
+    elif args.command == "generate":
+        generate_dataset(args)
+        return
+
+    elif args.command == "diff":
+        diff_keyspaces(args)
+        return
+
+    elif args.command == "export":
+        export_keys(args)
+        return
+
+    elif args.command == "import":
+        import_keys(args)
+        return
+
+    elif args.command == "rdb":
+        analyze_rdb(args)
+        return
+
     elif args.command == "start":
         # Check if static files directory exists
         package_dir = os.path.dirname(os.path.abspath(__file__))
@@ -72,6 +510,9 @@ def main():
         if not args.no_browser:
             Timer(1, open_browser, args=[args.host, args.port]).start()
 
+        # The API module reads pool settings from the environment on import
+        os.environ["REDISLENS_MAX_CONNECTIONS"] = str(args.max_connections)
+
         print(f"Starting Redis Lens on http://{args.host}:{args.port}...")
 
         # Adjust the import path to use the package module
@@ -0,0 +1,456 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import redis
+import redis.asyncio.cluster
+import redis.cluster
+from redis.client import NEVER_DECODE
+
+from .async_redis_client import AsyncRedisClient
+from .connection_pool import DEFAULT_MAX_CONNECTIONS, PoolKey
+from .redis_client import DEFAULT_PAGE_BUDGET, RedisClient, ScanState, build_scan_page, parse_keyspace
+
+CLUSTER_TOKEN_PREFIX = "c."
+
+# INFO fields that are per-node amounts and add up across the primaries
+SUMMED_INFO_FIELDS = [
+    "used_memory",
+    "used_memory_rss",
+    "used_memory_peak",
+    "used_memory_dataset",
+    "maxmemory",
+    "connected_clients",
+    "blocked_clients",
+    "instantaneous_ops_per_sec",
+    "instantaneous_input_kbps",
+    "instantaneous_output_kbps",
+    "total_commands_processed",
+    "total_connections_received",
+    "keyspace_hits",
+    "keyspace_misses",
+    "evicted_keys",
+    "expired_keys",
+]
+
+# Per-node SCAN calls of the sync client run on this pool
+_scan_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="redislens-cluster-scan")
+
+
+def _human_bytes(size: float) -> str:
+    """Format a byte count like Redis does for the *_human INFO fields."""
+    for unit in ("B", "K", "M", "G", "T"):
+        if size < 1024 or unit == "T":
+            return f"{size:.2f}{unit}" if unit != "B" else f"{int(size)}B"
+        size /= 1024
+
+
+def aggregate_info(per_node: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine the INFO replies of the primaries into one cluster-wide INFO.
+
+    Sizes and counters are summed, keyspace lines are summed per db and the
+    remaining fields come from the first node. Per-node figures are kept
+    under "nodes".
+    """
+    names = sorted(per_node)
+    if not names:
+        return {}
+    info = dict(per_node[names[0]])
+    for field in SUMMED_INFO_FIELDS:
+        values = [per_node[name][field] for name in names if isinstance(per_node[name].get(field), (int, float))]
+        if values:
+            info[field] = sum(values)
+
+    keyspace: Dict[str, Dict[str, int]] = {}
+    for name in names:
+        for db, value in per_node[name].items():
+            if db.startswith("db") and isinstance(value, dict):
+                totals = keyspace.setdefault(db, {"keys": 0, "expires": 0})
+                totals["keys"] += value.get("keys", 0)
+                totals["expires"] += value.get("expires", 0)
+    info.update(keyspace)
+
+    for field in ("used_memory", "used_memory_rss", "used_memory_peak", "maxmemory"):
+        if isinstance(info.get(field), (int, float)):
+            info[f"{field}_human"] = _human_bytes(info[field])
+    info["cluster_nodes"] = len(names)
+    info["nodes"] = {
+        name: {
+            "used_memory": per_node[name].get("used_memory"),
+            "connected_clients": per_node[name].get("connected_clients"),
+            "instantaneous_ops_per_sec": per_node[name].get("instantaneous_ops_per_sec"),
+            "keys": sum(
+                value.get("keys", 0) for db, value in per_node[name].items()
+                if db.startswith("db") and isinstance(value, dict)
+            ),
+        }
+        for name in names
+    }
+    return info
+
+
+def per_node_info(reply: Dict[str, Any], primaries: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Key an INFO reply by node; redis-py unwraps the reply when only one node answered."""
+    if "redis_version" in reply or len(primaries) == 1 and set(reply) != set(primaries):
+        return {primaries[0]: reply}
+    return reply
+
+
+def encode_cluster_token(cursors: Dict[str, Tuple[int, int, Optional[int]]]) -> str:
+    """Encode per-node (cursor, skip, count) resume points as an opaque token."""
+    raw = json.dumps({name: list(position) for name, position in cursors.items()}, separators=(",", ":"))
+    return CLUSTER_TOKEN_PREFIX + base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cluster_token(token: Optional[str]) -> Optional[Dict[str, Tuple[int, int, Optional[int]]]]:
+    """Decode a token from encode_cluster_token; None means start a new scan."""
+    if not token or token == "0":
+        return None
+    if not token.startswith(CLUSTER_TOKEN_PREFIX):
+        raise ValueError(f"Invalid cursor token: {token}")
+    try:
+        raw = token[len(CLUSTER_TOKEN_PREFIX):]
+        cursors = json.loads(base64.urlsafe_b64decode((raw + "=" * (-len(raw) % 4)).encode()))
+        return {name: (int(cursor), int(skip), count) for name, (cursor, skip, count) in cursors.items()}
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise ValueError(f"Invalid cursor token: {token}")
+
+
+class ClusterScanState:
+    """An adaptive SCAN walk over every primary of a cluster, one ScanState per node.
+
+    Each node's COUNT adapts to that node's latency and match density on its
+    own; the time and row budgets apply to the walk as a whole. It has the
+    same surface as ScanState so the analyzers and streaming endpoints can
+    drive either.
+    """
+
+    def __init__(self, pattern: str, nodes: Dict[str, Tuple[int, Optional[int]]], count: int = 1000,
+                 time_budget: Optional[float] = None, max_rows: Optional[int] = None):
+        self.pattern = pattern
+        self.time_budget = time_budget
+        self.max_rows = max_rows
+        self.nodes: Dict[str, ScanState] = {
+            name: ScanState(pattern, cursor, node_count or count) for name, (cursor, node_count) in nodes.items()
+        }
+        self.stop_reason: Optional[str] = None
+        self._started = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    @property
+    def calls(self) -> int:
+        return sum(state.calls for state in self.nodes.values())
+
+    @property
+    def rows(self) -> int:
+        return sum(state.rows for state in self.nodes.values())
+
+    @property
+    def complete(self) -> bool:
+        return all(state.complete for state in self.nodes.values())
+
+    def active(self) -> List[Tuple[str, ScanState]]:
+        return [(name, state) for name, state in self.nodes.items() if not state.complete]
+
+    def exhausted(self) -> bool:
+        if self.complete:
+            self.stop_reason = "complete"
+            return True
+        if self.max_rows is not None and self.rows >= self.max_rows:
+            self.stop_reason = "row_budget"
+            return True
+        if self.calls and self.time_budget is not None and self.elapsed >= self.time_budget:
+            self.stop_reason = "time_budget"
+            return True
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        elapsed = self.elapsed
+        rows = self.rows
+        return {
+            "calls": self.calls,
+            "rows": rows,
+            "elapsed_s": round(elapsed, 4),
+            "keys_per_second": round(rows / elapsed, 1) if elapsed else 0.0,
+            "complete": self.complete,
+            "stop_reason": self.stop_reason,
+            "nodes": {
+                name: {"count": state.count, "rows": state.rows, "complete": state.complete}
+                for name, state in self.nodes.items()
+            },
+        }
+
+
+# One SCAN call on one node: (node name, cursor and COUNT it was issued with, keys returned)
+ScanCall = Tuple[str, int, int, List[str]]
+
+
+def resume_cluster_scan(primaries: List[str], pattern: str, token: Optional[str], count: int,
+                        time_budget: Optional[float], per_page: int) -> Tuple[ClusterScanState, Dict[str, int]]:
+    """Rebuild the walk for a page from a cluster cursor token; also returns per-node skips."""
+    cursors = decode_cluster_token(token)
+    if cursors is None:
+        cursors = {name: (0, 0, None) for name in primaries}
+    unknown = [name for name in cursors if name not in primaries]
+    if unknown:
+        raise ValueError("The cluster topology changed since this cursor was issued; restart from cursor 0")
+    skips = {name: skip for name, (_, skip, _) in cursors.items() if skip}
+    scan = ClusterScanState(
+        pattern,
+        {name: (cursor, node_count) for name, (cursor, _, node_count) in cursors.items()},
+        count,
+        time_budget,
+        max_rows=per_page + sum(skips.values()),
+    )
+    return scan, skips
+
+
+def take_scan_round(calls: List[ScanCall], keys: List[str], per_page: int, skips: Dict[str, int],
+                    resume: Dict[str, Tuple[int, int, Optional[int]]]) -> bool:
+    """Add one round of per-node SCAN batches to a page; True once the page is full.
+
+    A node whose batch was cut (or not reached because the page filled up)
+    is recorded in resume with the call that produced the batch, so the next
+    page reissues that call and skips what was already returned.
+    """
+    for name, call_cursor, call_count, batch in calls:
+        skip = skips.pop(name, 0)
+        remaining = batch[skip:]
+        needed = per_page - len(keys)
+        if len(remaining) > needed:
+            keys.extend(remaining[:needed])
+            resume[name] = (call_cursor, skip + needed, call_count)
+        else:
+            keys.extend(remaining)
+    return len(keys) >= per_page
+
+
+def cluster_page_token(scan: ClusterScanState, resume: Dict[str, Tuple[int, int, Optional[int]]]) -> Optional[str]:
+    cursors = {name: (state.cursor, 0, None) for name, state in scan.active()}
+    cursors.update(resume)
+    return encode_cluster_token(cursors) if cursors else None
+
+
+class ClusterClient(RedisClient):
+    """RedisClient for Redis Cluster.
+
+    Key commands (and pipelines of them) are routed by slot by RedisCluster.
+    SCAN runs on every primary concurrently and the batches are merged, INFO
+    is aggregated across primaries and DBSIZE is summed.
+    """
+
+    def __init__(self, cluster: redis.cluster.RedisCluster):
+        self.redis_client = cluster
+
+    def get_info(self) -> Dict[str, Any]:
+        """Get INFO aggregated over all primaries."""
+        primaries = [node.name for node in self.redis_client.get_primaries()]
+        reply = self.redis_client.info(target_nodes=redis.cluster.RedisCluster.PRIMARIES)
+        return aggregate_info(per_node_info(reply, primaries))
+
+    def get_keys(self, pattern: str = '*') -> List[str]:
+        """Get all keys matching pattern (always SCAN: KEYS would block every shard)."""
+        return list(self.redis_client.scan_iter(match=pattern, count=1000))
+
+    def get_keyspace(self) -> List[Dict[str, Any]]:
+        """Get the keyspace summed over all primaries."""
+        return parse_keyspace(self.get_info())
+
+    def random_keys(self, count: int) -> List[str]:
+        """Get up to count distinct keys with RANDOMKEY, each call on a random primary.
+
+        RedisCluster can't pipeline RANDOMKEY, so the calls run one by one.
+        """
+        keys = (self.redis_client.randomkey() for _ in range(count))
+        return list(dict.fromkeys(key for key in keys if key is not None))
+
+    def new_scan(self, pattern: str = '*', cursor: int = 0, count: int = 1000,
+                 time_budget: Optional[float] = None, max_rows: Optional[int] = None) -> ClusterScanState:
+        nodes = {node.name: (0, None) for node in self.redis_client.get_primaries()}
+        return ClusterScanState(pattern, nodes, count, time_budget, max_rows)
+
+    def _scan_node(self, scan: ClusterScanState, name: str, state: ScanState, raw: bool = False) -> ScanCall:
+        node = self.redis_client.get_node(node_name=name)
+        if node is None:
+            raise redis.ConnectionError(f"Cluster node {name} is gone")
+        call_cursor, call_count = state.cursor, state.count
+        started = time.monotonic()
+        options = {NEVER_DECODE: []} if raw else {}
+        cursors, batch = self.redis_client.scan(
+            cursor=call_cursor, match=scan.pattern, count=call_count, target_nodes=node, **options
+        )
+        state.record(next(iter(cursors.values())), batch, time.monotonic() - started)
+        return name, call_cursor, call_count, batch
+
+    def scan_round(self, scan: ClusterScanState, raw: bool = False) -> List[ScanCall]:
+        """Run one SCAN call on every primary that isn't done yet, concurrently."""
+        return list(_scan_executor.map(lambda item: self._scan_node(scan, *item, raw=raw), scan.active()))
+
+    def scan_step(self, scan: ClusterScanState, raw: bool = False) -> List[str]:
+        """Run one SCAN round over the primaries; with raw the keys are undecoded bytes."""
+        return [key for _, _, _, batch in self.scan_round(scan, raw=raw) for key in batch]
+
+    def scan_keys_page(self, pattern: str = '*', cursor: Optional[str] = None, per_page: int = 50,
+                       scan_count: int = 1000,
+                       time_budget: Optional[float] = DEFAULT_PAGE_BUDGET) -> Dict[str, Any]:
+        """Get one page of keys merged from all primaries, resuming from a cluster cursor token."""
+        primaries = [node.name for node in self.redis_client.get_primaries()]
+        scan, skips = resume_cluster_scan(primaries, pattern, cursor, scan_count, time_budget, per_page)
+        keys: List[str] = []
+        resume: Dict[str, Tuple[int, int, Optional[int]]] = {}
+        while not scan.exhausted():
+            if take_scan_round(self.scan_round(scan), keys, per_page, skips, resume):
+                break
+
+        total = self.redis_client.dbsize() if pattern == '*' else None
+        return build_scan_page(keys, cluster_page_token(scan, resume), per_page, total, scan)
+
+
+class AsyncClusterClient(AsyncRedisClient):
+    """asyncio counterpart of ClusterClient."""
+
+    def __init__(self, cluster: redis.asyncio.cluster.RedisCluster):
+        self.redis_client = cluster
+
+    async def get_info(self) -> Dict[str, Any]:
+        """Get INFO aggregated over all primaries."""
+        primaries = [node.name for node in self.redis_client.get_primaries()]
+        reply = await self.redis_client.info(target_nodes=redis.asyncio.cluster.RedisCluster.PRIMARIES)
+        return aggregate_info(per_node_info(reply, primaries))
+
+    async def get_keys(self, pattern: str = '*') -> List[str]:
+        """Get all keys matching pattern (always SCAN: KEYS would block every shard)."""
+        return [key async for key in self.redis_client.scan_iter(match=pattern, count=1000)]
+
+    async def get_keyspace(self) -> List[Dict[str, Any]]:
+        """Get the keyspace summed over all primaries."""
+        return parse_keyspace(await self.get_info())
+
+    async def random_keys(self, count: int) -> List[str]:
+        """Get up to count distinct keys with concurrent RANDOMKEY calls on random primaries."""
+        keys = await asyncio.gather(*(self.redis_client.randomkey() for _ in range(count)))
+        return list(dict.fromkeys(key for key in keys if key is not None))
+
+    def new_scan(self, pattern: str = '*', cursor: int = 0, count: int = 1000,
+                 time_budget: Optional[float] = None, max_rows: Optional[int] = None) -> ClusterScanState:
+        nodes = {node.name: (0, None) for node in self.redis_client.get_primaries()}
+        return ClusterScanState(pattern, nodes, count, time_budget, max_rows)
+
+    async def _scan_node(self, scan: ClusterScanState, name: str, state: ScanState) -> ScanCall:
+        node = self.redis_client.get_node(node_name=name)
+        if node is None:
+            raise redis.ConnectionError(f"Cluster node {name} is gone")
+        call_cursor, call_count = state.cursor, state.count
+        started = time.monotonic()
+        cursors, batch = await self.redis_client.scan(
+            cursor=call_cursor, match=scan.pattern, count=call_count, target_nodes=node
+        )
+        state.record(next(iter(cursors.values())), batch, time.monotonic() - started)
+        return name, call_cursor, call_count, batch
+
+    async def scan_round(self, scan: ClusterScanState) -> List[ScanCall]:
+        """Run one SCAN call on every primary that isn't done yet, concurrently."""
+        return list(await asyncio.gather(*(self._scan_node(scan, name, state) for name, state in scan.active())))
+
+    async def scan_step(self, scan: ClusterScanState) -> List[str]:
+        return [key for _, _, _, batch in await self.scan_round(scan) for key in batch]
+
+    async def scan_keys_page(self, pattern: str = '*', cursor: Optional[str] = None, per_page: int = 50,
+                             scan_count: int = 1000,
+                             time_budget: Optional[float] = DEFAULT_PAGE_BUDGET) -> Dict[str, Any]:
+        """Get one page of keys merged from all primaries, resuming from a cluster cursor token."""
+        primaries = [node.name for node in self.redis_client.get_primaries()]
+        scan, skips = resume_cluster_scan(primaries, pattern, cursor, scan_count, time_budget, per_page)
+        keys: List[str] = []
+        resume: Dict[str, Tuple[int, int, Optional[int]]] = {}
+        while not scan.exhausted():
+            if take_scan_round(await self.scan_round(scan), keys, per_page, skips, resume):
+                break
+
+        total = await self.redis_client.dbsize() if pattern == '*' else None
+        return build_scan_page(keys, cluster_page_token(scan, resume), per_page, total, scan)
+
+
+class ClusterRegistry:
+    """Shared RedisCluster clients, one per seed address; each keeps a pool per node."""
+
+    def __init__(self, max_connections: int = DEFAULT_MAX_CONNECTIONS):
+        self.max_connections = max_connections
+        self._clients: Dict[PoolKey, redis.cluster.RedisCluster] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str = "localhost", port: int = 6379,
+            password: Optional[str] = None) -> redis.cluster.RedisCluster:
+        """Get the client for a cluster, discovering its topology on first use."""
+        key = PoolKey(host, port, 0, password)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = redis.cluster.RedisCluster(
+                    host=host,
+                    port=port,
+                    password=password,
+                    decode_responses=True,
+                    max_connections=self.max_connections,
+                )
+            return client
+
+    def close(self):
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+class AsyncClusterRegistry:
+    """asyncio counterpart of ClusterRegistry."""
+
+    def __init__(self, max_connections: int = DEFAULT_MAX_CONNECTIONS):
+        self.max_connections = max_connections
+        self._clients: Dict[PoolKey, redis.asyncio.cluster.RedisCluster] = {}
+        # One lock per seed, so concurrent first requests discover the topology once
+        self._locks: Dict[PoolKey, asyncio.Lock] = {}
+
+    async def get(self, host: str = "localhost", port: int = 6379,
+                  password: Optional[str] = None) -> redis.asyncio.cluster.RedisCluster:
+        key = PoolKey(host, port, 0, password)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            client = self._clients.get(key)
+            if client is None:
+                client = redis.asyncio.cluster.RedisCluster(
+                    host=host,
+                    port=port,
+                    password=password,
+                    decode_responses=True,
+                    max_connections=self.max_connections,
+                )
+                # Only keep clients that managed to discover the topology
+                try:
+                    await client.initialize()
+                except BaseException:
+                    await client.aclose()
+                    raise
+                self._clients[key] = client
+        return client
+
+    async def close(self):
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+
+# Shared cluster clients used by the API process
+cluster_registry = ClusterRegistry()
+async_cluster_registry = AsyncClusterRegistry()
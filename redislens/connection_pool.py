@@ -0,0 +1,300 @@
+import abc
+import asyncio
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import redis
+import redis.asyncio
+
+# Defaults can be overridden through the environment (set by `redislens start`)
+DEFAULT_MAX_CONNECTIONS = int(os.environ.get("REDISLENS_MAX_CONNECTIONS", "50"))
+DEFAULT_IDLE_TIMEOUT = float(os.environ.get("REDISLENS_POOL_IDLE_TIMEOUT", "300"))
+DEFAULT_HEALTH_CHECK_INTERVAL = float(os.environ.get("REDISLENS_HEALTH_CHECK_INTERVAL", "30"))
+# How long a request waits for a free connection once max_connections is reached
+DEFAULT_POOL_TIMEOUT = 20
+
+
+class PoolKey(NamedTuple):
+    host: str
+    port: int
+    db: int
+    password: Optional[str]
+
+
+class _PoolEntry:
+    def __init__(self, pool: redis.ConnectionPool):
+        self.pool = pool
+        self.last_used = time.monotonic()
+        self.healthy: Optional[bool] = None
+        self.last_error: Optional[str] = None
+        # Jobs and streams holding the pool; a held pool is never evicted
+        self.users = 0
+
+    def touch(self):
+        self.last_used = time.monotonic()
+
+
+class _BaseRegistry(abc.ABC):
+    """Pool bookkeeping shared by the sync and async registries."""
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+    ):
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self._pools: Dict[PoolKey, _PoolEntry] = {}
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def _create_pool(self, key: PoolKey) -> Union[redis.ConnectionPool, redis.asyncio.ConnectionPool]:
+        """Create the pool for key; called with the registry lock held."""
+
+    def _get_entry(self, key: PoolKey, hold: bool = False) -> Tuple[_PoolEntry, bool]:
+        """Return the pool entry for key and whether it was just created."""
+        with self._lock:
+            entry = self._pools.get(key)
+            created = entry is None
+            if created:
+                entry = _PoolEntry(self._create_pool(key))
+                self._pools[key] = entry
+            entry.touch()
+            if hold:
+                entry.users += 1
+            return entry, created
+
+    def get_pool(
+        self, host: str = "localhost", port: int = 6379, db: int = 0, password: Optional[str] = None
+    ) -> redis.ConnectionPool:
+        """Get (or create) the shared pool for these connection settings."""
+        entry, _ = self._get_entry(PoolKey(host, port, db, password))
+        return entry.pool
+
+    @contextmanager
+    def hold(
+        self, host: str = "localhost", port: int = 6379, db: int = 0, password: Optional[str] = None
+    ) -> Iterator[Union[redis.ConnectionPool, redis.asyncio.ConnectionPool]]:
+        """Get the shared pool and keep it from being evicted until the block exits.
+
+        Jobs and streams can go without calling get_pool for longer than
+        idle_timeout while their connections are checked out. Evicting the pool
+        then would disconnect them, and the next request would open a second
+        pool to the same server on top of max_connections.
+        """
+        entry, _ = self._get_entry(PoolKey(host, port, db, password), hold=True)
+        try:
+            yield entry.pool
+        finally:
+            with self._lock:
+                entry.users -= 1
+                entry.touch()
+
+    def _pop_idle(self) -> List[_PoolEntry]:
+        """Remove and return pools that are not held and have not been used for idle_timeout seconds."""
+        now = time.monotonic()
+        evicted = []
+        with self._lock:
+            for key, entry in list(self._pools.items()):
+                if not entry.users and now - entry.last_used > self.idle_timeout:
+                    evicted.append(self._pools.pop(key))
+        return evicted
+
+    def _pop_all(self) -> List[_PoolEntry]:
+        with self._lock:
+            entries = list(self._pools.values())
+            self._pools.clear()
+        return entries
+
+    def _entries(self) -> List[_PoolEntry]:
+        with self._lock:
+            return list(self._pools.values())
+
+    def stats(self) -> Dict[str, int]:
+        """Get a summary of the registered pools."""
+        entries = self._entries()
+        return {
+            "pools": len(entries),
+            "healthy": sum(1 for entry in entries if entry.healthy),
+            "held": sum(1 for entry in entries if entry.users),
+            "max_connections": self.max_connections,
+        }
+
+
+class ConnectionRegistry(_BaseRegistry):
+    """Process-wide registry of Redis connection pools keyed by connection settings."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _create_pool(self, key: PoolKey) -> redis.ConnectionPool:
+        return redis.BlockingConnectionPool(
+            host=key.host,
+            port=key.port,
+            db=key.db,
+            password=key.password,
+            decode_responses=True,
+            max_connections=self.max_connections,
+            timeout=DEFAULT_POOL_TIMEOUT,
+        )
+
+    def is_healthy(
+        self, host: str = "localhost", port: int = 6379, db: int = 0, password: Optional[str] = None
+    ) -> bool:
+        """Report pool health from the last background check.
+
+        A healthy pool is not pinged inline; the result of the most recent
+        scheduled health check is used. New and unhealthy pools are pinged, so a
+        server that comes back is usable right away instead of at the next check.
+        """
+        entry, _ = self._get_entry(PoolKey(host, port, db, password))
+        if not entry.healthy:
+            self._check_entry(entry)
+        return bool(entry.healthy)
+
+    def check(
+        self, host: str = "localhost", port: int = 6379, db: int = 0, password: Optional[str] = None
+    ) -> bool:
+        """Ping the server now and record the result as the pool's health."""
+        entry, _ = self._get_entry(PoolKey(host, port, db, password))
+        self._check_entry(entry)
+        return bool(entry.healthy)
+
+    def _check_entry(self, entry: _PoolEntry):
+        try:
+            entry.healthy = bool(redis.Redis(connection_pool=entry.pool).ping())
+            entry.last_error = None
+        except redis.RedisError as e:
+            entry.healthy = False
+            entry.last_error = str(e)
+            # Drop broken sockets so the next request reconnects from scratch
+            entry.pool.disconnect()
+
+    def check_health(self):
+        """Ping every registered pool and record the result."""
+        for entry in self._entries():
+            self._check_entry(entry)
+
+    def evict_idle(self) -> int:
+        """Disconnect and drop pools that have not been used for idle_timeout seconds."""
+        evicted = self._pop_idle()
+        for entry in evicted:
+            entry.pool.disconnect()
+        return len(evicted)
+
+    def _run(self):
+        while not self._stop_event.wait(self.health_check_interval):
+            self.evict_idle()
+            self.check_health()
+
+    def start(self):
+        """Start the background health check / eviction thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="redislens-pool-health", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread and close every pool."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        for entry in self._pop_all():
+            entry.pool.disconnect()
+
+
+class AsyncConnectionRegistry(_BaseRegistry):
+    """Registry of redis.asyncio pools; health checks run as a task on the event loop."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._task: Optional[asyncio.Task] = None
+
+    def _create_pool(self, key: PoolKey) -> redis.asyncio.ConnectionPool:
+        return redis.asyncio.BlockingConnectionPool(
+            host=key.host,
+            port=key.port,
+            db=key.db,
+            password=key.password,
+            decode_responses=True,
+            max_connections=self.max_connections,
+            timeout=DEFAULT_POOL_TIMEOUT,
+        )
+
+    async def is_healthy(
+        self, host: str = "localhost", port: int = 6379, db: int = 0, password: Optional[str] = None
+    ) -> bool:
+        """Report pool health from the last background check (pinging new and unhealthy pools)."""
+        entry, _ = self._get_entry(PoolKey(host, port, db, password))
+        if not entry.healthy:
+            await self._check_entry(entry)
+        return bool(entry.healthy)
+
+    async def check(
+        self, host: str = "localhost", port: int = 6379, db: int = 0, password: Optional[str] = None
+    ) -> bool:
+        """Ping the server now and record the result as the pool's health."""
+        entry, _ = self._get_entry(PoolKey(host, port, db, password))
+        await self._check_entry(entry)
+        return bool(entry.healthy)
+
+    async def _check_entry(self, entry: _PoolEntry):
+        try:
+            entry.healthy = bool(await redis.asyncio.Redis(connection_pool=entry.pool).ping())
+            entry.last_error = None
+        except redis.RedisError as e:
+            entry.healthy = False
+            entry.last_error = str(e)
+            await entry.pool.disconnect()
+
+    async def check_health(self):
+        """Ping every registered pool concurrently and record the result."""
+        await asyncio.gather(*(self._check_entry(entry) for entry in self._entries()))
+
+    async def evict_idle(self) -> int:
+        """Disconnect and drop pools that have not been used for idle_timeout seconds."""
+        evicted = self._pop_idle()
+        for entry in evicted:
+            await entry.pool.disconnect()
+        return len(evicted)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            await self.evict_idle()
+            await self.check_health()
+
+    def start(self):
+        """Start the health check task on the running event loop."""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Cancel the health check task and close every pool."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for entry in self._pop_all():
+            await entry.pool.disconnect()
+
+
+# Shared registries used by the API process: request handlers use the async
+# pools, background jobs running in threads use the sync ones.
+registry = ConnectionRegistry()
+async_registry = AsyncConnectionRegistry()
@@ -0,0 +1,234 @@
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set
+
+from .redis_client import RedisClient
+
+DIFF_METHODS = ("auto", "digest", "dump")
+# 2^16 buckets: ~150 keys per bucket at 10M keys, 1 MB of sums per side
+DEFAULT_BUCKET_BITS = 16
+# Most keys (both sides together) held in memory during one detail pass
+DEFAULT_MAX_DETAIL_KEYS = 1000000
+# Keys listed per difference kind; counts are always complete
+DEFAULT_MAX_REPORT = 1000
+
+_MASK = (1 << 64) - 1
+
+
+def _hash64(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+def _key_text(key: bytes) -> str:
+    return key.decode("utf-8", errors="backslashreplace")
+
+
+class _Side:
+    """Per-bucket key counts and digest sums of one database."""
+
+    def __init__(self, client: RedisClient, bucket_bits: int):
+        self.client = client
+        self.counts = [0] * (1 << bucket_bits)
+        self.sums = [0] * (1 << bucket_bits)
+        self.scanned = 0
+        self.digested = 0
+
+
+class KeyspaceDiff:
+    """Find missing, extra and changed keys between a source and a target database.
+
+    Both sides are SCANned in parallel and every key's value digest is fetched
+    in pipelined batches (DEBUG DIGEST-VALUE, or a hash of the DUMP payload
+    where DEBUG is disabled). Keys are bucketed by a hash of their name; each
+    bucket keeps a count and the sum of hash(digest, key), which is order
+    independent.
+
+    Only buckets whose count or sum differ are compared key by key, in passes
+    that rescan both sides and hold at most max_detail_keys keys. Memory is
+    therefore bounded by the bucket count and max_detail_keys, never by the
+    size of either keyspace. Keys written while the diff runs can show up as
+    differences.
+
+    SCAN can return a key twice (while the server rehashes), which counts it
+    twice in its bucket's summary. That bucket then mismatches and is
+    compared key by key. The comparison dedupes keys, so no false difference
+    is reported, and the exact counts it finds replace the summary's.
+    """
+
+    def __init__(
+        self,
+        source: RedisClient,
+        target: RedisClient,
+        pattern: str = "*",
+        batch_size: int = 1000,
+        bucket_bits: int = DEFAULT_BUCKET_BITS,
+        method: str = "auto",
+        max_detail_keys: int = DEFAULT_MAX_DETAIL_KEYS,
+        max_report: int = DEFAULT_MAX_REPORT,
+    ):
+        if method not in DIFF_METHODS:
+            raise ValueError(f"method must be one of {', '.join(DIFF_METHODS)}")
+        if not 1 <= bucket_bits <= 24:
+            raise ValueError("bucket_bits must be between 1 and 24")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self.pattern = pattern
+        self.batch_size = batch_size
+        self.bucket_bits = bucket_bits
+        self.method = method
+        self.max_detail_keys = max_detail_keys
+        self.max_report = max_report
+        self.source = _Side(source, bucket_bits)
+        self.target = _Side(target, bucket_bits)
+
+        self.phase = "pending"
+        self.mismatched: List[int] = []
+        self.passes = 0
+        self.passes_done = 0
+        self.missing: List[str] = []
+        self.extra: List[str] = []
+        self.changed: List[str] = []
+        self.counts = {"missing": 0, "extra": 0, "changed": 0}
+        self.elapsed = 0.0
+        self._job = None
+
+    def _bucket(self, key: bytes) -> int:
+        return _hash64(key) >> (64 - self.bucket_bits)
+
+    def _cancelled(self) -> bool:
+        return self._job is not None and self._job.cancelled
+
+    def _resolve_method(self):
+        if self.method == "auto":
+            both = self.source.client.supports_value_digest() and self.target.client.supports_value_digest()
+            self.method = "digest" if both else "dump"
+
+    def _iter_digests(self, side: _Side, buckets: Optional[Set[int]] = None):
+        """Yield (bucket, key, digest) for every key of a side, or only those in buckets."""
+        client = side.client
+        scan = client.new_scan(self.pattern, count=self.batch_size)
+        for batch in client.iter_scan(scan, raw=True):
+            side.scanned += len(batch)
+            bucket_of = {key: self._bucket(key) for key in batch}
+            if buckets is not None:
+                bucket_of = {key: bucket for key, bucket in bucket_of.items() if bucket in buckets}
+            keys = list(bucket_of)
+            for start in range(0, len(keys), self.batch_size):
+                for key, digest in client.get_value_digests(keys[start:start + self.batch_size], self.method):
+                    side.digested += 1
+                    yield bucket_of[key], key, digest
+            if self._job is not None:
+                self._job.progress = self.progress()
+            if self._cancelled():
+                return
+
+    def _summarize(self, side: _Side):
+        for bucket, key, digest in self._iter_digests(side):
+            side.counts[bucket] += 1
+            side.sums[bucket] = (side.sums[bucket] + _hash64(digest + key)) & _MASK
+
+    def _collect(self, side: _Side, buckets: Set[int]) -> Dict[bytes, bytes]:
+        """Digests of the keys in buckets, correcting those buckets' counts for keys scanned twice."""
+        digests: Dict[bytes, bytes] = {}
+        counts = dict.fromkeys(buckets, 0)
+        for bucket, key, digest in self._iter_digests(side, buckets):
+            if key not in digests:
+                counts[bucket] += 1
+            digests[key] = digest
+        if not self._cancelled():
+            for bucket, count in counts.items():
+                side.counts[bucket] = count
+        return digests
+
+    def _record(self, kind: str, keys: List[bytes]):
+        self.counts[kind] += len(keys)
+        listed = getattr(self, kind)
+        room = self.max_report - len(listed)
+        if room > 0:
+            listed.extend(_key_text(key) for key in sorted(keys)[:room])
+
+    def _plan_passes(self) -> List[Set[int]]:
+        """Group mismatched buckets so each pass holds at most max_detail_keys keys."""
+        groups: List[Set[int]] = []
+        group: Set[int] = set()
+        held = 0
+        for bucket in self.mismatched:
+            size = self.source.counts[bucket] + self.target.counts[bucket]
+            if group and held + size > self.max_detail_keys:
+                groups.append(group)
+                group, held = set(), 0
+            group.add(bucket)
+            held += size
+        if group:
+            groups.append(group)
+        return groups
+
+    def run(self, job=None) -> Dict[str, Any]:
+        """Run the diff and return the report; a jobs.Job gets progress and can cancel it."""
+        self._job = job
+        started = time.monotonic()
+        self._resolve_method()
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="redislens-diff") as executor:
+            self.phase = "summarize"
+            for future in [executor.submit(self._summarize, side) for side in (self.source, self.target)]:
+                future.result()
+            self.mismatched = [
+                bucket for bucket in range(1 << self.bucket_bits)
+                if self.source.counts[bucket] != self.target.counts[bucket]
+                or self.source.sums[bucket] != self.target.sums[bucket]
+            ]
+
+            self.phase = "compare"
+            groups = self._plan_passes()
+            self.passes = len(groups)
+            for buckets in groups:
+                if self._cancelled():
+                    break
+                source_keys, target_keys = [
+                    future.result() for future in
+                    [executor.submit(self._collect, side, buckets) for side in (self.source, self.target)]
+                ]
+                self._record("missing", [key for key in source_keys if key not in target_keys])
+                self._record("extra", [key for key in target_keys if key not in source_keys])
+                self._record("changed", [
+                    key for key, digest in source_keys.items()
+                    if key in target_keys and target_keys[key] != digest
+                ])
+                self.passes_done += 1
+        self.phase = "cancelled" if self._cancelled() else "done"
+        self.elapsed = time.monotonic() - started
+        return self.report()
+
+    def progress(self) -> Dict[str, Any]:
+        return {
+            "phase": self.phase,
+            "method": self.method,
+            "source_scanned": self.source.scanned,
+            "target_scanned": self.target.scanned,
+            "mismatched_buckets": len(self.mismatched),
+            "passes": self.passes,
+            "passes_done": self.passes_done,
+            **self.counts,
+        }
+
+    def report(self) -> Dict[str, Any]:
+        complete = self.phase == "done"
+        return {
+            "pattern": self.pattern,
+            "method": self.method,
+            "bucket_bits": self.bucket_bits,
+            "totals": {
+                **self.progress(),
+                "source_keys": sum(self.source.counts),
+                "target_keys": sum(self.target.counts),
+                "buckets": 1 << self.bucket_bits,
+                "elapsed_s": round(self.elapsed, 3),
+                "complete": complete,
+                "identical": complete and not any(self.counts.values()),
+            },
+            "missing": self.missing,
+            "extra": self.extra,
+            "changed": self.changed,
+            "truncated": any(self.counts[kind] > len(getattr(self, kind)) for kind in self.counts),
+        }
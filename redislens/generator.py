@@ -0,0 +1,366 @@
+"""Synthetic dataset generator for testing RedisLens at realistic scale.
+
+Keys are spread over strings, lists, sets, hashes, sorted sets and streams
+with configurable element counts, value sizes, prefix trees and TTL mixes.
+Commands are packed into RESP by hand and sent in pipelined batches from
+several processes, each filling its own ranges of key indices, so the
+generator is bound by the Redis server rather than by client overhead.
+
+Every chunk of keys is generated from its own seeded random generator, so
+the same spec always produces the same dataset whatever the process count.
+"""
+import multiprocessing
+import os
+import random
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import redis
+
+DATA_TYPES = ("string", "list", "set", "hash", "zset", "stream")
+DEFAULT_TYPE_WEIGHTS = {"string": 50, "hash": 20, "list": 10, "set": 10, "zset": 8, "stream": 2}
+# Keys generated per task handed to a worker process
+DEFAULT_CHUNK_KEYS = 50000
+# Keys per pipelined round trip
+DEFAULT_GENERATOR_BATCH = 1000
+# Shape of the "pareto" distribution: 80% of the values fall in the smallest 20% of the range
+PARETO_ALPHA = 1.16
+# Printable bytes values are cut from (regenerated per process)
+VALUE_POOL_SIZE = 1 << 20
+_ALPHABET = b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+
+class SizeDistribution:
+    """Element counts or byte sizes drawn from a fixed, uniform or heavy-tailed distribution.
+
+    Parsed from "N" (always N), "A-B" (uniform) or "pareto:A-B" (mostly
+    close to A with a long tail up to B, like real-world value sizes).
+    """
+
+    KINDS = ("fixed", "uniform", "pareto")
+
+    def __init__(self, kind: str, low: int, high: Optional[int] = None):
+        high = low if high is None else high
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown distribution '{kind}'")
+        if low < 0 or high < low:
+            raise ValueError(f"Invalid range {low}-{high}")
+        self.kind = kind
+        self.low = low
+        self.high = high
+
+    @classmethod
+    def parse(cls, text: str) -> "SizeDistribution":
+        kind, _, bounds = text.rpartition(":")
+        low, _, high = bounds.partition("-")
+        try:
+            low_value = int(low)
+            high_value = int(high) if high else None
+        except ValueError:
+            raise ValueError(f"Invalid size distribution '{text}': expected N, A-B or pareto:A-B")
+        if not kind:
+            kind = "uniform" if high else "fixed"
+        return cls(kind, low_value, high_value)
+
+    def sample(self, rng: random.Random) -> int:
+        if self.kind == "fixed" or self.low == self.high:
+            return self.low
+        if self.kind == "uniform":
+            # Much cheaper than randint, which matters at millions of samples
+            return self.low + int(rng.random() * (self.high - self.low + 1))
+        return min(self.high, int(max(self.low, 1) * rng.paretovariate(PARETO_ALPHA)))
+
+    def __str__(self) -> str:
+        if self.kind == "fixed":
+            return str(self.low)
+        text = f"{self.low}-{self.high}"
+        return text if self.kind == "uniform" else f"{self.kind}:{text}"
+
+
+def parse_weights(text: str, allowed: Optional[Tuple[str, ...]] = None) -> Dict[str, float]:
+    """Parse "a=3,b=1" (or "a,b" for equal weights) into a name -> weight dict."""
+    weights: Dict[str, float] = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        name, _, weight = item.partition("=")
+        if allowed is not None and name not in allowed:
+            raise ValueError(f"Unknown type '{name}', expected one of {', '.join(allowed)}")
+        try:
+            weights[name] = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"Invalid weight in '{item}'")
+        if weights[name] < 0:
+            raise ValueError(f"Negative weight in '{item}'")
+    if not weights or not any(weights.values()):
+        raise ValueError(f"No positive weights in '{text}'")
+    return weights
+
+
+def parse_type_sizes(text: str, default: str) -> Dict[str, SizeDistribution]:
+    """Parse "1-20,hash=pareto:1-1000" into a distribution per data type."""
+    sizes = {key_type: SizeDistribution.parse(default) for key_type in DATA_TYPES}
+    overrides = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        name, equals, spec = item.partition("=")
+        if not equals:
+            sizes = {key_type: SizeDistribution.parse(item) for key_type in DATA_TYPES}
+            continue
+        if name not in DATA_TYPES:
+            raise ValueError(f"Unknown type '{name}', expected one of {', '.join(DATA_TYPES)}")
+        overrides[name] = SizeDistribution.parse(spec)
+    sizes.update(overrides)
+    return sizes
+
+
+class DatasetSpec:
+    """What to generate: key count, type mix, sizes, key names and TTLs.
+
+    Key names are "<prefix>:<branch>:...:<index>" with depth random branches
+    of fanout values each below the prefix. The prefix is the key's type
+    unless prefix weights are given.
+    """
+
+    def __init__(
+        self,
+        keys: int = 1000000,
+        types: Optional[Dict[str, float]] = None,
+        elements: Optional[Dict[str, SizeDistribution]] = None,
+        value_size: Optional[SizeDistribution] = None,
+        prefixes: Optional[Dict[str, float]] = None,
+        depth: int = 1,
+        fanout: int = 100,
+        ttl_ratio: float = 0.0,
+        ttl: Optional[SizeDistribution] = None,
+        seed: int = 0,
+    ):
+        if keys < 0:
+            raise ValueError("keys must not be negative")
+        if not 0 <= ttl_ratio <= 1:
+            raise ValueError("ttl_ratio must be between 0 and 1")
+        if depth < 0 or fanout < 1:
+            raise ValueError("depth must not be negative and fanout must be positive")
+        self.keys = keys
+        self.types = types or dict(DEFAULT_TYPE_WEIGHTS)
+        self.elements = elements or parse_type_sizes("", "1-20")
+        self.value_size = value_size or SizeDistribution("uniform", 8, 64)
+        self.prefixes = prefixes
+        self.depth = depth
+        self.fanout = fanout
+        self.ttl_ratio = ttl_ratio
+        self.ttl = ttl or SizeDistribution("uniform", 60, 86400)
+        if self.ttl.low < 1:
+            raise ValueError("TTLs must be at least 1 second")
+        self.seed = seed
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "keys": self.keys,
+            "types": self.types,
+            "elements": {key_type: str(size) for key_type, size in self.elements.items()},
+            "value_size": str(self.value_size),
+            "prefixes": self.prefixes,
+            "depth": self.depth,
+            "fanout": self.fanout,
+            "ttl_ratio": self.ttl_ratio,
+            "ttl": str(self.ttl),
+            "seed": self.seed,
+        }
+
+
+def pack_command(*args: bytes) -> bytes:
+    """Encode one command as a RESP array of bulk strings."""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+class ChunkWriter:
+    """Generate the commands for ranges of key indices from a spec."""
+
+    def __init__(self, spec: DatasetSpec):
+        self.spec = spec
+        self.type_names = list(spec.types)
+        self.type_weights = list(spec.types.values())
+        if spec.prefixes:
+            self.prefix_names = [name.encode() for name in spec.prefixes]
+            self.prefix_weights: Optional[List[float]] = list(spec.prefixes.values())
+        else:
+            self.prefix_names = []
+            self.prefix_weights = None
+        pool_rng = random.Random(spec.seed)
+        self.pool = bytes(pool_rng.choices(_ALPHABET, k=VALUE_POOL_SIZE))
+
+    def _values(self, rng: random.Random, count: int) -> List[bytes]:
+        """count values with sizes drawn from the spec, cut from the value pool."""
+        pool = self.pool
+        pool_size = len(pool)
+        sample = self.spec.value_size.sample
+        random_float = rng.random
+        values = []
+        for _ in range(count):
+            size = sample(rng)
+            if size > pool_size:
+                values.append((pool * (size // pool_size + 1))[:size])
+            else:
+                offset = int(random_float() * (pool_size - size + 1))
+                values.append(pool[offset:offset + size])
+        return values
+
+    def iter_keys(self, start: int, end: int) -> Iterator[Tuple[str, List[bytes]]]:
+        """Yield (type, packed commands) for each key index in [start, end)."""
+        spec = self.spec
+        rng = random.Random(f"{spec.seed}:{start}")
+        random_float = rng.random
+        count = end - start
+        types = rng.choices(self.type_names, self.type_weights, k=count)
+        if self.prefix_weights is not None:
+            prefixes = rng.choices(self.prefix_names, self.prefix_weights, k=count)
+        else:
+            prefixes = [key_type.encode() for key_type in types]
+        fanout = spec.fanout
+        depth = spec.depth
+        for index, key_type, prefix in zip(range(start, end), types, prefixes):
+            key = b":".join([prefix, *[b"%d" % int(random_float() * fanout) for _ in range(depth)], b"%d" % index])
+            ttl = b"%d" % spec.ttl.sample(rng) if spec.ttl_ratio and random_float() < spec.ttl_ratio else None
+            if key_type == "string":
+                value = self._values(rng, 1)[0]
+                packed = [pack_command(b"SET", key, value, b"EX", ttl) if ttl else pack_command(b"SET", key, value)]
+            else:
+                elements = max(1, spec.elements[key_type].sample(rng))
+                values = self._values(rng, elements)
+                if key_type == "list":
+                    packed = [pack_command(b"RPUSH", key, *values)]
+                elif key_type == "set":
+                    # Numbered members so sets get exactly the drawn size
+                    packed = [pack_command(b"SADD", key, *[b"%d:%s" % item for item in enumerate(values)])]
+                elif key_type == "hash":
+                    args = []
+                    for i, value in enumerate(values):
+                        args.append(b"field:%d" % i)
+                        args.append(value)
+                    packed = [pack_command(b"HSET", key, *args)]
+                elif key_type == "zset":
+                    args = []
+                    for i, value in enumerate(values):
+                        args.append(b"%.3f" % (random_float() * 1000))
+                        args.append(b"%d:%s" % (i, value))
+                    packed = [pack_command(b"ZADD", key, *args)]
+                else:
+                    packed = [pack_command(b"XADD", key, b"*", b"field", value) for value in values]
+                if ttl:
+                    packed.append(pack_command(b"EXPIRE", key, ttl))
+            yield key_type, packed
+
+
+# Per-process state set up by _init_worker
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(spec: DatasetSpec, host: str, port: int, db: int, password: Optional[str], batch_size: int):
+    _worker["writer"] = ChunkWriter(spec)
+    _worker["connection"] = redis.Connection(host=host, port=port, db=db, password=password)
+    _worker["batch_size"] = batch_size
+
+
+def _load_chunk(bounds: Tuple[int, int]) -> Dict[str, Any]:
+    """Generate and send one chunk of keys; runs in a worker process."""
+    connection: redis.Connection = _worker["connection"]
+    batch_size = _worker["batch_size"]
+    writer: ChunkWriter = _worker["writer"]
+    counts = {key_type: 0 for key_type in writer.type_names}
+    commands = 0
+    sent = 0
+    batch: List[bytes] = []
+    keys = 0
+    start, end = bounds
+    for index, (key_type, packed) in enumerate(writer.iter_keys(start, end), 1):
+        counts[key_type] += 1
+        batch.extend(packed)
+        if index % batch_size and index != end - start:
+            continue
+        data = b"".join(batch)
+        connection.send_packed_command([data], check_health=False)
+        for _ in batch:
+            # Raises on the first error reply, e.g. OOM with maxmemory set
+            connection.read_response()
+        commands += len(batch)
+        sent += len(data)
+        keys = index
+        batch = []
+    return {"keys": keys, "by_type": counts, "commands": commands, "bytes": sent}
+
+
+class DatasetGenerator:
+    """Load a DatasetSpec into a Redis database from several processes."""
+
+    def __init__(
+        self,
+        spec: DatasetSpec,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        processes: Optional[int] = None,
+        batch_size: int = DEFAULT_GENERATOR_BATCH,
+        chunk_size: int = DEFAULT_CHUNK_KEYS,
+    ):
+        if batch_size < 1 or chunk_size < 1:
+            raise ValueError("batch_size and chunk_size must be positive")
+        self.spec = spec
+        self.connection = (host, port, db, password)
+        self.processes = processes or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+
+    def flush(self):
+        """Remove every key of the target database."""
+        host, port, db, password = self.connection
+        client = redis.Redis(host=host, port=port, db=db, password=password)
+        try:
+            client.flushdb()
+        finally:
+            client.close()
+
+    def run(self, progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Generate the dataset and return totals; progress is called after every chunk."""
+        keys = self.spec.keys
+        chunks = [(start, min(start + self.chunk_size, keys)) for start in range(0, keys, self.chunk_size)]
+        processes = max(1, min(self.processes, len(chunks)))
+        totals: Dict[str, Any] = {
+            "keys": 0,
+            "by_type": {key_type: 0 for key_type in self.spec.types},
+            "commands": 0,
+            "bytes": 0,
+        }
+        started = time.monotonic()
+
+        def merge(result: Dict[str, Any]):
+            for field in ("keys", "commands", "bytes"):
+                totals[field] += result[field]
+            for key_type, count in result["by_type"].items():
+                totals["by_type"][key_type] += count
+            elapsed = time.monotonic() - started
+            totals["elapsed_s"] = round(elapsed, 3)
+            totals["keys_per_second"] = round(totals["keys"] / elapsed, 1) if elapsed else 0.0
+            if progress is not None:
+                progress(totals)
+
+        init_args = (self.spec, *self.connection, self.batch_size)
+        if processes == 1:
+            _init_worker(*init_args)
+            try:
+                for chunk in chunks:
+                    merge(_load_chunk(chunk))
+            finally:
+                _worker.pop("connection").disconnect()
+        else:
+            with multiprocessing.Pool(processes, initializer=_init_worker, initargs=init_args) as pool:
+                for result in pool.imap_unordered(_load_chunk, chunks):
+                    merge(result)
+
+        elapsed = time.monotonic() - started
+        totals["elapsed_s"] = round(elapsed, 3)
+        totals["keys_per_second"] = round(totals["keys"] / elapsed, 1) if elapsed else 0.0
+        totals["processes"] = processes
+        totals["spec"] = self.spec.to_dict()
+        return totals
@@ -0,0 +1,127 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+# Finished jobs kept around for status queries before the oldest are dropped
+DEFAULT_MAX_FINISHED_JOBS = 50
+# Jobs allowed to run at once; each one has its own thread and Redis connections
+DEFAULT_MAX_RUNNING_JOBS = 8
+
+
+class JobLimitError(Exception):
+    """Raised by JobManager.submit when max_running jobs are already running."""
+
+
+class Job:
+    """A long-running task executed on a background thread."""
+
+    def __init__(self, kind: str, params: Dict[str, Any]):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.params = params
+        self.status = "pending"
+        self.progress: Dict[str, Any] = {}
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "cancelled", "failed")
+
+    def cancel(self):
+        """Ask the job to stop at its next checkpoint."""
+        self._cancel_event.set()
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        data = {
+            "id": self.id,
+            "kind": self.kind,
+            "params": self.params,
+            "status": self.status,
+            "progress": self.progress,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+class JobManager:
+    """Run jobs on daemon threads, at most max_running at once, and keep a bounded history of them."""
+
+    def __init__(self, max_finished: int = DEFAULT_MAX_FINISHED_JOBS,
+                 max_running: int = DEFAULT_MAX_RUNNING_JOBS):
+        self.max_finished = max_finished
+        self.max_running = max_running
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._running = 0
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, target: Callable[[Job], Any], params: Optional[Dict[str, Any]] = None) -> Job:
+        """Start target(job) on a new thread; its return value becomes job.result.
+
+        Raises JobLimitError rather than queueing when max_running jobs are
+        already running, so callers can tell the client to retry later.
+        """
+        job = Job(kind, params or {})
+        with self._lock:
+            if self._running >= self.max_running:
+                raise JobLimitError(f"{self._running} jobs are already running, try again when one finishes")
+            self._running += 1
+            self._jobs[job.id] = job
+            self._prune()
+        thread = threading.Thread(
+            target=self._run, args=(job, target), name=f"redislens-job-{job.id}", daemon=True
+        )
+        thread.start()
+        return job
+
+    def _run(self, job: Job, target: Callable[[Job], Any]):
+        job.status = "running"
+        status = "failed"
+        try:
+            job.result = target(job)
+            status = "cancelled" if job.cancelled else "completed"
+        except Exception as e:
+            job.error = str(e)
+        finally:
+            # Free the slot before the job reads as finished, so a client polling
+            # for it can submit the next job right away
+            with self._lock:
+                self._running -= 1
+            job.finished_at = time.time()
+            job.status = status
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self, kind: Optional[str] = None) -> List[Job]:
+        with self._lock:
+            return [job for job in self._jobs.values() if kind is None or job.kind == kind]
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+        return job
+
+
+# Shared job manager used by the API process
+jobs = JobManager()
@@ -0,0 +1,454 @@
+import asyncio
+import base64
+import time
+from bisect import bisect_left, bisect_right
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import redis
+import redis.asyncio
+
+from .async_redis_client import AsyncRedisClient
+from .connection_pool import PoolKey, async_registry
+
+# Seconds between DBSIZE checks that catch changes notifications don't report (FLUSHDB)
+DEFAULT_VERIFY_INTERVAL = 60
+RECONNECT_DELAY = 5
+# Seconds the initial SCAN may take before the index gives up instead of retrying
+DEFAULT_BUILD_BUDGET = 600
+
+# Events that remove the key from the database; every other keyevent means it exists
+REMOVE_EVENTS = {"del", "expired", "evicted", "rename_from", "move_from"}
+# notify-keyspace-events classes the index needs ('A' is an alias for all of them)
+REQUIRED_EVENT_CLASSES = "g$lshzxet"
+GLOB_CHARS = "*?[\\"
+
+INDEX_TOKEN_PREFIX = "i."
+
+
+def encode_index_token(last_key: str) -> str:
+    """Encode the last key of a page as a cursor token for the next one."""
+    return INDEX_TOKEN_PREFIX + base64.urlsafe_b64encode(last_key.encode()).decode().rstrip("=")
+
+
+def is_index_token(token: Optional[str]) -> bool:
+    return bool(token) and token.startswith(INDEX_TOKEN_PREFIX)
+
+
+def decode_index_token(token: str) -> str:
+    try:
+        raw = token[len(INDEX_TOKEN_PREFIX):]
+        return base64.urlsafe_b64decode((raw + "=" * (-len(raw) % 4)).encode()).decode()
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError(f"Invalid cursor token: {token}")
+
+
+def glob_literal_prefix(pattern: str) -> str:
+    """The part of a Redis glob pattern before its first special character."""
+    for position, char in enumerate(pattern):
+        if char in GLOB_CHARS:
+            return pattern[:position]
+    return pattern
+
+
+def glob_to_fnmatch(pattern: str) -> str:
+    """Translate Redis glob syntax ([^...] and backslash escapes) to fnmatch syntax."""
+    translated = []
+    position = 0
+    while position < len(pattern):
+        char = pattern[position]
+        if char == "\\" and position + 1 < len(pattern):
+            position += 1
+            translated.append(f"[{pattern[position]}]")
+        elif char == "[" and pattern[position + 1:position + 2] == "^":
+            translated.append("[!")
+            position += 1
+        else:
+            translated.append(char)
+        position += 1
+    return "".join(translated)
+
+
+class SortedKeyIndex:
+    """All keys of a database in sorted order, searched with binary search.
+
+    Keys are kept in a list of sorted chunks of CHUNK_SIZE to 2 * CHUNK_SIZE
+    keys (the layout of sortedcontainers.SortedList), so applying a keyspace
+    event moves at most one chunk's pointers instead of shifting a list of
+    every key. Positions, which prefix counts and offset paging need, come
+    from per-chunk start offsets rebuilt lazily after changes.
+    """
+
+    CHUNK_SIZE = 1000
+
+    def __init__(self, keys: Iterable[str] = ()):
+        ordered = sorted(set(keys))
+        size = self.CHUNK_SIZE
+        self._chunks: List[List[str]] = [ordered[start:start + size] for start in range(0, len(ordered), size)]
+        self._maxes: List[str] = [chunk[-1] for chunk in self._chunks]
+        self._len = len(ordered)
+        self._starts: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, key: str) -> bool:
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            return False
+        chunk = self._chunks[index]
+        return chunk[bisect_left(chunk, key)] == key
+
+    def __iter__(self) -> Iterator[str]:
+        for chunk in self._chunks:
+            yield from chunk
+
+    def add(self, key: str):
+        if not self._chunks:
+            self._chunks.append([key])
+            self._maxes.append(key)
+        else:
+            index = min(bisect_left(self._maxes, key), len(self._maxes) - 1)
+            chunk = self._chunks[index]
+            position = bisect_left(chunk, key)
+            if position < len(chunk) and chunk[position] == key:
+                return
+            chunk.insert(position, key)
+            self._maxes[index] = chunk[-1]
+            if len(chunk) > 2 * self.CHUNK_SIZE:
+                half = chunk[self.CHUNK_SIZE:]
+                del chunk[self.CHUNK_SIZE:]
+                self._chunks.insert(index + 1, half)
+                self._maxes[index:index + 1] = [chunk[-1], half[-1]]
+        self._len += 1
+        self._starts = None
+
+    def discard(self, key: str):
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            return
+        chunk = self._chunks[index]
+        position = bisect_left(chunk, key)
+        if chunk[position] != key:
+            return
+        del chunk[position]
+        if chunk:
+            self._maxes[index] = chunk[-1]
+        else:
+            del self._chunks[index]
+            del self._maxes[index]
+        self._len -= 1
+        self._starts = None
+
+    def _chunk_starts(self) -> List[int]:
+        if self._starts is None:
+            starts, total = [], 0
+            for chunk in self._chunks:
+                starts.append(total)
+                total += len(chunk)
+            self._starts = starts
+        return self._starts
+
+    def bisect_left(self, key: str) -> int:
+        """Position of the first key >= key."""
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            return self._len
+        return self._chunk_starts()[index] + bisect_left(self._chunks[index], key)
+
+    def bisect_right(self, key: str) -> int:
+        """Position of the first key > key."""
+        index = bisect_right(self._maxes, key)
+        if index == len(self._maxes):
+            return self._len
+        return self._chunk_starts()[index] + bisect_right(self._chunks[index], key)
+
+    def islice(self, start: int, stop: int) -> Iterator[str]:
+        """Yield the keys at positions start to stop (exclusive)."""
+        if start >= stop:
+            return
+        starts = self._chunk_starts()
+        index = bisect_right(starts, start) - 1
+        offset = start - starts[index]
+        remaining = stop - start
+        for chunk in self._chunks[index:]:
+            part = chunk[offset:offset + remaining]
+            yield from part
+            remaining -= len(part)
+            if remaining <= 0:
+                return
+            offset = 0
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """Position bounds of the keys starting with prefix."""
+        start = self.bisect_left(prefix)
+        if not prefix:
+            return start, self._len
+        if ord(prefix[-1]) < 0x10FFFF:
+            # Every key with the prefix sorts before the prefix with its last character bumped
+            return start, self.bisect_left(prefix[:-1] + chr(ord(prefix[-1]) + 1))
+        end = start
+        for key in self.islice(start, self._len):
+            if not key.startswith(prefix):
+                break
+            end += 1
+        return start, end
+
+    def search_prefix(self, prefix: str, limit: int = 100) -> List[str]:
+        start, end = self.prefix_range(prefix)
+        return list(self.islice(start, min(end, start + limit)))
+
+    def count(self, pattern: str = "*") -> Optional[int]:
+        """Number of keys matching pattern when it is a plain prefix glob, else None."""
+        prefix = glob_literal_prefix(pattern)
+        if pattern not in (prefix, prefix + "*"):
+            return None
+        if pattern == prefix:
+            return int(prefix in self)
+        start, end = self.prefix_range(prefix)
+        return end - start
+
+    def page(self, pattern: str = "*", after: Optional[str] = None, count: int = 50,
+             offset: int = 0) -> Tuple[List[str], Optional[str]]:
+        """Get up to count keys matching pattern that sort after the key after.
+
+        Returns the keys and the key to resume from (None on the last page).
+        Paging by key rather than offset stays consistent while keys change;
+        offset skips that many matches first (a slice for plain prefix globs).
+        """
+        prefix = glob_literal_prefix(pattern)
+        start, end = self.prefix_range(prefix)
+        if after is not None:
+            start = min(max(start, self.bisect_right(after)), end)
+        matcher = None if pattern == prefix + "*" else glob_to_fnmatch(pattern)
+        if matcher is None:
+            start, offset = min(start + offset, end), 0
+
+        keys: List[str] = []
+        for key in self.islice(start, end):
+            if matcher is not None and not fnmatchcase(key, matcher):
+                continue
+            if offset:
+                offset -= 1
+                continue
+            if len(keys) == count:
+                return keys, keys[-1]
+            keys.append(key)
+        return keys, None
+
+
+def missing_event_classes(flags: str) -> str:
+    """Flags to add to a notify-keyspace-events value so the index sees every change."""
+    missing = "" if "E" in flags else "E"
+    if "A" not in flags:
+        missing += "".join(cls for cls in REQUIRED_EVENT_CLASSES if cls not in flags)
+    return missing
+
+
+async def ensure_notifications(client: redis.asyncio.Redis, configure: bool = False):
+    """Check keyevent notifications are on, enabling them with CONFIG SET if configure is true."""
+    flags = (await client.config_get("notify-keyspace-events")).get("notify-keyspace-events", "")
+    missing = missing_event_classes(flags)
+    if not missing:
+        return
+    if not configure:
+        raise ValueError(
+            f"Keyspace notifications are not enabled (notify-keyspace-events is '{flags}'); "
+            "set it to at least 'EA' or pass configure_notifications"
+        )
+    await client.config_set("notify-keyspace-events", flags + missing)
+
+
+class BuildTimeoutError(Exception):
+    """Raised when the initial SCAN of a KeyIndex does not finish within its build budget."""
+
+
+class KeyIndex:
+    """A SortedKeyIndex kept current from keyevent notifications for one connection.
+
+    The notification subscription is opened before the initial SCAN and events
+    arriving during the scan are replayed afterwards, so nothing is missed.
+    A DBSIZE check catches what notifications can't report (FLUSHDB) and
+    triggers a rebuild, as does losing the subscription. The SCAN is the
+    adaptive one (see ScanState); if it outlasts build_budget the index stops
+    with status "failed" rather than rebuilding in a loop.
+    """
+
+    def __init__(self, key: PoolKey, verify_interval: float = DEFAULT_VERIFY_INTERVAL,
+                 build_budget: Optional[float] = DEFAULT_BUILD_BUDGET):
+        self.key = key
+        self.verify_interval = verify_interval
+        self.build_budget = build_budget
+        self.index: Optional[SortedKeyIndex] = None
+        self.status = "stopped"
+        self.error: Optional[str] = None
+        self.built_at: Optional[float] = None
+        self.build_seconds: Optional[float] = None
+        self.events_applied = 0
+        self.rebuilds = 0
+        self._pending: Optional[List[Tuple[str, str]]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.status == "ready"
+
+    def _redis(self) -> redis.asyncio.Redis:
+        return redis.asyncio.Redis(connection_pool=async_registry.get_pool(*self.key))
+
+    def _client(self) -> AsyncRedisClient:
+        return AsyncRedisClient(connection_pool=async_registry.get_pool(*self.key))
+
+    def _apply(self, event: str, key: str):
+        if event in REMOVE_EVENTS:
+            self.index.discard(key)
+        else:
+            self.index.add(key)
+        self.events_applied += 1
+
+    async def _listen(self, pubsub):
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            if message is None or message["type"] != "pmessage":
+                continue
+            event = message["channel"].rsplit("__:", 1)[-1]
+            if self._pending is not None:
+                self._pending.append((event, message["data"]))
+            elif self.index is not None:
+                self._apply(event, message["data"])
+
+    async def _build(self):
+        self.status = "building"
+        started = time.monotonic()
+        self._pending = []
+        keys: List[str] = []
+        client = self._client()
+        scan = client.new_scan(time_budget=self.build_budget)
+        async for batch in client.iter_scan(scan):
+            keys.extend(batch)
+        if not scan.complete:
+            raise BuildTimeoutError(
+                f"The initial SCAN was stopped after {self.build_budget}s with {len(keys)} keys read"
+            )
+        self.index = SortedKeyIndex(keys)
+        pending, self._pending = self._pending, None
+        for event, key in pending:
+            self._apply(event, key)
+        self.built_at = time.time()
+        self.build_seconds = time.monotonic() - started
+        self.status = "ready"
+        self.error = None
+
+    async def _watch(self, listener: asyncio.Task):
+        """Return when the index has drifted from DBSIZE twice in a row; raise if the listener dies."""
+        drifted = False
+        while True:
+            done, _ = await asyncio.wait({listener}, timeout=self.verify_interval)
+            if done:
+                listener.result()
+                raise redis.ConnectionError("Keyspace notification subscription ended")
+            size = await self._redis().dbsize()
+            if size == len(self.index):
+                drifted = False
+            elif drifted:
+                return
+            else:
+                drifted = True
+
+    async def _run(self):
+        db = self.key.db
+        while True:
+            pubsub = self._redis().pubsub()
+            listener = None
+            try:
+                await pubsub.psubscribe(f"__keyevent@{db}__:*")
+                listener = asyncio.create_task(self._listen(pubsub))
+                await self._build()
+                await self._watch(listener)
+                self.rebuilds += 1
+            except asyncio.CancelledError:
+                raise
+            except BuildTimeoutError as e:
+                self.status = "failed"
+                self.error = str(e)
+                return
+            except Exception as e:
+                self.status = "reconnecting"
+                self.error = str(e)
+                await asyncio.sleep(RECONNECT_DELAY)
+                self.rebuilds += 1
+            finally:
+                self._pending = None
+                if listener is not None:
+                    listener.cancel()
+                await pubsub.aclose()
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self.status = "building"
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.index = None
+        self.status = "stopped"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "error": self.error,
+            "keys": len(self.index) if self.index is not None else None,
+            "built_at": self.built_at,
+            "build_seconds": self.build_seconds,
+            "events_applied": self.events_applied,
+            "rebuilds": self.rebuilds,
+        }
+
+
+class KeyIndexManager:
+    """Opt-in key indexes, at most one per Redis connection."""
+
+    def __init__(self):
+        self._indexes: Dict[PoolKey, KeyIndex] = {}
+
+    async def start(self, host: str = "localhost", port: int = 6379, db: int = 0,
+                    password: Optional[str] = None, configure: bool = False) -> KeyIndex:
+        key = PoolKey(host, port, db, password)
+        await ensure_notifications(redis.asyncio.Redis(connection_pool=async_registry.get_pool(*key)), configure)
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._indexes[key] = KeyIndex(key)
+        index.start()
+        return index
+
+    def get(self, host: str = "localhost", port: int = 6379, db: int = 0,
+            password: Optional[str] = None) -> Optional[KeyIndex]:
+        return self._indexes.get(PoolKey(host, port, db, password))
+
+    def ready(self, host: str = "localhost", port: int = 6379, db: int = 0,
+              password: Optional[str] = None) -> Optional[SortedKeyIndex]:
+        """The sorted index for a connection if it is built and current, else None."""
+        index = self.get(host, port, db, password)
+        return index.index if index is not None and index.ready else None
+
+    async def stop(self, host: str = "localhost", port: int = 6379, db: int = 0,
+                   password: Optional[str] = None) -> Optional[KeyIndex]:
+        index = self._indexes.pop(PoolKey(host, port, db, password), None)
+        if index is not None:
+            await index.stop()
+        return index
+
+    async def stop_all(self):
+        for index in list(self._indexes.values()):
+            await index.stop()
+        self._indexes.clear()
+
+
+# Shared key indexes used by the API process
+key_indexes = KeyIndexManager()
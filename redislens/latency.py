@@ -0,0 +1,276 @@
+import asyncio
+import os
+import re
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+import redis
+import redis.asyncio
+
+from .async_redis_client import AsyncRedisClient
+from .connection_pool import PoolKey, async_registry
+
+DEFAULT_LATENCY_INTERVAL = float(os.environ.get("REDISLENS_LATENCY_INTERVAL", "10"))
+# Slowlog entries kept per connection across polls
+DEFAULT_SLOWLOG_HISTORY = int(os.environ.get("REDISLENS_SLOWLOG_HISTORY", "10000"))
+# Entries read per SLOWLOG GET; the server keeps slowlog-max-len (128 by default)
+DEFAULT_SLOWLOG_FETCH = 1024
+# Points kept per LATENCY HISTORY event (Redis itself keeps 160)
+DEFAULT_EVENT_HISTORY = 1800
+# Collectors stop polling when nobody has read them for this long
+DEFAULT_LATENCY_IDLE_TIMEOUT = 3600
+
+# Key segments that identify one object rather than a kind of key
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8,}|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+# Commands whose first argument is not a key
+_KEYLESS_COMMANDS = {
+    "auth", "client", "cluster", "command", "config", "debug", "echo", "eval", "evalsha", "fcall",
+    "flushall", "flushdb", "function", "info", "keys", "latency", "memory", "module", "monitor",
+    "object", "ping", "psubscribe", "publish", "scan", "script", "select", "slowlog", "subscribe",
+    "xinfo", "xread", "xreadgroup",
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of values (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def key_pattern(key: str, separator: str = ":") -> str:
+    """Replace the id-like segments of a key (numbers, hex, UUIDs) with '*'."""
+    return separator.join("*" if _ID_SEGMENT.match(segment) else segment for segment in key.split(separator))
+
+
+def _text(value: Any) -> str:
+    return value.decode(errors="replace") if isinstance(value, bytes) else str(value)
+
+
+def parse_slowlog(reply: List[Any]) -> List[Dict[str, Any]]:
+    """Turn a raw SLOWLOG GET reply into entries with the command name and key pattern."""
+    entries = []
+    for item in reply:
+        # Redis Enterprise inserts the complexity before the arguments
+        args = item[3] if isinstance(item[3], list) else item[4]
+        args = [_text(arg) for arg in args]
+        name = args[0].lower() if args else ""
+        key = args[1] if len(args) > 1 and name not in _KEYLESS_COMMANDS else None
+        entries.append({
+            "id": int(item[0]),
+            "start_time": int(item[1]),
+            "duration_us": int(item[2]),
+            "command": name,
+            "key_pattern": key_pattern(key) if key is not None else None,
+            "args": " ".join(args)[:200],
+        })
+    return entries
+
+
+def parse_latency_latest(reply: List[Any]) -> Dict[str, Dict[str, int]]:
+    """LATENCY LATEST as {event: {"time", "latest_ms", "max_ms"}}."""
+    return {
+        _text(item[0]): {"time": int(item[1]), "latest_ms": int(item[2]), "max_ms": int(item[3])}
+        for item in reply
+    }
+
+
+def summarize_durations(durations: List[float]) -> Dict[str, Any]:
+    return {
+        "count": len(durations),
+        "total_us": sum(durations),
+        "p50_us": percentile(durations, 50),
+        "p90_us": percentile(durations, 90),
+        "p99_us": percentile(durations, 99),
+        "max_us": max(durations) if durations else 0,
+    }
+
+
+def group_slowlog(entries: Iterable[Dict[str, Any]], by: Tuple[str, ...], top: int = 20) -> List[Dict[str, Any]]:
+    """Group entries by the given fields with duration percentiles, costliest groups first."""
+    groups: Dict[Tuple[Any, ...], List[float]] = {}
+    for entry in entries:
+        groups.setdefault(tuple(entry[field] for field in by), []).append(entry["duration_us"])
+    rows = [
+        {**dict(zip(by, values)), **summarize_durations(durations)}
+        for values, durations in groups.items()
+    ]
+    rows.sort(key=lambda row: row["total_us"], reverse=True)
+    return rows[:top]
+
+
+class SlowlogStore:
+    """Bounded, de-duplicated slowlog history of one server.
+
+    Redis only keeps the newest slowlog-max-len entries, so polls overlap.
+    Entries are de-duplicated by (id, start_time): ids restart from 0 after
+    a server restart, the pair does not.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_SLOWLOG_HISTORY):
+        self.entries: Deque[Dict[str, Any]] = deque(maxlen=max_entries)
+        self._seen: Set[Tuple[int, int]] = set()
+
+    def add(self, entries: List[Dict[str, Any]]) -> int:
+        """Store the entries not seen before, oldest first; returns how many were new."""
+        added = 0
+        for entry in sorted(entries, key=lambda entry: (entry["start_time"], entry["id"])):
+            identity = (entry["id"], entry["start_time"])
+            if identity in self._seen:
+                continue
+            if len(self.entries) == self.entries.maxlen:
+                oldest = self.entries[0]
+                self._seen.discard((oldest["id"], oldest["start_time"]))
+            self.entries.append(entry)
+            self._seen.add(identity)
+            added += 1
+        return added
+
+    def since(self, cutoff: float) -> List[Dict[str, Any]]:
+        return [entry for entry in self.entries if entry["start_time"] >= cutoff]
+
+
+class LatencySampler:
+    """Poll SLOWLOG GET, LATENCY LATEST and LATENCY HISTORY for one Redis connection."""
+
+    def __init__(self, key: PoolKey, interval: float = DEFAULT_LATENCY_INTERVAL,
+                 history_size: int = DEFAULT_SLOWLOG_HISTORY,
+                 idle_timeout: float = DEFAULT_LATENCY_IDLE_TIMEOUT):
+        self.key = key
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+        self.slowlog = SlowlogStore(history_size)
+        self.latest: Dict[str, Dict[str, int]] = {}
+        self.events: Dict[str, Deque[Tuple[int, int]]] = {}
+        self.latency_monitor = True
+        self.last_error: Optional[str] = None
+        self.sampled_at: Optional[float] = None
+        self.last_read = time.monotonic()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def _merge_history(self, event: str, points: List[Any]):
+        history = self.events.setdefault(event, deque(maxlen=DEFAULT_EVENT_HISTORY))
+        last = history[-1][0] if history else 0
+        for timestamp, latency in sorted((int(point[0]), int(point[1])) for point in points):
+            if timestamp > last:
+                history.append((timestamp, latency))
+
+    async def sample_once(self):
+        """Read the slowlog and the latency monitor once and merge them into the stores."""
+        client = AsyncRedisClient(connection_pool=async_registry.get_pool(*self.key))
+        try:
+            self.slowlog.add(parse_slowlog(await client.get_slowlog(DEFAULT_SLOWLOG_FETCH)))
+            try:
+                self.latest = parse_latency_latest(await client.get_latency_latest())
+                histories = await client.get_latency_histories(list(self.latest))
+            except redis.ResponseError:
+                # LATENCY is missing on old servers and renamed away on some managed ones
+                self.latency_monitor = False
+            else:
+                self.latency_monitor = True
+                for event, points in histories.items():
+                    self._merge_history(event, points)
+        except redis.RedisError as e:
+            self.last_error = str(e)
+            return
+        self.sampled_at = time.time()
+        self.last_error = None
+
+    async def _run(self):
+        while time.monotonic() - self.last_read < self.idle_timeout:
+            await asyncio.sleep(self.interval)
+            await self.sample_once()
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def report(self, seconds: float = 3600, top: int = 20, recent: int = 50) -> Dict[str, Any]:
+        """Summarize the last seconds: slowlog groups with percentiles and latency events."""
+        self.last_read = time.monotonic()
+        cutoff = time.time() - seconds
+        entries = self.slowlog.since(cutoff)
+        events = {}
+        for event, history in self.events.items():
+            points = [point for point in history if point[0] >= cutoff]
+            latencies = [latency for _, latency in points]
+            events[event] = {
+                **self.latest.get(event, {}),
+                "spikes": len(points),
+                "p50_ms": percentile(latencies, 50),
+                "p99_ms": percentile(latencies, 99),
+                "history": [list(point) for point in points],
+            }
+        return {
+            "window": seconds,
+            "interval": self.interval,
+            "sampled_at": self.sampled_at,
+            "error": self.last_error,
+            "slowlog": {
+                "entries": len(entries),
+                "stored": len(self.slowlog.entries),
+                "overall": summarize_durations([entry["duration_us"] for entry in entries]),
+                "by_command": group_slowlog(entries, ("command",), top),
+                "by_pattern": group_slowlog(entries, ("command", "key_pattern"), top),
+                "recent": sorted(entries, key=lambda entry: entry["start_time"], reverse=True)[:recent],
+            },
+            "latency_monitor": self.latency_monitor,
+            "events": events,
+        }
+
+
+class LatencyCollector:
+    """One shared latency sampler per Redis connection, started on first read."""
+
+    def __init__(self, interval: float = DEFAULT_LATENCY_INTERVAL,
+                 history_size: int = DEFAULT_SLOWLOG_HISTORY):
+        self.interval = interval
+        self.history_size = history_size
+        self._samplers: Dict[PoolKey, LatencySampler] = {}
+
+    async def get_sampler(self, host: str = "localhost", port: int = 6379, db: int = 0,
+                          password: Optional[str] = None) -> LatencySampler:
+        """Get the sampler for a server, (re)starting it if it went idle.
+
+        The slowlog and latency monitor are server-wide, so db is ignored.
+        """
+        key = PoolKey(host, port, 0, password)
+        # Forget samplers that stopped polling, so every server ever entered doesn't keep its history
+        for sampler_key, idle in list(self._samplers.items()):
+            if sampler_key != key and not idle.running:
+                del self._samplers[sampler_key]
+        sampler = self._samplers.get(key)
+        if sampler is None:
+            sampler = self._samplers[key] = LatencySampler(key, self.interval, self.history_size)
+        if not sampler.running:
+            sampler.last_read = time.monotonic()
+            await sampler.sample_once()
+            sampler.start()
+        return sampler
+
+    async def stop(self):
+        for sampler in list(self._samplers.values()):
+            await sampler.stop()
+        self._samplers.clear()
+
+
+# Shared latency collector used by the API process
+latency_collector = LatencyCollector()
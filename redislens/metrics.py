@@ -0,0 +1,302 @@
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+import redis
+import redis.asyncio
+from redis.exceptions import RedisClusterException
+
+from .cluster_client import AsyncClusterClient, async_cluster_registry
+from .connection_pool import PoolKey, async_registry
+
+DEFAULT_SAMPLE_INTERVAL = float(os.environ.get("REDISLENS_METRICS_INTERVAL", "2"))
+# One hour of history at the default interval
+DEFAULT_HISTORY_SIZE = int(os.environ.get("REDISLENS_METRICS_HISTORY", "1800"))
+# Samplers stop polling when nobody has read their series for this long
+DEFAULT_SAMPLER_IDLE_TIMEOUT = 300
+
+# Numeric series extracted from every INFO sample
+SERIES = [
+    "ops_per_sec",
+    "used_memory",
+    "used_memory_rss",
+    "connected_clients",
+    "blocked_clients",
+    "hit_ratio",
+    "evicted_per_sec",
+    "expired_per_sec",
+    "input_kbps",
+    "output_kbps",
+    "keys",
+]
+
+
+def _number(info: Dict[str, Any], field: str) -> float:
+    try:
+        return float(info.get(field, 0) or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def parse_info_sample(info: Dict[str, Any], previous: Optional[Tuple[float, Dict[str, Any]]],
+                      now: float) -> Dict[str, float]:
+    """Turn one INFO reply into a point of every series in SERIES.
+
+    Counters (hits/misses, evictions, expirations) are converted to rates or
+    ratios over the interval since the previous sample when there is one.
+    """
+    values = {
+        "ops_per_sec": _number(info, "instantaneous_ops_per_sec"),
+        "used_memory": _number(info, "used_memory"),
+        "used_memory_rss": _number(info, "used_memory_rss"),
+        "connected_clients": _number(info, "connected_clients"),
+        "blocked_clients": _number(info, "blocked_clients"),
+        "input_kbps": _number(info, "instantaneous_input_kbps"),
+        "output_kbps": _number(info, "instantaneous_output_kbps"),
+        # Keyspace lines are parsed by redis-py into {"db0": {"keys": ...}, ...}
+        "keys": float(sum(
+            value.get("keys", 0) for name, value in info.items()
+            if name.startswith("db") and isinstance(value, dict)
+        )),
+    }
+
+    hits = _number(info, "keyspace_hits")
+    misses = _number(info, "keyspace_misses")
+    evicted = _number(info, "evicted_keys")
+    expired = _number(info, "expired_keys")
+    if previous is not None:
+        previous_time, previous_info = previous
+        elapsed = max(now - previous_time, 1e-6)
+        hits_delta = hits - _number(previous_info, "keyspace_hits")
+        misses_delta = misses - _number(previous_info, "keyspace_misses")
+        # Counters go backwards after a restart or CONFIG RESETSTAT; keep the totals then
+        if hits_delta >= 0 and misses_delta >= 0:
+            hits, misses = hits_delta, misses_delta
+        values["evicted_per_sec"] = max(0.0, evicted - _number(previous_info, "evicted_keys")) / elapsed
+        values["expired_per_sec"] = max(0.0, expired - _number(previous_info, "expired_keys")) / elapsed
+    else:
+        values["evicted_per_sec"] = 0.0
+        values["expired_per_sec"] = 0.0
+    lookups = hits + misses
+    values["hit_ratio"] = hits / lookups if lookups > 0 else 0.0
+    return values
+
+
+def downsample(samples: List[Tuple[float, Dict[str, float]]], points: int,
+               fields: List[str]) -> Dict[str, List[List[float]]]:
+    """Average consecutive samples into at most points buckets per field.
+
+    Each bucket is stamped with the time of its last sample.
+    """
+    series: Dict[str, List[List[float]]] = {field: [] for field in fields}
+    if not samples or points < 1:
+        return series
+    size = math.ceil(len(samples) / points)
+    for start in range(0, len(samples), size):
+        bucket = samples[start:start + size]
+        timestamp = bucket[-1][0]
+        for field in fields:
+            values = [sample[field] for _, sample in bucket if field in sample]
+            if values:
+                series[field].append([timestamp, sum(values) / len(values)])
+    return series
+
+
+def info_delta(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """INFO fields whose value differs from the previous reply."""
+    return {field: value for field, value in current.items() if previous.get(field) != value}
+
+
+class Subscription:
+    """A push subscriber's mailbox of coalesced updates.
+
+    The sampler never waits for a subscriber: new deltas are merged into the
+    pending update, so a slow consumer gets fewer, larger updates and its
+    buffer is bounded by the number of INFO fields rather than by time.
+    """
+
+    def __init__(self):
+        self._info: Dict[str, Any] = {}
+        self._metrics: Optional[Dict[str, float]] = None
+        self._time: Optional[float] = None
+        self._error: Optional[str] = None
+        self._event = asyncio.Event()
+        self.coalesced = 0
+
+    def push(self, now: float, delta: Dict[str, Any], metrics: Optional[Dict[str, float]] = None,
+             error: Optional[str] = None):
+        if self._event.is_set():
+            self.coalesced += 1
+        self._info.update(delta)
+        if metrics is not None:
+            self._metrics = metrics
+        self._time = now
+        self._error = error
+        self._event.set()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Wait for the next update; None if nothing arrived within timeout."""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        update = {
+            "time": self._time,
+            "info": self._info,
+            "metrics": self._metrics,
+            "error": self._error,
+            "coalesced": self.coalesced,
+        }
+        self._info = {}
+        self._metrics = None
+        self.coalesced = 0
+        self._event.clear()
+        return update
+
+
+class MetricsSampler:
+    """Poll INFO for one Redis connection and keep the parsed series in a ring buffer."""
+
+    def __init__(self, key: PoolKey, interval: float = DEFAULT_SAMPLE_INTERVAL,
+                 history_size: int = DEFAULT_HISTORY_SIZE,
+                 idle_timeout: float = DEFAULT_SAMPLER_IDLE_TIMEOUT, cluster: bool = False):
+        self.key = key
+        self.cluster = cluster
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+        self.samples: Deque[Tuple[float, Dict[str, float]]] = deque(maxlen=history_size)
+        self.latest_info: Dict[str, Any] = {}
+        self.latest_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.last_read = time.monotonic()
+        self._previous: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._subscribers: Set[Subscription] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _fetch_info(self) -> Dict[str, Any]:
+        if self.cluster:
+            cluster = await async_cluster_registry.get(self.key.host, self.key.port, self.key.password)
+            return await AsyncClusterClient(cluster).get_info()
+        pool = async_registry.get_pool(*self.key)
+        return await redis.asyncio.Redis(connection_pool=pool).info()
+
+    async def sample_once(self):
+        """Run INFO once (aggregated over the primaries in cluster mode) and append a point to every series."""
+        try:
+            info = await self._fetch_info()
+        except (redis.RedisError, RedisClusterException) as e:
+            # Cluster topology errors (e.g. no reachable seed node) are not RedisErrors
+            self.last_error = str(e)
+            for subscription in self._subscribers:
+                subscription.push(time.time(), {}, error=self.last_error)
+            return
+        now = time.time()
+        point = parse_info_sample(info, self._previous, now)
+        self.samples.append((now, point))
+        if self._subscribers:
+            delta = info_delta(self.latest_info, info)
+            for subscription in self._subscribers:
+                subscription.push(now, delta, point)
+        self._previous = (now, info)
+        self.latest_info = info
+        self.latest_at = now
+        self.last_error = None
+
+    def subscribe(self) -> Subscription:
+        """Register a push subscriber, primed with the full latest INFO."""
+        subscription = Subscription()
+        if self.latest_at is not None:
+            latest_point = self.samples[-1][1] if self.samples else None
+            subscription.push(self.latest_at, self.latest_info, latest_point, self.last_error)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscribers.discard(subscription)
+        self.last_read = time.monotonic()
+
+    async def _run(self):
+        # Keep polling while anyone is subscribed or has read the series recently
+        while self._subscribers or time.monotonic() - self.last_read < self.idle_timeout:
+            await asyncio.sleep(self.interval)
+            await self.sample_once()
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def window(self, seconds: float = 300, points: int = 120,
+               fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Get the downsampled series for the last seconds of history."""
+        self.last_read = time.monotonic()
+        cutoff = time.time() - seconds
+        samples = [sample for sample in self.samples if sample[0] >= cutoff]
+        return {
+            "interval": self.interval,
+            "latest": self.latest_info,
+            "latest_at": self.latest_at,
+            "error": self.last_error,
+            "series": downsample(samples, points, fields or SERIES),
+        }
+
+
+class MetricsCollector:
+    """One shared sampler per Redis connection, started on first read."""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL,
+                 history_size: int = DEFAULT_HISTORY_SIZE):
+        self.interval = interval
+        self.history_size = history_size
+        self._samplers: Dict[Tuple[PoolKey, bool], MetricsSampler] = {}
+
+    async def get_sampler(self, host: str = "localhost", port: int = 6379, db: int = 0,
+                          password: Optional[str] = None, cluster: bool = False) -> MetricsSampler:
+        """Get the sampler for a connection, (re)starting it if it went idle."""
+        key = PoolKey(host, port, db, password)
+        self._drop_idle(keep=(key, cluster))
+        sampler = self._samplers.get((key, cluster))
+        if sampler is None:
+            sampler = self._samplers[(key, cluster)] = MetricsSampler(
+                key, self.interval, self.history_size, cluster=cluster
+            )
+        if not sampler.running:
+            sampler.last_read = time.monotonic()
+            # Take the first point inline so a new viewer never sees an empty dashboard
+            await sampler.sample_once()
+            sampler.start()
+        return sampler
+
+    def _drop_idle(self, keep: Tuple[PoolKey, bool]):
+        """Forget samplers that stopped polling and have no subscribers, with their history.
+
+        Otherwise every connection ever typed in keeps a full ring buffer for
+        the life of the process.
+        """
+        for sampler_key, sampler in list(self._samplers.items()):
+            if sampler_key != keep and not sampler.running and not sampler._subscribers:
+                del self._samplers[sampler_key]
+
+    async def stop(self):
+        for sampler in list(self._samplers.values()):
+            await sampler.stop()
+        self._samplers.clear()
+
+
+# Shared collector used by the API process
+collector = MetricsCollector()
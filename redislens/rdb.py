@@ -0,0 +1,606 @@
+"""Offline analysis of RDB snapshot files.
+
+The file is memory-mapped and parsed in a single pass, one key at a time,
+without loading values: collection elements are skipped over and only the
+headers of compact encodings (listpack, ziplist, intset) are decoded to get
+element counts. Memory stays bounded by the aggregates, whatever the size
+of the dump, and the live server is never contacted.
+"""
+
+import json
+import mmap
+import os
+import struct
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from .analysis import DEFAULT_MAX_PREFIXES, MemoryBreakdown, _TopK
+
+# Opcodes (see rdb.h)
+OPCODE_SLOT_INFO = 0xF4
+OPCODE_FUNCTION2 = 0xF5
+OPCODE_FUNCTION_PRE_GA = 0xF6
+OPCODE_MODULE_AUX = 0xF7
+OPCODE_IDLE = 0xF8
+OPCODE_FREQ = 0xF9
+OPCODE_AUX = 0xFA
+OPCODE_RESIZEDB = 0xFB
+OPCODE_EXPIRETIME_MS = 0xFC
+OPCODE_EXPIRETIME = 0xFD
+OPCODE_SELECTDB = 0xFE
+OPCODE_EOF = 0xFF
+
+# Value type ids -> (type, encoding)
+TYPES = {
+    0: ("string", None),
+    1: ("list", "linkedlist"),
+    2: ("set", "hashtable"),
+    3: ("zset", "skiplist"),
+    4: ("hash", "hashtable"),
+    5: ("zset", "skiplist"),
+    7: ("module", "module"),
+    9: ("hash", "zipmap"),
+    10: ("list", "ziplist"),
+    11: ("set", "intset"),
+    12: ("zset", "ziplist"),
+    13: ("hash", "ziplist"),
+    14: ("list", "quicklist"),
+    15: ("stream", "stream"),
+    16: ("hash", "listpack"),
+    17: ("zset", "listpack"),
+    18: ("list", "quicklist"),
+    19: ("stream", "stream"),
+    20: ("set", "listpack"),
+    21: ("stream", "stream"),
+    22: ("hash", "hashtable"),
+    23: ("hash", "listpackex"),
+    24: ("hash", "hashtable"),
+    25: ("hash", "listpackex"),
+}
+
+MODULE_OPCODE_EOF = 0
+MODULE_CHARSET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+# Approximate allocation sizes of Redis 7 on 64-bit builds
+DICT_ENTRY = 24
+ROBJ = 16
+LIST_NODE = 24
+QUICKLIST = 40
+QUICKLIST_NODE = 32
+SKIPLIST_NODE = 56
+STREAM_NODE = 24
+# Strings up to this length are stored in the object allocation (embstr)
+EMBSTR_LIMIT = 44
+
+ZIPLIST_INT_SIZES = {0xC0: 2, 0xD0: 4, 0xE0: 8, 0xF0: 3, 0xFE: 1}
+LISTPACK_INT_SIZES = {0xF1: 3, 0xF2: 4, 0xF3: 5, 0xF4: 9}
+
+
+class RdbError(ValueError):
+    """The file is not a valid (or not a supported) RDB file."""
+
+
+def lzf_decompress(data: bytes, expected: int) -> bytes:
+    """Decompress an LZF block as written by Redis."""
+    out = bytearray()
+    position = 0
+    while position < len(data):
+        control = data[position]
+        position += 1
+        if control < 32:
+            out += data[position:position + control + 1]
+            position += control + 1
+            continue
+        length = control >> 5
+        if length == 7:
+            length += data[position]
+            position += 1
+        length += 2
+        ref = len(out) - ((control & 0x1F) << 8) - data[position] - 1
+        position += 1
+        if ref < 0:
+            raise RdbError("Corrupt LZF data")
+        if ref + length <= len(out):
+            out += out[ref:ref + length]
+        else:
+            # Overlapping back-reference: copy byte by byte
+            for offset in range(length):
+                out.append(out[ref + offset])
+    if len(out) != expected:
+        raise RdbError("Corrupt LZF data")
+    return bytes(out)
+
+
+def sds_size(length: int) -> int:
+    """Allocation size of an sds string of length bytes (header + data + NUL, 8-byte aligned)."""
+    if length < 1 << 8:
+        header = 3
+    elif length < 1 << 16:
+        header = 5
+    elif length < 1 << 32:
+        header = 9
+    else:
+        header = 17
+    return (header + length + 1 + 7) & ~7
+
+
+def hashtable_size(elements: int) -> int:
+    """Bucket array size of a dict holding elements entries."""
+    buckets = 4
+    while buckets < elements:
+        buckets *= 2
+    return 8 * buckets
+
+
+def ziplist_count(blob: bytes) -> int:
+    """Number of entries in a ziplist."""
+    count = struct.unpack_from("<H", blob, 8)[0]
+    if count < 0xFFFF:
+        return count
+    # The header count saturates; walk the entries
+    position = 10
+    count = 0
+    while blob[position] != 0xFF:
+        position += 1 if blob[position] < 0xFE else 5
+        encoding = blob[position]
+        if encoding >> 6 == 0:
+            position += 1 + (encoding & 0x3F)
+        elif encoding >> 6 == 1:
+            position += 2 + (((encoding & 0x3F) << 8) | blob[position + 1])
+        elif encoding >> 6 == 2:
+            position += 5 + struct.unpack_from(">I", blob, position + 1)[0]
+        else:
+            position += 1 + ZIPLIST_INT_SIZES.get(encoding, 0)
+        count += 1
+    return count
+
+
+def _backlen_size(size: int) -> int:
+    if size <= 127:
+        return 1
+    if size < 16383:
+        return 2
+    if size < 2097151:
+        return 3
+    if size < 268435455:
+        return 4
+    return 5
+
+
+def listpack_count(blob: bytes) -> int:
+    """Number of entries in a listpack."""
+    count = struct.unpack_from("<H", blob, 4)[0]
+    if count < 0xFFFF:
+        return count
+    position = 6
+    count = 0
+    while blob[position] != 0xFF:
+        encoding = blob[position]
+        if encoding < 0x80:
+            size = 1
+        elif encoding < 0xC0:
+            size = 1 + (encoding & 0x3F)
+        elif encoding < 0xE0:
+            size = 2
+        elif encoding < 0xF0:
+            size = 2 + (((encoding & 0x0F) << 8) | blob[position + 1])
+        elif encoding == 0xF0:
+            size = 5 + struct.unpack_from("<I", blob, position + 1)[0]
+        elif encoding in LISTPACK_INT_SIZES:
+            size = LISTPACK_INT_SIZES[encoding]
+        else:
+            raise RdbError(f"Corrupt listpack entry encoding {encoding:#x}")
+        position += size + _backlen_size(size)
+        count += 1
+    return count
+
+
+def module_name(module_id: int) -> str:
+    """The 9-character type name encoded in the top 54 bits of a module type id."""
+    return "".join(MODULE_CHARSET[(module_id >> (64 - 6 * (index + 1))) & 63] for index in range(9))
+
+
+class RdbParser:
+    """Single-pass reader over a buffer (normally an mmap) holding an RDB file.
+
+    rows() yields one get_keys_metadata-style row per key, with the type,
+    encoding, element count, estimated in-memory size and expiry.
+    """
+
+    def __init__(self, buffer, snapshot_time: Optional[float] = None):
+        self.buffer = buffer
+        self.size = len(buffer)
+        self.position = 0
+        self.version: Optional[int] = None
+        self.aux: Dict[str, str] = {}
+        # TTLs are relative to when the snapshot was taken: the ctime aux field, else snapshot_time
+        self.snapshot_time = snapshot_time
+        self._reference_time: Optional[float] = None
+
+    # Primitive reads
+
+    def read(self, count: int) -> bytes:
+        end = self.position + count
+        if end > self.size:
+            raise RdbError("Unexpected end of file")
+        data = self.buffer[self.position:end]
+        self.position = end
+        return data
+
+    def skip(self, count: int):
+        if self.position + count > self.size:
+            raise RdbError("Unexpected end of file")
+        self.position += count
+
+    def byte(self) -> int:
+        if self.position >= self.size:
+            raise RdbError("Unexpected end of file")
+        value = self.buffer[self.position]
+        self.position += 1
+        return value
+
+    def length(self) -> Tuple[int, bool]:
+        """Read a length; the flag is set for the special string encodings."""
+        first = self.byte()
+        kind = first >> 6
+        if kind == 0:
+            return first & 0x3F, False
+        if kind == 1:
+            return ((first & 0x3F) << 8) | self.byte(), False
+        if kind == 3:
+            return first & 0x3F, True
+        if first == 0x80:
+            return struct.unpack(">I", self.read(4))[0], False
+        if first == 0x81:
+            return struct.unpack(">Q", self.read(8))[0], False
+        raise RdbError(f"Invalid length encoding {first:#x}")
+
+    def read_length(self) -> int:
+        value, encoded = self.length()
+        if encoded:
+            raise RdbError("Expected a length, found an encoded string")
+        return value
+
+    def _int_string(self, encoding: int) -> bytes:
+        if encoding == 0:
+            return str(struct.unpack("<b", self.read(1))[0]).encode()
+        if encoding == 1:
+            return str(struct.unpack("<h", self.read(2))[0]).encode()
+        if encoding == 2:
+            return str(struct.unpack("<i", self.read(4))[0]).encode()
+        raise RdbError(f"Invalid string encoding {encoding}")
+
+    def string(self) -> bytes:
+        """Read a string, decompressing it if needed."""
+        value, encoded = self.length()
+        if not encoded:
+            return self.read(value)
+        if value == 3:
+            compressed = self.read_length()
+            uncompressed = self.read_length()
+            return lzf_decompress(self.read(compressed), uncompressed)
+        return self._int_string(value)
+
+    def skip_string(self) -> Tuple[int, bool]:
+        """Skip a string without copying it; returns its length and whether it is an integer."""
+        value, encoded = self.length()
+        if not encoded:
+            self.skip(value)
+            return value, False
+        if value == 3:
+            compressed = self.read_length()
+            uncompressed = self.read_length()
+            self.skip(compressed)
+            return uncompressed, False
+        return len(self._int_string(value)), True
+
+    def _skip_module_value(self):
+        """Skip the opcode-tagged payload of a module value or module aux field."""
+        while True:
+            opcode = self.read_length()
+            if opcode == MODULE_OPCODE_EOF:
+                return
+            if opcode in (1, 2):
+                self.read_length()
+            elif opcode == 3:
+                self.skip(4)
+            elif opcode == 4:
+                self.skip(8)
+            elif opcode == 5:
+                self.skip_string()
+            else:
+                raise RdbError(f"Invalid module opcode {opcode}")
+
+    # Values
+
+    def _elements(self, count: int, per_element: Callable[[], int]) -> int:
+        return sum(per_element() for _ in range(count))
+
+    def _sds_element(self) -> int:
+        return sds_size(self.skip_string()[0])
+
+    def _zset_element(self, binary_score: bool) -> int:
+        size = sds_size(self.skip_string()[0])
+        if binary_score:
+            self.skip(8)
+        else:
+            score_length = self.byte()
+            if score_length < 253:
+                self.skip(score_length)
+        return size
+
+    def value(self, type_id: int) -> Tuple[str, str, Optional[int], int]:
+        """Read the value of type_id; returns type, encoding, element count and estimated bytes."""
+        if type_id not in TYPES:
+            raise RdbError(f"Unsupported value type {type_id} at offset {self.position}")
+        key_type, encoding = TYPES[type_id]
+
+        if type_id == 0:
+            length, is_int = self.skip_string()
+            if is_int:
+                return key_type, "int", length, 0
+            if length <= EMBSTR_LIMIT:
+                return key_type, "embstr", length, length + 4
+            return key_type, "raw", length, sds_size(length)
+
+        if type_id == 1:
+            count = self.read_length()
+            return key_type, encoding, count, self._elements(count, lambda: LIST_NODE + ROBJ + self._sds_element())
+        if type_id == 2:
+            count = self.read_length()
+            size = self._elements(count, lambda: DICT_ENTRY + self._sds_element())
+            return key_type, encoding, count, size + hashtable_size(count)
+        if type_id in (3, 5):
+            count = self.read_length()
+            size = self._elements(count, lambda: DICT_ENTRY + SKIPLIST_NODE + self._zset_element(type_id == 5))
+            return key_type, encoding, count, size + hashtable_size(count)
+        if type_id in (4, 22, 24):
+            if type_id == 24:
+                self.skip(8)  # minimum field expiry
+            count = self.read_length()
+
+            def field() -> int:
+                if type_id != 4:
+                    self.read_length()  # field TTL
+                return DICT_ENTRY + self._sds_element() + self._sds_element()
+
+            return key_type, encoding, count, self._elements(count, field) + hashtable_size(count)
+
+        if type_id == 7:
+            module_id = self.read_length()
+            start = self.position
+            self._skip_module_value()
+            return module_name(module_id), encoding, None, self.position - start
+
+        if type_id in (14, 18):
+            nodes = self.read_length()
+            count = 0
+            size = QUICKLIST
+            for _ in range(nodes):
+                if type_id == 18 and self.read_length() == 1:
+                    # A plain node holds one large element as is
+                    size += QUICKLIST_NODE + self.skip_string()[0]
+                    count += 1
+                    continue
+                blob = self.string()
+                size += QUICKLIST_NODE + len(blob)
+                count += ziplist_count(blob) if type_id == 14 else listpack_count(blob)
+            return key_type, encoding, count, size
+
+        if type_id in (15, 19, 21):
+            return self._stream(type_id)
+
+        if type_id in (23, 25):
+            if type_id == 25:
+                self.skip(8)
+            blob = self.string()
+            return key_type, encoding, listpack_count(blob) // 3, len(blob)
+
+        blob = self.string()
+        if type_id == 9:
+            count = blob[0] if blob and blob[0] < 254 else None
+            return key_type, encoding, count, len(blob)
+        if type_id == 11:
+            return key_type, encoding, struct.unpack_from("<I", blob, 4)[0], len(blob)
+        count = ziplist_count(blob) if type_id in (10, 12, 13) else listpack_count(blob)
+        if key_type in ("hash", "zset"):
+            count //= 2
+        return key_type, encoding, count, len(blob)
+
+    def _stream(self, type_id: int) -> Tuple[str, str, Optional[int], int]:
+        nodes = self.read_length()
+        size = 0
+        for _ in range(nodes):
+            self.skip_string()  # master entry id
+            size += STREAM_NODE + self.skip_string()[0]
+        length = self.read_length()
+        self.read_length()
+        self.read_length()  # last id
+        if type_id >= 19:
+            for _ in range(5):  # first id, max deleted id, entries added
+                self.read_length()
+        groups = self.read_length()
+        for _ in range(groups):
+            self.skip_string()
+            self.read_length()
+            self.read_length()  # last delivered id
+            if type_id >= 19:
+                self.read_length()  # entries read
+            for _ in range(self.read_length()):
+                self.skip(16 + 8)  # entry id, delivery time
+                self.read_length()  # delivery count
+            consumers = self.read_length()
+            for _ in range(consumers):
+                self.skip_string()
+                self.skip(16 if type_id == 21 else 8)  # seen (and active) time
+                self.skip(self.read_length() * 16)
+        return "stream", "stream", length, size
+
+    # Keys
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        header = self.read(9)
+        if header[:5] != b"REDIS" or not header[5:].isdigit():
+            raise RdbError("Not an RDB file")
+        self.version = int(header[5:])
+
+        db = 0
+        expiry: Optional[int] = None
+        while True:
+            opcode = self.byte()
+            if opcode == OPCODE_EOF:
+                return
+            if opcode == OPCODE_SELECTDB:
+                db = self.read_length()
+            elif opcode == OPCODE_RESIZEDB:
+                self.read_length()
+                self.read_length()
+            elif opcode == OPCODE_AUX:
+                name = self.string().decode(errors="replace")
+                self.aux[name] = self.string().decode(errors="replace")
+            elif opcode == OPCODE_EXPIRETIME_MS:
+                expiry = struct.unpack("<q", self.read(8))[0]
+            elif opcode == OPCODE_EXPIRETIME:
+                expiry = struct.unpack("<i", self.read(4))[0] * 1000
+            elif opcode == OPCODE_IDLE:
+                self.read_length()
+            elif opcode == OPCODE_FREQ:
+                self.byte()
+            elif opcode == OPCODE_SLOT_INFO:
+                for _ in range(3):
+                    self.read_length()
+            elif opcode == OPCODE_MODULE_AUX:
+                self.read_length()  # module id
+                self._skip_module_value()
+            elif opcode == OPCODE_FUNCTION2:
+                self.skip_string()
+            elif opcode == OPCODE_FUNCTION_PRE_GA:
+                # Redis 7.0 release candidates: name, engine, optional description, code
+                self.skip_string()
+                self.skip_string()
+                if self.read_length():
+                    self.skip_string()
+                self.skip_string()
+            else:
+                start = self.position
+                key = self.string()
+                key_type, encoding, length, value_bytes = self.value(opcode)
+                yield self._row(db, key, key_type, encoding, length, value_bytes, expiry, self.position - start)
+                expiry = None
+
+    def _row(self, db: int, key: bytes, key_type: str, encoding: str, length: Optional[int],
+             value_bytes: int, expiry: Optional[int], rdb_bytes: int) -> Dict[str, Any]:
+        if self._reference_time is None:
+            self._reference_time = float(self.aux.get("ctime") or self.snapshot_time or time.time())
+        memory = DICT_ENTRY + ROBJ + sds_size(len(key)) + value_bytes
+        if expiry is not None:
+            memory += DICT_ENTRY
+            ttl = max(0, int(expiry / 1000 - self._reference_time))
+        else:
+            ttl = -1
+        return {
+            "db": db,
+            "key": key.decode(errors="backslashreplace"),
+            "exists": True,
+            "type": key_type,
+            "encoding": encoding,
+            "length": length,
+            "memory_usage": memory,
+            "expiry": expiry,
+            "ttl": ttl,
+            "rdb_bytes": rdb_bytes,
+        }
+
+
+class RdbAnalyzer:
+    """Aggregate an RDB file like KeyspaceMemoryAnalyzer aggregates a live server.
+
+    The report has the same shape as the live memory analysis (plus the
+    largest keys per type, as BigKeyDetector reports them), so the web UI
+    can display either. Memory figures are estimates from Redis' allocation
+    sizes, not MEMORY USAGE. keys_out, if given, receives one JSON row per key.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        separator: str = ":",
+        prefix_depth: int = 1,
+        max_prefixes: int = DEFAULT_MAX_PREFIXES,
+        top: int = 100,
+        top_k: int = 20,
+        keys_out: Optional[TextIO] = None,
+        progress: Optional[Callable[[int, int, int], None]] = None,
+    ):
+        self.path = path
+        self.top = top
+        self.top_k = top_k
+        self.keys_out = keys_out
+        self.progress = progress
+        self.breakdown = MemoryBreakdown(separator, prefix_depth, max_prefixes)
+        self.by_length: Dict[str, _TopK] = {}
+        self.by_memory: Dict[str, _TopK] = {}
+        self.databases: Dict[int, Dict[str, int]] = {}
+        self.elapsed = 0.0
+
+    def _top(self, groups: Dict[str, _TopK], key_type: str) -> _TopK:
+        top = groups.get(key_type)
+        if top is None:
+            top = groups[key_type] = _TopK(self.top_k)
+        return top
+
+    def _record(self, row: Dict[str, Any]):
+        self.breakdown.record(row)
+        database = self.databases.setdefault(row["db"], {"keys": 0, "expires": 0})
+        database["keys"] += 1
+        if row["expiry"] is not None:
+            database["expires"] += 1
+        if row["length"] is not None:
+            self._top(self.by_length, row["type"]).push(row["length"], row["key"])
+        self._top(self.by_memory, row["type"]).push(row["memory_usage"], row["key"])
+        if self.keys_out is not None:
+            self.keys_out.write(json.dumps(row) + "\n")
+
+    def run(self) -> Dict[str, Any]:
+        started = time.monotonic()
+        last_progress = started
+        file_size = os.path.getsize(self.path)
+        if file_size == 0:
+            raise RdbError("Empty file")
+        with open(self.path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            parser = RdbParser(buffer, snapshot_time=os.path.getmtime(self.path))
+            for row in parser.rows():
+                self._record(row)
+                if self.progress is not None and time.monotonic() - last_progress >= 1:
+                    last_progress = time.monotonic()
+                    self.progress(parser.position, file_size, self.breakdown.keys)
+            if self.progress is not None:
+                self.progress(file_size, file_size, self.breakdown.keys)
+        self.elapsed = time.monotonic() - started
+        return self.report(parser)
+
+    def report(self, parser: RdbParser) -> Dict[str, Any]:
+        keys = self.breakdown.keys
+        return {
+            "source": "rdb",
+            "file": os.path.abspath(self.path),
+            "rdb_version": parser.version,
+            "aux": parser.aux,
+            "pattern": "*",
+            "sample_rate": 1.0,
+            "totals": {
+                "scanned": keys,
+                "sampled": keys,
+                "sampled_bytes": self.breakdown.bytes,
+                "elapsed_s": round(self.elapsed, 3),
+                "keys_per_second": round(keys / self.elapsed, 1) if self.elapsed else 0.0,
+                "complete": True,
+                "estimated_keys": keys,
+                "estimated_bytes": self.breakdown.bytes,
+                "file_bytes": parser.size,
+            },
+            **self.breakdown.report(self.top),
+            "databases": [{"db": db, **counts} for db, counts in sorted(self.databases.items())],
+            "by_length": {key_type: top.items() for key_type, top in self.by_length.items()},
+            "by_memory": {key_type: top.items() for key_type, top in self.by_memory.items()},
+        }
@@ -1,9 +1,476 @@
 import redis
-from typing import Any, Dict, List, Optional, Union
+from redis.client import NEVER_DECODE
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import base64
+import hashlib
 import time
 
+
+def encode_scan_token(cursor: int, skip: int = 0, count: Optional[int] = None) -> str:
+    """Encode a SCAN cursor (plus keys already consumed from its batch) as an opaque token.
+
+    When keys were skipped, the COUNT of that call is kept too so resuming
+    reissues the same SCAN call and gets the same batch back.
+    """
+    raw = f"{cursor}:{skip}" if count is None else f"{cursor}:{skip}:{count}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_scan_token(token: Optional[str]) -> Tuple[int, int, Optional[int]]:
+    """Decode a token produced by encode_scan_token. Empty or "0" starts a new scan."""
+    if not token or token == "0":
+        return 0, 0, None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        parts = base64.urlsafe_b64decode(padded.encode()).decode().split(":")
+        if len(parts) not in (2, 3):
+            raise ValueError(token)
+        count = int(parts[2]) if len(parts) == 3 else None
+        return int(parts[0]), int(parts[1]), count
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError(f"Invalid cursor token: {token}")
+
+
+# Adaptive SCAN engine: COUNT bounds and the per-call server time it aims for
+SCAN_MIN_COUNT = 100
+SCAN_MAX_COUNT = 10000
+SCAN_TARGET_LATENCY = 0.01
+# Default time budgets (seconds) for interactive requests
+DEFAULT_PAGE_BUDGET = 1.0
+DEFAULT_SEARCH_BUDGET = 0.25
+
+
+class ScanState:
+    """Cursor, COUNT and budget bookkeeping for one adaptive SCAN walk.
+
+    RedisClient and AsyncRedisClient drive it the same way: SCAN with
+    state.cursor and state.count, then record() the reply. COUNT is retuned
+    after every call. It shrinks when a call costs more than target_latency,
+    so Redis is never blocked for long. It grows (at most 2x per call) while
+    calls are cheap and matches sparse, so sparse patterns still progress.
+    The walk ends at the end of the keyspace, after time_budget seconds or
+    once max_rows keys were returned, whichever comes first.
+    """
+
+    def __init__(self, pattern: str = '*', cursor: int = 0, count: int = 1000,
+                 time_budget: Optional[float] = None, max_rows: Optional[int] = None,
+                 target_latency: float = SCAN_TARGET_LATENCY):
+        self.pattern = pattern
+        self.cursor = cursor
+        self.count = max(SCAN_MIN_COUNT, min(SCAN_MAX_COUNT, count))
+        self.time_budget = time_budget
+        self.max_rows = max_rows
+        self.target_latency = target_latency
+
+        self.calls = 0
+        self.rows = 0
+        self.complete = False
+        self.stop_reason: Optional[str] = None
+        self._started = time.monotonic()
+        # Fastest call seen; approximates the network round trip, which COUNT can't shorten
+        self._min_latency: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    def record(self, cursor: int, batch: List[str], latency: float):
+        """Account for one SCAN reply and pick the COUNT for the next call."""
+        self.calls += 1
+        self.rows += len(batch)
+        self.cursor = cursor
+        if cursor == 0:
+            self.complete = True
+            self.stop_reason = "complete"
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+        self.count = self._next_count(len(batch), latency - self._min_latency)
+
+    def _next_count(self, matched: int, server_latency: float) -> int:
+        count = self.count
+        if server_latency > self.target_latency:
+            count = int(count * self.target_latency / server_latency)
+        elif self.max_rows is not None and matched:
+            # COUNT is roughly slots visited: size it to find the remaining rows in one call
+            needed = max(self.max_rows - self.rows, 1)
+            count = min(count * needed // matched + 1, count * 2)
+        elif matched == 0 or server_latency < self.target_latency / 2:
+            count *= 2
+        return max(SCAN_MIN_COUNT, min(SCAN_MAX_COUNT, count))
+
+    def exhausted(self) -> bool:
+        """Whether the walk should stop; the time budget never prevents the first call."""
+        if self.complete:
+            return True
+        if self.max_rows is not None and self.rows >= self.max_rows:
+            self.stop_reason = "row_budget"
+            return True
+        if self.calls and self.time_budget is not None and self.elapsed >= self.time_budget:
+            self.stop_reason = "time_budget"
+            return True
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        elapsed = self.elapsed
+        return {
+            "calls": self.calls,
+            "rows": self.rows,
+            "elapsed_s": round(elapsed, 4),
+            "keys_per_second": round(self.rows / elapsed, 1) if elapsed else 0.0,
+            "count": self.count,
+            "complete": self.complete,
+            "stop_reason": self.stop_reason,
+        }
+
+
+# Pipeline helpers shared by RedisClient and AsyncRedisClient: commands are queued
+# the same way on sync and async pipelines, only execute() differs.
+
+def queue_key_metadata(pipe, key: str):
+    """Queue TYPE, TTL and MEMORY USAGE for key on a pipeline."""
+    pipe.type(key)
+    pipe.ttl(key)
+    pipe.memory_usage(key)
+
+
+def parse_key_metadata(results: List[Any]) -> Optional[Dict[str, Any]]:
+    """Turn the replies of queue_key_metadata into a metadata dict (None if missing)."""
+    key_type, ttl, memory = results
+    if isinstance(key_type, Exception):
+        raise key_type
+    if key_type == 'none':
+        return None
+    if isinstance(memory, redis.ResponseError):
+        # Fall back for Redis servers that don't support MEMORY command
+        memory = 0
+    return {
+        "type": key_type,
+        "ttl": ttl,
+        "memory_usage": memory or 0,
+    }
+
+
+# Element count command for each key type
+LENGTH_COMMANDS = {
+    'string': 'STRLEN',
+    'list': 'LLEN',
+    'set': 'SCARD',
+    'zset': 'ZCARD',
+    'hash': 'HLEN',
+    'stream': 'XLEN',
+}
+
+
+def queue_keys_info(pipe, keys: List[str]):
+    """Queue TYPE, TTL, OBJECT ENCODING and MEMORY USAGE for every key."""
+    for key in keys:
+        pipe.type(key)
+        pipe.ttl(key)
+        pipe.object('encoding', key)
+        pipe.memory_usage(key)
+
+
+def parse_keys_info(keys: List[str], results: List[Any]) -> List[Dict[str, Any]]:
+    """Turn the replies of queue_keys_info into one metadata row per key."""
+    rows = []
+    for index, key in enumerate(keys):
+        key_type, ttl, encoding, memory = results[index * 4:index * 4 + 4]
+        if isinstance(key_type, redis.ConnectionError):
+            raise key_type
+        exists = key_type != 'none' and not isinstance(key_type, Exception)
+        rows.append({
+            "key": key,
+            "exists": exists,
+            "type": key_type if exists else None,
+            "ttl": ttl if exists and not isinstance(ttl, Exception) else None,
+            "encoding": encoding if exists and not isinstance(encoding, Exception) else None,
+            # MEMORY USAGE is missing on old servers
+            "memory_usage": memory if exists and not isinstance(memory, Exception) else None,
+            "length": None,
+        })
+    return rows
+
+
+def queue_lengths(pipe, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Queue the element count command for each row of a known type; returns those rows."""
+    queued = []
+    for row in rows:
+        command = LENGTH_COMMANDS.get(row["type"])
+        if command:
+            pipe.execute_command(command, row["key"])
+            queued.append(row)
+    return queued
+
+
+def apply_lengths(queued: List[Dict[str, Any]], results: List[Any]):
+    """Store the replies of queue_lengths on their rows."""
+    for row, length in zip(queued, results):
+        # A key can change type between the two round trips (WRONGTYPE)
+        row["length"] = None if isinstance(length, Exception) else length
+
+
+def is_unknown_command(error: Any) -> bool:
+    """Check whether a pipeline reply is an 'unknown command' error (old servers)."""
+    return isinstance(error, redis.ResponseError) and 'unknown command' in str(error).lower()
+
+
+def queue_unlink(pipe, keys: List[str], command: str = 'UNLINK'):
+    """Queue one UNLINK (or DEL) per key so every key gets its own result."""
+    for key in keys:
+        pipe.execute_command(command, key)
+
+
+def parse_unlink(keys: List[str], results: List[Any]) -> List[Dict[str, Any]]:
+    """Turn the replies of queue_unlink into per-key results."""
+    rows = []
+    for key, result in zip(keys, results):
+        if isinstance(result, redis.ConnectionError):
+            raise result
+        if isinstance(result, Exception):
+            rows.append({"key": key, "deleted": False, "error": str(result)})
+        else:
+            rows.append({"key": key, "deleted": bool(result), "error": None})
+    return rows
+
+
+# Most elements one value page may hold
+MAX_VALUE_PAGE = 10000
+
+
+def parse_value_window(cursor: Optional[str], count: int) -> Tuple[int, int]:
+    """Validate a value page cursor (a non-negative offset or HSCAN/SSCAN cursor) and clamp count."""
+    try:
+        offset = int(cursor) if cursor else 0
+    except ValueError:
+        offset = -1
+    if offset < 0:
+        raise ValueError(f"Invalid value cursor: {cursor}")
+    return offset, max(1, min(count, MAX_VALUE_PAGE))
+
+
+def queue_value_page(pipe, key: str, key_type: str, offset: int, count: int,
+                     min_score: Optional[float] = None, max_score: Optional[float] = None) -> bool:
+    """Queue the length and window commands for one value page. Returns False for unsupported types."""
+    if key_type == 'string':
+        pipe.strlen(key)
+        pipe.get(key)
+    elif key_type == 'list':
+        pipe.llen(key)
+        pipe.lrange(key, offset, offset + count - 1)
+    elif key_type == 'zset':
+        if min_score is not None or max_score is not None:
+            low = '-inf' if min_score is None else min_score
+            high = '+inf' if max_score is None else max_score
+            pipe.zcount(key, low, high)
+            pipe.zrangebyscore(key, low, high, start=offset, num=count, withscores=True)
+        else:
+            pipe.zcard(key)
+            pipe.zrange(key, offset, offset + count - 1, withscores=True)
+    elif key_type == 'hash':
+        pipe.hlen(key)
+        pipe.hscan(key, cursor=offset, count=count)
+    elif key_type == 'set':
+        pipe.scard(key)
+        pipe.sscan(key, cursor=offset, count=count)
+    else:
+        return False
+    return True
+
+
+def parse_value_page(key_type: str, offset: int, results: Optional[List[Any]]) -> Dict[str, Any]:
+    """Turn the replies of queue_value_page into a value page."""
+    next_cursor = None
+    if results is None:
+        length, value = 0, None
+    elif key_type in ('hash', 'set'):
+        length, (scan_cursor, value) = results
+        next_cursor = str(scan_cursor) if scan_cursor else None
+    else:
+        length, value = results
+        if key_type in ('list', 'zset') and offset + len(value) < length:
+            next_cursor = str(offset + len(value))
+
+    return {
+        "value": value,
+        "length": length,
+        "cursor": next_cursor,
+        "has_more": next_cursor is not None,
+    }
+
+
+def build_scan_page(keys: List[str], next_token: Optional[str], per_page: int,
+                    total: Optional[int], scan: Optional[ScanState] = None) -> Dict[str, Any]:
+    """Build the /api/keys response for cursor mode."""
+    page = {
+        "keys": keys,
+        "count": len(keys),
+        "total": total,
+        "per_page": per_page,
+        "cursor": next_token,
+        "has_more": next_token is not None,
+    }
+    if scan is not None:
+        # A page cut short by the time budget can hold fewer than per_page keys
+        page["timed_out"] = scan.stop_reason == "time_budget"
+        page["scan"] = scan.stats()
+    return page
+
+
+def escape_glob(text: str) -> str:
+    """Escape Redis glob special characters so text matches literally."""
+    return "".join("\\" + char if char in "*?[]\\" else char for char in text)
+
+
+def build_prefix_search(keys: List[str], limit: int, scan: ScanState) -> Dict[str, Any]:
+    """Build the result of a bounded prefix search (the last SCAN batch may overshoot limit)."""
+    return {
+        "keys": keys[:limit],
+        "count": min(len(keys), limit),
+        "more_available": not scan.complete or len(keys) > limit,
+        "timed_out": scan.stop_reason == "time_budget",
+        "scan": scan.stats(),
+    }
+
+
+def queue_commands(pipe, commands: List[Tuple[str, List[str]]]):
+    """Queue arbitrary (command, args) pairs on a pipeline."""
+    for command, args in commands:
+        pipe.execute_command(command, *args)
+
+
+def parse_command_results(results: List[Any]) -> List[Dict[str, Any]]:
+    """One {"result"} or {"error"} row per queued command, in order."""
+    return [
+        {"error": str(result)} if isinstance(result, Exception) else {"result": result}
+        for result in results
+    ]
+
+
+def queue_dump(pipe, keys: List[bytes]):
+    """Queue DUMP and PTTL for each key (DUMP payloads are never decoded)."""
+    for key in keys:
+        pipe.dump(key)
+        pipe.pttl(key)
+
+
+def parse_dump(keys: List[bytes], results: List[Any]) -> List[Tuple[bytes, int, bytes]]:
+    """(key, pttl, payload) for the keys that still exist; pttl is -1 without expiry."""
+    records = []
+    for index, key in enumerate(keys):
+        payload, pttl = results[2 * index], results[2 * index + 1]
+        # Keys can expire or be deleted between SCAN, DUMP and PTTL
+        if payload is not None and pttl != -2:
+            records.append((key, pttl, payload))
+    return records
+
+
+def queue_restore(pipe, records: List[Tuple[bytes, int, bytes]], replace: bool = True):
+    """Queue RESTORE for (key, pttl, payload) records; a pttl of -1 restores without expiry.
+
+    RESTORE reads a TTL of 0 as "no expiry", so a key dumped with 0 ms left
+    is restored with 1 ms and expires right away instead of becoming persistent.
+    """
+    for key, pttl, payload in records:
+        pipe.restore(key, max(pttl, 1) if pttl >= 0 else 0, payload, replace=replace)
+
+
+def parse_restore(results: List[Any]) -> List[Optional[str]]:
+    """None per restored key, 'exists' for BUSYKEY without REPLACE, else the error message."""
+    rows: List[Optional[str]] = []
+    for result in results:
+        if not isinstance(result, Exception):
+            rows.append(None)
+        elif str(result).startswith('BUSYKEY'):
+            rows.append('exists')
+        else:
+            rows.append(str(result))
+    return rows
+
+
+# DEBUG DIGEST-VALUE reply for a key that does not exist
+EMPTY_DIGEST = '0' * 40
+# DUMP payloads end with a 2-byte RDB version and an 8-byte CRC64
+DUMP_TRAILER_SIZE = 10
+
+
+def dump_digest(payload: bytes) -> bytes:
+    """Digest of a DUMP payload without its trailer, so servers of different versions agree."""
+    return hashlib.blake2b(payload[:-DUMP_TRAILER_SIZE], digest_size=16).digest()
+
+
+def parse_keyspace(info: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Per-database key counts from INFO keyspace, in db order (empty databases are not listed)."""
+    databases = []
+    for name, value in info.items():
+        if not (name.startswith("db") and name[2:].isdigit() and isinstance(value, dict)):
+            continue
+        keys = value.get("keys", 0)
+        expires = value.get("expires", 0)
+        databases.append({
+            "db": int(name[2:]),
+            "keys": keys,
+            "expires": expires,
+            "expiring_ratio": expires / keys if keys else 0.0,
+            # Redis reports the average TTL of the keys with an expiry, in milliseconds
+            "avg_ttl_ms": value.get("avg_ttl", 0),
+        })
+    return sorted(databases, key=lambda database: database["db"])
+
+
+def summarize_key_sample(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate the queue_keys_info rows of a random key sample."""
+    rows = [row for row in rows if row["exists"]]
+    ttls = [row["ttl"] for row in rows if row["ttl"] is not None and row["ttl"] >= 0]
+    sizes = [row["memory_usage"] for row in rows if row["memory_usage"] is not None]
+    types: Dict[str, int] = {}
+    for row in rows:
+        types[row["type"]] = types.get(row["type"], 0) + 1
+    return {
+        "sampled": len(rows),
+        "types": dict(sorted(types.items(), key=lambda item: item[1], reverse=True)),
+        "expiring_ratio": len(ttls) / len(rows) if rows else 0.0,
+        "avg_ttl_s": sum(ttls) / len(ttls) if ttls else None,
+        "avg_memory_bytes": sum(sizes) / len(sizes) if sizes else None,
+    }
+
+
+def build_stats(info: Dict[str, Any], key_count: int) -> Dict[str, Any]:
+    """Build the get_stats summary from INFO and DBSIZE."""
+    stats = {}
+    
+    # Add memory stats
+    stats['memory'] = {
+        'used_memory': info.get('used_memory', 0),
+        'used_memory_human': info.get('used_memory_human', '0B'),
+        'used_memory_peak': info.get('used_memory_peak', 0),
+        'used_memory_peak_human': info.get('used_memory_peak_human', '0B'),
+        'used_memory_dataset': info.get('used_memory_dataset', 0),
+        'mem_fragmentation_ratio': info.get('mem_fragmentation_ratio', 0),
+    }
+    
+    # Add key stats
+    stats['keys'] = {
+        'total': key_count,
+    }
+    
+    # Add performance stats
+    stats['performance'] = {
+        'instantaneous_ops_per_sec': info.get('instantaneous_ops_per_sec', 0),
+        'total_commands_processed': info.get('total_commands_processed', 0),
+        'total_connections_received': info.get('total_connections_received', 0),
+        'connected_clients': info.get('connected_clients', 0),
+    }
+    
+    return stats
+
+
 class RedisClient:
-    def __init__(self, host: str = 'localhost', port: int = 6379, db: int = 0, password: Optional[str] = None):
+    def __init__(self, host: str = 'localhost', port: int = 6379, db: int = 0, password: Optional[str] = None,
+                 connection_pool: Optional[redis.ConnectionPool] = None):
+        if connection_pool is not None:
+            # Reuse a shared pool (see connection_pool.ConnectionRegistry)
+            self.redis_client = redis.Redis(connection_pool=connection_pool)
+            return
         self.redis_client = redis.Redis(
             host=host,
             port=port,
@@ -44,12 +511,8 @@ class RedisClient:
     def _scan_keys(self, pattern: str = '*') -> List[str]:
         """Get keys using SCAN command (safer for production)."""
         keys = []
-        cursor = 0
-        while True:
-            cursor, batch = self.redis_client.scan(cursor=cursor, match=pattern, count=1000)
+        for batch in self.iter_keys(pattern):
             keys.extend(batch)
-            if cursor == 0:
-                break
         return keys
     
     def get_keys_paginated(self, pattern: str = '*', page: int = 1, per_page: int = 50) -> Dict[str, Any]:
@@ -73,9 +536,74 @@ class RedisClient:
             "total_pages": (total_keys + per_page - 1) // per_page if total_keys > 0 else 0
         }
     
-    def get_value(self, key: str) -> Any:
+    def scan_keys_page(self, pattern: str = '*', cursor: Optional[str] = None, per_page: int = 50,
+                       scan_count: int = 1000,
+                       time_budget: Optional[float] = DEFAULT_PAGE_BUDGET) -> Dict[str, Any]:
+        """Get one page of keys using SCAN, resuming from an opaque cursor token.
+
+        Scanning stops as soon as the page is full, so only the part of the keyspace
+        needed for this page is walked. A sparse pattern can return a short page
+        when time_budget runs out; the cursor then continues the walk. The
+        returned cursor is None once the scan has wrapped around.
+        """
+        scan_cursor, skip, count = decode_scan_token(cursor)
+        scan = ScanState(pattern, scan_cursor, count or scan_count, time_budget, max_rows=per_page + skip)
+        keys: List[str] = []
+        next_token = None
+        while True:
+            call_cursor, call_count = scan.cursor, scan.count
+            batch = self.scan_step(scan)[skip:]
+            needed = per_page - len(keys)
+            if len(batch) > needed:
+                # Resume with the same SCAN call next time, skipping what we returned
+                keys.extend(batch[:needed])
+                next_token = encode_scan_token(call_cursor, skip + needed, call_count)
+                break
+            keys.extend(batch)
+            skip = 0
+            if scan.complete:
+                break
+            if scan.exhausted():
+                next_token = encode_scan_token(scan.cursor)
+                break
+
+        # DBSIZE is O(1); for other patterns the total is unknown without a full scan
+        total = self.redis_client.dbsize() if pattern == '*' else None
+        return build_scan_page(keys, next_token, per_page, total, scan)
+
+    def get_key_metadata(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get type, TTL and memory usage of a key in one pipelined round trip.
+
+        Returns None if the key does not exist (TYPE reports 'none').
+        """
+        pipe = self.redis_client.pipeline(transaction=False)
+        queue_key_metadata(pipe, key)
+        return parse_key_metadata(pipe.execute(raise_on_error=False))
+
+    def get_keys_metadata(self, keys: List[str], chunk_size: int = 200) -> List[Dict[str, Any]]:
+        """Get type, TTL, encoding, element count and memory usage for many keys.
+
+        Each chunk of keys costs two pipelined round trips: one for the per-key
+        metadata and one for the type-specific element counts.
+        """
+        rows: List[Dict[str, Any]] = []
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start:start + chunk_size]
+            pipe = self.redis_client.pipeline(transaction=False)
+            queue_keys_info(pipe, chunk)
+            chunk_rows = parse_keys_info(chunk, pipe.execute(raise_on_error=False))
+
+            pipe = self.redis_client.pipeline(transaction=False)
+            queued = queue_lengths(pipe, chunk_rows)
+            if queued:
+                apply_lengths(queued, pipe.execute(raise_on_error=False))
+            rows.extend(chunk_rows)
+        return rows
+
+    def get_value(self, key: str, key_type: Optional[str] = None) -> Any:
         """Get value for a specific key."""
-        key_type = self.redis_client.type(key)
+        if key_type is None:
+            key_type = self.redis_client.type(key)
         
         if key_type == 'string':
             return self.redis_client.get(key)
@@ -90,14 +618,171 @@ class RedisClient:
         else:
             return None
     
+    def get_value_page(self, key: str, key_type: Optional[str] = None, cursor: Optional[str] = None,
+                       count: int = 100, min_score: Optional[float] = None,
+                       max_score: Optional[float] = None) -> Dict[str, Any]:
+        """Get a bounded window of a key's value plus its element count.
+
+        Lists and sorted sets are paged by offset (sorted sets optionally within a
+        score range), hashes and sets by HSCAN/SSCAN cursor. The returned cursor is
+        passed back to fetch the next window and is None when nothing is left.
+        count is clamped to 1..MAX_VALUE_PAGE; a malformed cursor raises ValueError.
+        """
+        offset, count = parse_value_window(cursor, count)
+        if key_type is None:
+            key_type = self.redis_client.type(key)
+        pipe = self.redis_client.pipeline(transaction=False)
+        queued = queue_value_page(pipe, key, key_type, offset, count, min_score, max_score)
+        return parse_value_page(key_type, offset, pipe.execute() if queued else None)
+
+    def new_scan(self, pattern: str = '*', cursor: int = 0, count: int = 1000,
+                 time_budget: Optional[float] = None, max_rows: Optional[int] = None) -> ScanState:
+        """Create the state for an adaptive SCAN walk driven by scan_step/iter_scan."""
+        return ScanState(pattern, cursor, count, time_budget, max_rows)
+
+    def scan_step(self, scan: ScanState, raw: bool = False) -> List[str]:
+        """Run one SCAN call for an adaptive walk and record it on the state.
+
+        With raw the keys come back as undecoded bytes, for binary-safe DUMP/RESTORE.
+        """
+        started = time.monotonic()
+        options = {NEVER_DECODE: []} if raw else {}
+        cursor, batch = self.redis_client.scan(cursor=scan.cursor, match=scan.pattern, count=scan.count, **options)
+        scan.record(cursor, batch, time.monotonic() - started)
+        return batch
+
+    def iter_scan(self, scan: ScanState, raw: bool = False) -> Iterator[List[str]]:
+        """Yield non-empty batches of an adaptive SCAN walk until its budgets run out."""
+        while not scan.exhausted():
+            batch = self.scan_step(scan, raw=raw)
+            if batch:
+                yield batch
+
+    def iter_keys(self, pattern: str = '*', scan_count: int = 1000) -> Iterator[List[str]]:
+        """Yield batches of keys matching pattern as SCAN returns them."""
+        yield from self.iter_scan(self.new_scan(pattern, count=scan_count))
+
+    def iter_value(self, key: str, key_type: Optional[str] = None, count: int = 1000) -> Iterator[Any]:
+        """Yield a key's value in chunks of roughly count elements.
+
+        Each chunk has the same shape as get_value_page's value (a dict for
+        hashes, a list otherwise); strings are yielded whole.
+        """
+        if key_type is None:
+            key_type = self.redis_client.type(key)
+        cursor = None
+        while True:
+            page = self.get_value_page(key, key_type=key_type, cursor=cursor, count=count)
+            if page["value"]:
+                yield page["value"]
+            elif page["cursor"] == (cursor or "0"):
+                # An empty window that doesn't move the cursor would repeat forever
+                break
+            cursor = page["cursor"]
+            if cursor is None:
+                break
+
     def delete_key(self, key: str) -> bool:
         """Delete a key."""
         return bool(self.redis_client.delete(key))
+
+    def unlink_keys(self, keys: List[str], chunk_size: int = 500) -> List[Dict[str, Any]]:
+        """Delete keys with pipelined UNLINK, one round trip per chunk.
+
+        UNLINK frees values in a background thread on the server; servers older
+        than 4.0 fall back to DEL. Returns one {key, deleted, error} row per key.
+        """
+        rows: List[Dict[str, Any]] = []
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start:start + chunk_size]
+            pipe = self.redis_client.pipeline(transaction=False)
+            queue_unlink(pipe, chunk)
+            results = pipe.execute(raise_on_error=False)
+            if results and is_unknown_command(results[0]):
+                pipe = self.redis_client.pipeline(transaction=False)
+                queue_unlink(pipe, chunk, command='DEL')
+                results = pipe.execute(raise_on_error=False)
+            rows.extend(parse_unlink(chunk, results))
+        return rows
+
+    def iter_delete_by_pattern(self, pattern: str, batch_size: int = 500,
+                               max_keys_per_second: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """Unlink every key matching pattern batch by batch, yielding progress after each batch.
+
+        With max_keys_per_second set, the loop sleeps between batches so deletion
+        never runs faster than that rate.
+        """
+        started = time.monotonic()
+        scanned = 0
+        deleted = 0
+        scan = self.new_scan(pattern, count=batch_size)
+        for batch in self.iter_scan(scan):
+            scanned += len(batch)
+            deleted += sum(1 for row in self.unlink_keys(batch, chunk_size=batch_size) if row["deleted"])
+
+            elapsed = time.monotonic() - started
+            if max_keys_per_second:
+                min_elapsed = deleted / max_keys_per_second
+                if elapsed < min_elapsed:
+                    time.sleep(min_elapsed - elapsed)
+                    elapsed = min_elapsed
+            yield {
+                "scanned": scanned,
+                "deleted": deleted,
+                "elapsed_s": round(elapsed, 3),
+                "keys_per_second": round(deleted / elapsed, 1) if elapsed else 0.0,
+                "scan": scan.stats(),
+            }
     
     def execute_command(self, command: str, *args) -> Any:
         """Execute arbitrary Redis command."""
         return self.redis_client.execute_command(command, *args)
+
+    def execute_batch(self, commands: List[Tuple[str, List[str]]], transaction: bool = False) -> List[Dict[str, Any]]:
+        """Run commands in one pipeline (wrapped in MULTI/EXEC if transaction) and return a row per command.
+
+        A command that fails doesn't stop the others; its row carries the error.
+        """
+        pipe = self.redis_client.pipeline(transaction=transaction)
+        queue_commands(pipe, commands)
+        return parse_command_results(pipe.execute(raise_on_error=False))
     
+    def dump_keys(self, keys: List[bytes]) -> List[Tuple[bytes, int, bytes]]:
+        """DUMP and PTTL keys in one round trip; returns (key, pttl, payload) for those that exist."""
+        pipe = self.redis_client.pipeline(transaction=False)
+        queue_dump(pipe, keys)
+        return parse_dump(keys, pipe.execute())
+
+    def restore_keys(self, records: List[Tuple[bytes, int, bytes]], replace: bool = True) -> List[Optional[str]]:
+        """RESTORE (key, pttl, payload) records in one round trip; see parse_restore for the result."""
+        pipe = self.redis_client.pipeline(transaction=False)
+        queue_restore(pipe, records, replace)
+        return parse_restore(pipe.execute(raise_on_error=False))
+
+    def supports_value_digest(self) -> bool:
+        """Whether DEBUG DIGEST-VALUE is allowed (enable-debug-command is off by default since Redis 7)."""
+        try:
+            self.redis_client.execute_command('DEBUG', 'DIGEST-VALUE')
+            return True
+        except redis.ResponseError:
+            return False
+
+    def get_value_digests(self, keys: List[bytes], method: str = 'digest') -> List[Tuple[bytes, bytes]]:
+        """(key, digest) for the keys that exist, in one round trip.
+
+        'digest' uses DEBUG DIGEST-VALUE, which does not depend on the encoding;
+        'dump' hashes DUMP payloads, which differ when the same value is
+        encoded differently (e.g. listpack vs hashtable). Digests are only
+        comparable between servers using the same method.
+        """
+        if method == 'digest':
+            digests = self.redis_client.execute_command('DEBUG', 'DIGEST-VALUE', *keys)
+            return [(key, digest.encode()) for key, digest in zip(keys, digests) if digest != EMPTY_DIGEST]
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.dump(key)
+        return [(key, dump_digest(payload)) for key, payload in zip(keys, pipe.execute()) if payload is not None]
+
     def get_memory_usage(self, key: str) -> int:
         """Get memory usage of key in bytes."""
         try:
@@ -112,35 +797,57 @@ class RedisClient:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get additional statistics about the Redis server."""
-        stats = {}
-        info = self.get_info()
-        
-        # Add memory stats
-        stats['memory'] = {
-            'used_memory': info.get('used_memory', 0),
-            'used_memory_human': info.get('used_memory_human', '0B'),
-            'used_memory_peak': info.get('used_memory_peak', 0),
-            'used_memory_peak_human': info.get('used_memory_peak_human', '0B'),
-            'used_memory_dataset': info.get('used_memory_dataset', 0),
-            'mem_fragmentation_ratio': info.get('mem_fragmentation_ratio', 0),
-        }
-        
-        # Add key stats
-        key_count = self.redis_client.dbsize()
-        stats['keys'] = {
-            'total': key_count,
-        }
-        
-        # Add performance stats
-        stats['performance'] = {
-            'instantaneous_ops_per_sec': info.get('instantaneous_ops_per_sec', 0),
-            'total_commands_processed': info.get('total_commands_processed', 0),
-            'total_connections_received': info.get('total_connections_received', 0),
-            'connected_clients': info.get('connected_clients', 0),
-        }
-        
-        return stats
+        return build_stats(self.get_info(), self.redis_client.dbsize())
+
+    def get_slowlog(self, count: int = 128) -> List[Any]:
+        """Get the newest count raw SLOWLOG GET entries (see latency.parse_slowlog)."""
+        # Sent as separate words so redis-py returns the reply unparsed, with decoded arguments
+        return self.redis_client.execute_command('SLOWLOG', 'GET', count)
+
+    def get_latency_latest(self) -> List[Any]:
+        """Get the raw LATENCY LATEST reply."""
+        return self.redis_client.execute_command('LATENCY', 'LATEST')
+
+    def get_latency_histories(self, events: List[str]) -> Dict[str, List[Any]]:
+        """Get LATENCY HISTORY of several events in one round trip."""
+        pipe = self.redis_client.pipeline(transaction=False)
+        for event in events:
+            pipe.execute_command('LATENCY', 'HISTORY', event)
+        return dict(zip(events, pipe.execute()))
+
+    def get_keyspace(self) -> List[Dict[str, Any]]:
+        """Get key counts, expiring keys and average TTL of every populated database."""
+        return parse_keyspace(self.redis_client.info('keyspace'))
+
+    def random_keys(self, count: int) -> List[str]:
+        """Get up to count distinct keys picked with pipelined RANDOMKEY."""
+        pipe = self.redis_client.pipeline(transaction=False)
+        for _ in range(count):
+            pipe.randomkey()
+        return list(dict.fromkeys(key for key in pipe.execute() if key is not None))
+
+    def sample_keyspace(self, sample_size: int = 100) -> Dict[str, Any]:
+        """Summarize types, TTLs and memory of a random sample of this database's keys."""
+        keys = self.random_keys(sample_size)
+        pipe = self.redis_client.pipeline(transaction=False)
+        queue_keys_info(pipe, keys)
+        return summarize_key_sample(parse_keys_info(keys, pipe.execute(raise_on_error=False)))
     
+    def scan_prefix(self, prefix: str, limit: int = 100,
+                    time_budget: float = DEFAULT_SEARCH_BUDGET) -> Dict[str, Any]:
+        """Find up to limit keys starting with prefix with SCAN, stopping early.
+
+        The walk ends as soon as limit keys are found or time_budget seconds
+        have passed, so latency is bounded whatever the size of the database.
+        more_available is set when the walk stopped before the end of the keyspace.
+        """
+        scan = self.new_scan(escape_glob(prefix) + "*", count=SCAN_MIN_COUNT,
+                             time_budget=time_budget, max_rows=limit)
+        keys: List[str] = []
+        for batch in self.iter_scan(scan):
+            keys.extend(batch)
+        return build_prefix_search(keys, limit, scan)
+
     def search_by_prefix(self, prefix: str, limit: int = 100) -> List[str]:
         """Search keys by prefix, optimized for faster searching."""
-        return self.redis_client.keys(f"{prefix}*")[:limit]
\ No newline at end of file
+        return self.scan_prefix(prefix, limit)["keys"]
\ No newline at end of file
@@ -0,0 +1,330 @@
+"""Streaming keyspace export and import built on DUMP and RESTORE.
+
+A dump file is a small header followed by length-prefixed records and an
+end marker carrying the record count:
+
+    header   MAGIC, format version (1 byte)
+    record   key length (u32), payload length (u32), PTTL in ms (i64, -1 = no expiry),
+             key bytes, DUMP payload
+    end      END_OF_DUMP, 0, record count
+
+Everything is big-endian. Files may be gzip-compressed as a whole; readers
+detect that from the gzip magic. The format is written and read as a stream,
+so memory use depends on the batch size, never on the number of keys.
+Readers reject a key or payload longer than MAX_RECORD_FIELD, so a corrupt
+length fails at once instead of buffering the rest of the input.
+DUMP payloads are only portable to servers with the same or a newer RDB
+version.
+"""
+import struct
+import time
+import zlib
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .async_redis_client import AsyncRedisClient
+from .redis_client import RedisClient
+
+MAGIC = b"RLDUMP"
+FORMAT_VERSION = 1
+RECORD = struct.Struct(">IIq")
+END_OF_DUMP = 0xFFFFFFFF
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Keys per DUMP or RESTORE pipeline
+DEFAULT_TRANSFER_BATCH = 1000
+# Fastest zlib level: exports are usually bound by compression, not by Redis
+DEFAULT_COMPRESS_LEVEL = 1
+# Bytes read from a dump file per decoder feed
+READ_CHUNK = 1 << 20
+# Distinct RESTORE errors kept in import results
+MAX_REPORTED_ERRORS = 20
+# Largest key or payload a record may claim: Redis' default proto-max-bulk-len,
+# so RESTORE would reject anything bigger and a larger length means corruption
+MAX_RECORD_FIELD = 512 << 20
+
+Record = Tuple[bytes, int, bytes]
+
+
+class DumpFormatError(ValueError):
+    """The input is not a complete RedisLens dump."""
+
+
+class DumpEncoder:
+    """Turn batches of (key, pttl, payload) records into dump file bytes."""
+
+    def __init__(self, compress: bool = False, level: int = DEFAULT_COMPRESS_LEVEL):
+        self.records = 0
+        # wbits=31 writes a gzip stream, so compressed dumps also open with gunzip
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31) if compress else None
+        self._pending = MAGIC + bytes([FORMAT_VERSION])
+
+    def _output(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) if self._compressor else data
+
+    def encode(self, records: List[Record]) -> bytes:
+        parts = [self._pending]
+        self._pending = b""
+        for key, pttl, payload in records:
+            parts.append(RECORD.pack(len(key), len(payload), pttl))
+            parts.append(key)
+            parts.append(payload)
+        self.records += len(records)
+        return self._output(b"".join(parts))
+
+    def finish(self) -> bytes:
+        """The end marker (and header, for an empty dump) plus any buffered compressed data."""
+        data = self._output(self._pending + RECORD.pack(END_OF_DUMP, 0, self.records))
+        if self._compressor:
+            data += self._compressor.flush()
+        return data
+
+
+class DumpDecoder:
+    """Incrementally parse dump file bytes fed in arbitrary chunks."""
+
+    def __init__(self):
+        self.records = 0
+        self.finished = False
+        self._head: Optional[bytes] = b""
+        self._decompressor: Optional[Any] = None
+        self._header_read = False
+        self._buffer = bytearray()
+
+    def _decompress(self, data: bytes) -> bytes:
+        if self._head is not None:
+            # Wait for enough bytes to tell gzip from a plain dump
+            self._head += data
+            if len(self._head) < len(GZIP_MAGIC):
+                return b""
+            data, self._head = self._head, None
+            if data.startswith(GZIP_MAGIC):
+                self._decompressor = zlib.decompressobj(31)
+        return self._decompressor.decompress(data) if self._decompressor else data
+
+    def _read_header(self) -> int:
+        """Check the header; returns its size, or 0 while it is incomplete."""
+        head = bytes(self._buffer[:len(MAGIC) + 1])
+        if not head.startswith(MAGIC[:len(head)]) or (len(head) > len(MAGIC) and not head.startswith(MAGIC)):
+            raise DumpFormatError("Not a RedisLens dump")
+        if len(head) <= len(MAGIC):
+            return 0
+        if head[-1] != FORMAT_VERSION:
+            raise DumpFormatError(f"Unsupported dump format version {head[-1]}")
+        self._header_read = True
+        return len(head)
+
+    def feed(self, data: bytes) -> List[Record]:
+        """Parse data and return the records it completes."""
+        self._buffer += self._decompress(data)
+        buffer = self._buffer
+        if self.finished:
+            if buffer:
+                raise DumpFormatError("Unexpected data after the end of the dump")
+            return []
+        offset = 0
+        if not self._header_read:
+            offset = self._read_header()
+            if not offset:
+                return []
+
+        records = []
+        size = len(buffer)
+        header_size = RECORD.size
+        unpack = RECORD.unpack_from
+        # Slicing a memoryview copies each key and payload once instead of twice
+        with memoryview(buffer) as view:
+            while size - offset >= header_size:
+                key_length, payload_length, pttl = unpack(view, offset)
+                if key_length == END_OF_DUMP:
+                    count = self.records + len(records)
+                    if pttl != count:
+                        raise DumpFormatError(f"Dump ends after {count} records but claims {pttl}")
+                    self.finished = True
+                    offset += header_size
+                    if offset != size:
+                        raise DumpFormatError("Unexpected data after the end of the dump")
+                    break
+                if key_length > MAX_RECORD_FIELD or payload_length > MAX_RECORD_FIELD:
+                    raise DumpFormatError(
+                        f"Record {self.records + len(records) + 1} claims {max(key_length, payload_length)} bytes"
+                    )
+                key_end = offset + header_size + key_length
+                end = key_end + payload_length
+                if end > size:
+                    break
+                records.append((view[offset + header_size:key_end].tobytes(), pttl, view[key_end:end].tobytes()))
+                offset = end
+        del buffer[:offset]
+        self.records += len(records)
+        return records
+
+    def close(self):
+        """Check that the whole dump was read."""
+        if not self.finished:
+            raise DumpFormatError(f"Dump is truncated after {self.records} records")
+
+
+class KeyspaceExporter:
+    """SCAN keys matching pattern and stream them as a dump, one DUMP + PTTL pipeline per batch.
+
+    Keys are scanned as raw bytes, so binary keys survive the round trip. A
+    cancelled export ends without the end marker, so importing it fails as
+    truncated instead of silently restoring a partial keyspace.
+    """
+
+    def __init__(self, client: RedisClient, pattern: str = "*", batch_size: int = DEFAULT_TRANSFER_BATCH,
+                 compress: bool = False):
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self.client = client
+        self.pattern = pattern
+        self.batch_size = batch_size
+        self.compress = compress
+        self.encoder = DumpEncoder(compress)
+        self.scan = client.new_scan(pattern, count=batch_size)
+        self.scanned = 0
+        self.bytes_written = 0
+        self.elapsed = 0.0
+
+    def iter_chunks(self, job=None) -> Iterator[bytes]:
+        """Yield the dump file in chunks of roughly one batch each."""
+        started = time.monotonic()
+        for batch in self.client.iter_scan(self.scan, raw=True):
+            self.scanned += len(batch)
+            for start in range(0, len(batch), self.batch_size):
+                chunk = self.encoder.encode(self.client.dump_keys(batch[start:start + self.batch_size]))
+                self.elapsed = time.monotonic() - started
+                if chunk:
+                    self.bytes_written += len(chunk)
+                    yield chunk
+            if job is not None:
+                job.progress = self.progress()
+                if job.cancelled:
+                    return
+        chunk = self.encoder.finish()
+        self.bytes_written += len(chunk)
+        self.elapsed = time.monotonic() - started
+        yield chunk
+
+    def export(self, stream: BinaryIO,
+               progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Write the dump to a binary file object and return the final progress.
+
+        progress, if given, is called with the progress after every chunk.
+        """
+        for chunk in self.iter_chunks():
+            stream.write(chunk)
+            if progress is not None:
+                progress(self.progress())
+        return self.progress()
+
+    def progress(self) -> Dict[str, Any]:
+        return {
+            "scanned": self.scanned,
+            "exported": self.encoder.records,
+            "bytes": self.bytes_written,
+            "compressed": self.compress,
+            "elapsed_s": round(self.elapsed, 3),
+            "keys_per_second": round(self.encoder.records / self.elapsed, 1) if self.elapsed else 0.0,
+            "complete": self.scan.complete,
+            "scan": self.scan.stats(),
+        }
+
+
+class DumpImporter:
+    """Decode a dump into RESTORE batches and tally their results.
+
+    The caller runs the batches, which lets the blocking CLI import and the
+    async upload endpoint share the decoding and bookkeeping.
+    """
+
+    def __init__(self, batch_size: int = DEFAULT_TRANSFER_BATCH):
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self.batch_size = batch_size
+        self.decoder = DumpDecoder()
+        self.bytes_read = 0
+        self.restored = 0
+        self.existing = 0
+        self.failed = 0
+        self.errors: Dict[str, int] = {}
+        self._pending: List[Record] = []
+        self._started = time.monotonic()
+
+    def feed(self, data: bytes) -> List[List[Record]]:
+        """Decode data and return the full batches it completes."""
+        self.bytes_read += len(data)
+        pending = self._pending + self.decoder.feed(data)
+        full = len(pending) - len(pending) % self.batch_size
+        self._pending = pending[full:]
+        return [pending[start:start + self.batch_size] for start in range(0, full, self.batch_size)]
+
+    def flush(self) -> List[List[Record]]:
+        """The last, partial batch once the input is exhausted."""
+        pending, self._pending = self._pending, []
+        return [pending] if pending else []
+
+    def record(self, results: List[Optional[str]]):
+        """Tally restore_keys results."""
+        for error in results:
+            if error is None:
+                self.restored += 1
+            elif error == "exists":
+                self.existing += 1
+            else:
+                self.failed += 1
+                if error in self.errors or len(self.errors) < MAX_REPORTED_ERRORS:
+                    self.errors[error] = self.errors.get(error, 0) + 1
+
+    def close(self):
+        """Raise DumpFormatError if the dump was incomplete."""
+        self.decoder.close()
+
+    def progress(self) -> Dict[str, Any]:
+        elapsed = time.monotonic() - self._started
+        return {
+            "records": self.decoder.records,
+            "restored": self.restored,
+            "existing": self.existing,
+            "failed": self.failed,
+            "errors": [{"error": error, "count": count} for error, count in self.errors.items()],
+            "bytes": self.bytes_read,
+            "elapsed_s": round(elapsed, 3),
+            "keys_per_second": round(self.restored / elapsed, 1) if elapsed else 0.0,
+        }
+
+
+def import_dump(client: RedisClient, stream: BinaryIO, replace: bool = True,
+                batch_size: int = DEFAULT_TRANSFER_BATCH,
+                progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """RESTORE every record of a dump read from a binary file object.
+
+    Existing keys are overwritten with replace, otherwise counted as existing.
+    progress, if given, is called after every chunk read. Raises
+    DumpFormatError for invalid or truncated input after restoring what
+    could be read.
+    """
+    importer = DumpImporter(batch_size)
+    while True:
+        data = stream.read(READ_CHUNK)
+        for batch in importer.feed(data) if data else importer.flush():
+            importer.record(client.restore_keys(batch, replace))
+        if progress is not None:
+            progress(importer.progress())
+        if not data:
+            break
+    importer.close()
+    return importer.progress()
+
+
+async def async_import_dump(client: AsyncRedisClient, chunks: AsyncIterator[bytes], replace: bool = True,
+                            batch_size: int = DEFAULT_TRANSFER_BATCH) -> Dict[str, Any]:
+    """import_dump for a stream of byte chunks, such as an HTTP request body."""
+    importer = DumpImporter(batch_size)
+    async for data in chunks:
+        for batch in importer.feed(data):
+            importer.record(await client.restore_keys(batch, replace))
+    for batch in importer.flush():
+        importer.record(await client.restore_keys(batch, replace))
+    importer.close()
+    return importer.progress()
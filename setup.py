@@ -27,7 +27,7 @@ setup(
     install_requires=[
         "fastapi>=0.95.0",
         "uvicorn>=0.22.0",
-        "redis>=4.5.4",
+        "redis>=5.0.1",
         "pydantic>=1.10.7",
     ],
     entry_points={
@@ -0,0 +1,49 @@
+import fakeredis
+import pytest
+import redis
+import redis.asyncio
+
+from redislens.cache import info_cache, key_snapshots
+from redislens.connection_pool import AsyncConnectionRegistry, ConnectionRegistry
+from redislens.redis_client import RedisClient
+
+
+def fake_pool(server: fakeredis.FakeServer) -> redis.ConnectionPool:
+    """A decoding connection pool on an in-memory fakeredis server, like the registry's pools."""
+    return redis.ConnectionPool(connection_class=fakeredis.FakeRedisConnection, server=server, decode_responses=True)
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def client(server):
+    return RedisClient(connection_pool=fake_pool(server))
+
+
+@pytest.fixture
+def fake_registries(server, monkeypatch):
+    """Make the shared connection registries hand out pools on the fakeredis server."""
+    monkeypatch.setattr(ConnectionRegistry, "_create_pool", lambda self, key: redis.BlockingConnectionPool(
+        connection_class=fakeredis.FakeRedisConnection, server=server, decode_responses=True,
+        max_connections=self.max_connections,
+    ))
+    monkeypatch.setattr(AsyncConnectionRegistry, "_create_pool", lambda self, key: redis.asyncio.BlockingConnectionPool(
+        connection_class=fakeredis.FakeAsyncRedisConnection, server=server, decode_responses=True,
+        max_connections=self.max_connections,
+    ))
+
+
+@pytest.fixture
+def api(fake_registries):
+    """A TestClient for the API, backed by the fakeredis server."""
+    from fastapi.testclient import TestClient
+
+    from redislens.api import app
+
+    key_snapshots.invalidate()
+    info_cache.invalidate()
+    with TestClient(app) as test_client:
+        yield test_client
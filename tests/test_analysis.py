@@ -0,0 +1,26 @@
+import pytest
+
+from redislens.analysis import _KeyspaceScan
+
+
+class KeyCounter(_KeyspaceScan):
+    def _process_batch(self, keys):
+        self.sampled += len(keys)
+
+    def report(self):
+        return {"sampled": self.sampled, **self.progress()}
+
+
+def test_scans_without_overrides_fail_at_construction(client):
+    class NoReport(_KeyspaceScan):
+        def _process_batch(self, keys):
+            pass
+
+    with pytest.raises(TypeError, match="report"):
+        NoReport(client)
+
+
+def test_keyspace_scan_processes_every_key_in_batches(client):
+    client.redis_client.mset({f"k:{i}": i for i in range(1200)})
+    report = KeyCounter(client, batch_size=100).run()
+    assert (report["sampled"], report["scanned"], report["complete"]) == (1200, 1200, True)
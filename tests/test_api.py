@@ -0,0 +1,87 @@
+def test_keys_cursor_mode_pages_through_every_key(api, client):
+    client.redis_client.mset({f"user:{i}": i for i in range(120)})
+    seen, cursor = [], "0"
+    while cursor:
+        response = api.post("/api/keys", params={"cursor": cursor, "per_page": 50})
+        assert response.status_code == 200
+        page = response.json()
+        assert page["count"] <= 50
+        seen += page["keys"]
+        cursor = page["cursor"]
+    assert sorted(seen) == sorted(f"user:{i}" for i in range(120))
+
+
+def test_keys_page_mode(api, client):
+    client.redis_client.mset({f"user:{i}": i for i in range(120)})
+    page = api.post("/api/keys", params={"page": 3, "per_page": 50}).json()
+    assert (page["count"], page["total"], page["total_pages"]) == (20, 120, 3)
+
+
+def test_keys_page_mode_walks_only_as_far_as_the_page(api, client, monkeypatch):
+    import redis.asyncio
+    from redislens.api import connection_key, key_snapshots, RedisConnection
+
+    async def no_keys(*args, **kwargs):
+        raise AssertionError("page mode must not run KEYS")
+
+    monkeypatch.setattr(redis.asyncio.Redis, "keys", no_keys)
+    client.redis_client.mset({f"user:{i}": i for i in range(5000)})
+    snapshot_key = (connection_key(RedisConnection()), "user:*")
+
+    first = api.post("/api/keys", params={"pattern": "user:*", "per_page": 50}).json()
+    assert (first["count"], first["total"], first["total_pages"], first["has_more"]) == (50, None, None, True)
+    assert len(key_snapshots.get(snapshot_key).keys) == 50
+
+    second = api.post("/api/keys", params={"pattern": "user:*", "page": 2, "per_page": 50}).json()
+    assert not second["cached"] and not set(first["keys"]) & set(second["keys"])
+    assert api.post("/api/keys", params={"pattern": "user:*", "page": 2, "per_page": 50}).json()["cached"]
+
+    seen, page = [], 1
+    while True:
+        result = api.post("/api/keys", params={"pattern": "user:*", "page": page, "per_page": 1000}).json()
+        seen += result["keys"]
+        if not result["has_more"]:
+            break
+        page += 1
+    assert sorted(seen) == sorted(f"user:{i}" for i in range(5000))
+    assert (result["total"], result["total_pages"]) == (5000, 5)
+
+
+def test_keys_page_mode_empty_database(api):
+    page = api.post("/api/keys").json()
+    assert (page["keys"], page["total"], page["total_pages"]) == ([], 0, 0)
+
+
+def test_keys_rejects_invalid_paging(api):
+    for params in ({"per_page": 0}, {"per_page": 0, "cursor": "0"}, {"per_page": 100000}, {"page": 0}):
+        assert api.post("/api/keys", params=params).status_code == 422
+
+
+def test_keys_page_mode_from_key_index(api, client, monkeypatch):
+    from redislens.api import key_indexes
+    from redislens.key_index import SortedKeyIndex
+
+    index = SortedKeyIndex(f"user:{i:03d}" for i in range(120))
+    monkeypatch.setattr(key_indexes, "ready", lambda *args: index)
+    page = api.post("/api/keys", params={"pattern": "user:*", "page": 2, "per_page": 50}).json()
+    assert (page["keys"][0], page["total"], page["total_pages"], page["source"]) == ("user:050", 120, 3, "index")
+    # Only prefix globs can be counted from the index
+    page = api.post("/api/keys", params={"pattern": "user:?1?", "per_page": 50}).json()
+    assert (page["count"], page["total"], page["total_pages"]) == (20, None, None)
+
+
+def test_connection_recovers_after_an_outage(api, server):
+    assert api.post("/api/keys").status_code == 200
+    server.connected = False
+    assert api.post("/api/ping", json={}).status_code == 500
+    assert api.post("/api/keys").json()["detail"] == "Could not connect to Redis server"
+
+    server.connected = True
+    # Unhealthy pools are pinged again instead of waiting for the next scheduled check
+    assert api.post("/api/keys").status_code == 200
+
+    server.connected = False
+    assert api.post("/api/ping", json={}).status_code == 500
+    server.connected = True
+    assert api.post("/api/ping", json={}).json()["status"] == "ok"
+    assert api.post("/api/keys").status_code == 200
@@ -0,0 +1,31 @@
+from redislens.cache import KeySnapshot, KeySnapshotCache
+from redislens.connection_pool import PoolKey
+
+CONNECTION = PoolKey("localhost", 6379, 0, None)
+
+
+def snapshot(size, cursor="0"):
+    return KeySnapshot([f"k:{i}" for i in range(size)], cursor)
+
+
+def test_snapshots_are_bounded_by_key_count():
+    cache = KeySnapshotCache(max_entries=10, ttl=60, max_keys=100)
+    cache.set_keys(CONNECTION, "a:*", snapshot(60))
+    cache.set_keys(CONNECTION, "b:*", snapshot(30))
+    cache.get_keys(CONNECTION, "a:*")
+    # Least recently used snapshots go first
+    cache.set_keys(CONNECTION, "c:*", snapshot(20))
+    assert cache.get_keys(CONNECTION, "b:*") is None
+    assert [len(cache.get_keys(CONNECTION, p).keys) for p in ("a:*", "c:*")] == [60, 20]
+    assert cache.stats()["keys"] == 80
+
+    # A snapshot larger than the whole budget is not kept, and drops its stale version
+    cache.set_keys(CONNECTION, "a:*", snapshot(101))
+    assert cache.get_keys(CONNECTION, "a:*") is None
+
+
+def test_removed_keys_are_patched_out():
+    cache = KeySnapshotCache(max_entries=10, ttl=60)
+    cache.set_keys(CONNECTION, "*", snapshot(5, cursor=None))
+    cache.remove_keys(CONNECTION, ["k:1", "k:3"])
+    assert cache.get_keys(CONNECTION, "*") == KeySnapshot(["k:0", "k:2", "k:4"], None)
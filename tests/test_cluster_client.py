@@ -0,0 +1,88 @@
+import asyncio
+import types
+
+import fakeredis
+import pytest
+import redis.asyncio.cluster
+
+from redislens.cluster_client import AsyncClusterRegistry, ClusterClient
+from redislens.redis_client import RedisClient
+
+from conftest import fake_pool
+
+
+class FakeCluster:
+    """The part of RedisCluster that ClusterClient's SCAN walk uses, with one fakeredis server per primary."""
+
+    def __init__(self, nodes: int):
+        self.shards = {
+            f"10.0.0.{i}:6379": RedisClient(connection_pool=fake_pool(fakeredis.FakeServer())).redis_client
+            for i in range(nodes)
+        }
+
+    def get_primaries(self):
+        return [types.SimpleNamespace(name=name) for name in self.shards]
+
+    def get_node(self, node_name):
+        return types.SimpleNamespace(name=node_name) if node_name in self.shards else None
+
+    def scan(self, cursor=0, match=None, count=None, target_nodes=None, **options):
+        cursor, keys = self.shards[target_nodes.name].scan(cursor=cursor, match=match, count=count, **options)
+        return {target_nodes.name: cursor}, keys
+
+
+@pytest.fixture
+def cluster_client():
+    cluster = FakeCluster(nodes=3)
+    for i, shard in enumerate(cluster.shards.values()):
+        shard.mset({f"shard{i}:{n}": n for n in range(200)})
+    return ClusterClient(cluster)
+
+
+def test_iter_scan_merges_every_primary(cluster_client):
+    keys = [key for batch in cluster_client.iter_scan(cluster_client.new_scan(count=50)) for key in batch]
+    assert sorted(keys) == sorted(f"shard{i}:{n}" for i in range(3) for n in range(200))
+
+
+def test_iter_scan_raw_returns_bytes(cluster_client):
+    scan = cluster_client.new_scan("shard1:*", count=50)
+    keys = [key for batch in cluster_client.iter_scan(scan, raw=True) for key in batch]
+    assert sorted(keys) == sorted(f"shard1:{n}".encode() for n in range(200))
+    assert scan.complete
+
+
+class SlowAsyncCluster:
+    """Stands in for redis.asyncio.cluster.RedisCluster; topology discovery takes a moment."""
+
+    created = []
+
+    def __init__(self, host, port, **kwargs):
+        self.port = port
+        self.closed = False
+        SlowAsyncCluster.created.append(self)
+
+    async def initialize(self):
+        await asyncio.sleep(0.05)
+        if self.port == 1:
+            raise ConnectionError("no reachable node")
+
+    async def aclose(self):
+        self.closed = True
+
+
+def test_async_registry_discovers_each_cluster_once(monkeypatch):
+    monkeypatch.setattr(redis.asyncio.cluster, "RedisCluster", SlowAsyncCluster)
+    SlowAsyncCluster.created = []
+    registry = AsyncClusterRegistry()
+
+    async def scenario():
+        clients = await asyncio.gather(*(registry.get("seed", 7000) for _ in range(5)))
+        with pytest.raises(ConnectionError):
+            await registry.get("seed", 1)
+        return clients
+
+    clients = asyncio.run(scenario())
+    assert all(client is clients[0] for client in clients)
+    assert [client.port for client in SlowAsyncCluster.created] == [7000, 1]
+    # A client that never discovered the topology is closed rather than leaked
+    assert [client.closed for client in SlowAsyncCluster.created] == [False, True]
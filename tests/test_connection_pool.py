@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from redislens.api import RedisConnection, holding_pools
+from redislens.connection_pool import AsyncConnectionRegistry, ConnectionRegistry, _BaseRegistry, registry
+
+
+def test_base_registry_is_abstract():
+    with pytest.raises(TypeError):
+        _BaseRegistry()
+
+
+def test_held_pools_are_not_evicted():
+    pools = ConnectionRegistry(idle_timeout=-1)
+    with pools.hold(port=6390) as pool:
+        with pools.hold(port=6390) as same:
+            assert same is pool
+        assert pools.evict_idle() == 0
+        assert pools.stats()["held"] == 1
+    assert pools.stats()["held"] == 0
+    assert pools.evict_idle() == 1
+    assert pools.get_pool(port=6390) is not pool
+
+
+def test_held_pools_are_released_on_errors():
+    pools = ConnectionRegistry(idle_timeout=-1)
+    with pytest.raises(RuntimeError):
+        with pools.hold(port=6390):
+            raise RuntimeError("job failed")
+    assert pools.evict_idle() == 1
+
+
+def test_async_held_pools_are_not_evicted():
+    pools = AsyncConnectionRegistry(idle_timeout=-1)
+
+    async def run():
+        with pools.hold(port=6390):
+            held = await pools.evict_idle()
+        return held, await pools.evict_idle()
+
+    assert asyncio.run(run()) == (0, 1)
+
+
+def test_jobs_hold_their_pools(fake_registries, monkeypatch):
+    monkeypatch.setattr(registry, "idle_timeout", -1)
+    source, target = RedisConnection(port=6390), RedisConnection(port=6391, db=2)
+    pool = registry.get_pool(port=6390)
+
+    def job(_):
+        registry.evict_idle()
+        return registry.get_pool(port=6390) is pool
+
+    assert holding_pools(job, source, target)(None)
+    registry.evict_idle()
+    assert registry.get_pool(port=6390) is not pool
+
+
+def test_cluster_connections_hold_nothing(monkeypatch):
+    monkeypatch.setattr(registry, "idle_timeout", -1)
+    registry.evict_idle()
+    assert holding_pools(lambda job: registry.stats()["pools"], RedisConnection(port=7000, cluster=True))(None) == 0
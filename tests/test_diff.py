@@ -0,0 +1,72 @@
+import fakeredis
+import pytest
+
+from redislens.diff import KeyspaceDiff
+from redislens.redis_client import RedisClient
+
+from conftest import fake_pool
+
+
+@pytest.fixture
+def source(client):
+    return client
+
+
+@pytest.fixture
+def target():
+    return RedisClient(connection_pool=fake_pool(fakeredis.FakeServer()))
+
+
+def fill(client, keys):
+    client.redis_client.mset({f"k:{i}": f"value {i}" for i in keys})
+
+
+def test_missing_extra_and_changed_keys(source, target):
+    fill(source, range(300))
+    fill(target, range(10, 320))
+    target.redis_client.set("k:50", "changed")
+    target.redis_client.delete("k:60")
+    target.redis_client.rpush("k:60", "type changed too")
+
+    report = KeyspaceDiff(source, target, batch_size=50, bucket_bits=4).run()
+    assert report["method"] == "dump"
+    assert report["missing"] == sorted(f"k:{i}" for i in range(10))
+    assert report["extra"] == sorted(f"k:{i}" for i in range(300, 320))
+    assert report["changed"] == ["k:50", "k:60"]
+    totals = report["totals"]
+    assert (totals["missing"], totals["extra"], totals["changed"]) == (10, 20, 2)
+    assert (totals["source_keys"], totals["target_keys"]) == (300, 310)
+    assert totals["complete"] and not totals["identical"] and not report["truncated"]
+
+
+def test_identical_databases(source, target):
+    fill(source, range(200))
+    fill(target, range(200))
+    report = KeyspaceDiff(source, target, bucket_bits=4).run()
+    assert report["totals"]["identical"]
+    assert report["totals"]["mismatched_buckets"] == 0
+
+
+def test_keys_scanned_twice_are_not_differences(source, target, monkeypatch):
+    fill(source, range(200))
+    fill(target, range(200))
+    iter_scan = source.iter_scan
+
+    def iter_scan_with_duplicates(scan, raw=False):
+        # SCAN may return keys again while the server rehashes
+        for batch in iter_scan(scan, raw=raw):
+            yield batch
+            yield batch[:5]
+
+    monkeypatch.setattr(source, "iter_scan", iter_scan_with_duplicates)
+    report = KeyspaceDiff(source, target, batch_size=50, bucket_bits=4).run()
+    totals = report["totals"]
+    assert totals["identical"]
+    assert (totals["source_keys"], totals["target_keys"]) == (200, 200)
+
+
+def test_report_is_capped(source, target):
+    fill(source, range(50))
+    report = KeyspaceDiff(source, target, bucket_bits=2, max_report=10).run()
+    assert len(report["missing"]) == 10 and report["totals"]["missing"] == 50
+    assert report["truncated"]
@@ -0,0 +1,46 @@
+import threading
+import time
+
+import pytest
+
+from redislens.jobs import JobLimitError, JobManager, jobs
+
+
+def wait(job, timeout=5):
+    for _ in range(int(timeout / 0.01)):
+        if job.finished:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job.id} did not finish")
+
+
+def test_submit_rejects_jobs_over_the_limit():
+    manager = JobManager(max_running=2)
+    release = threading.Event()
+    running = [manager.submit("block", lambda job: release.wait(5)) for _ in range(2)]
+    with pytest.raises(JobLimitError):
+        manager.submit("block", lambda job: None)
+    assert len(manager.list()) == 2
+
+    release.set()
+    for job in running:
+        assert wait(job).status == "completed"
+    assert wait(manager.submit("after", lambda job: 42)).result == 42
+
+
+def test_failed_and_cancelled_jobs_free_their_slot():
+    manager = JobManager(max_running=1)
+    assert wait(manager.submit("fail", lambda job: 1 / 0)).status == "failed"
+    job = manager.submit("cancel", lambda job: job.cancel())
+    assert wait(job).status == "cancelled"
+    assert wait(manager.submit("ok", lambda job: "done")).result == "done"
+
+
+def test_api_answers_429_when_the_job_limit_is_reached(api, monkeypatch):
+    monkeypatch.setattr(jobs, "max_running", 0)
+    for path in ("/api/analysis/memory", "/api/analysis/bigkeys"):
+        response = api.post(path)
+        assert response.status_code == 429
+        assert "already running" in response.json()["detail"]
+    response = api.post("/api/keys/delete-pattern", params={"pattern": "tmp:*"})
+    assert response.status_code == 429
@@ -0,0 +1,133 @@
+import asyncio
+import random
+
+import pytest
+
+from redislens.connection_pool import PoolKey, async_registry
+from redislens.key_index import KeyIndex, SortedKeyIndex
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    # Small chunks make a few hundred keys exercise splits and emptied chunks
+    monkeypatch.setattr(SortedKeyIndex, "CHUNK_SIZE", 4)
+
+
+def test_add_discard_matches_sorted_set(small_chunks):
+    rng = random.Random(7)
+    index = SortedKeyIndex(f"k:{rng.randrange(500):03d}" for _ in range(100))
+    expected = set(index)
+    for _ in range(3000):
+        key = f"k:{rng.randrange(500):03d}"
+        if rng.random() < 0.55:
+            index.add(key)
+            expected.add(key)
+        else:
+            index.discard(key)
+            expected.discard(key)
+        assert len(index) == len(expected)
+    assert list(index) == sorted(expected)
+    assert all(key in index for key in expected)
+    assert "k:999" not in index and "a" not in index and "z" not in index
+
+
+def test_prefix_range_and_count(small_chunks):
+    keys = [f"user:{i}" for i in range(50)] + [f"session:{i}" for i in range(30)] + ["user", "userx"]
+    index = SortedKeyIndex(keys)
+    start, end = index.prefix_range("user:")
+    assert list(index.islice(start, end)) == sorted(key for key in keys if key.startswith("user:"))
+    assert index.count("user:*") == 50
+    assert index.count("user*") == 52
+    assert index.count("*") == len(keys)
+    assert index.count("userx") == 1
+    assert index.count("user:?") is None
+    assert index.search_prefix("session:1", limit=5) == ["session:1", "session:10", "session:11",
+                                                          "session:12", "session:13"]
+    assert index.count("nothing*") == 0
+
+
+def test_prefix_range_after_removing_every_key_of_a_chunk(small_chunks):
+    index = SortedKeyIndex(f"a:{i:02d}" for i in range(20))
+    for i in range(4, 12):
+        index.discard(f"a:{i:02d}")
+    assert index.count("a:0*") == 4
+    assert index.count("a:1*") == 8
+    assert list(index.islice(3, 6)) == ["a:03", "a:12", "a:13"]
+
+
+def test_page_by_key_and_offset(small_chunks):
+    index = SortedKeyIndex(f"item:{i:03d}" for i in range(100))
+    keys, last = index.page("item:*", count=30)
+    assert keys == [f"item:{i:03d}" for i in range(30)] and last == "item:029"
+    keys, last = index.page("item:*", after=last, count=30)
+    assert keys[0] == "item:030" and last == "item:059"
+    keys, last = index.page("item:*", count=30, offset=90)
+    assert keys == [f"item:{i:03d}" for i in range(90, 100)] and last is None
+    keys, _ = index.page("item:?5?", count=100)
+    assert keys == [f"item:{i:03d}" for i in range(100) if i // 10 % 10 == 5]
+
+
+def test_build_replays_events_from_the_initial_scan(fake_registries, client):
+    client.redis_client.config_set("notify-keyspace-events", "EA")
+    client.redis_client.mset({f"k:{i}": i for i in range(50)})
+
+    async def scenario():
+        key = PoolKey("localhost", 6379, 0, None)
+        index = KeyIndex(key, verify_interval=3600)
+        scan_client = index._client()
+        original_scan = scan_client.redis_client.scan
+        writes = []
+
+        async def scan_with_writes(**kwargs):
+            # Change the keyspace behind the first SCAN reply, while the build is still running
+            reply = await original_scan(**kwargs)
+            if not writes:
+                writes.append(client.redis_client.delete("k:0"))
+                writes.append(client.redis_client.set("added", 1))
+                await asyncio.sleep(0.2)
+                assert len(index._pending) == 2
+            return reply
+
+        scan_client.redis_client.scan = scan_with_writes
+        index._client = lambda: scan_client
+        index.start()
+        try:
+            for _ in range(100):
+                if index.ready:
+                    break
+                await asyncio.sleep(0.02)
+            assert index.ready
+            assert index.events_applied == 2
+            assert "k:0" not in index.index and "added" in index.index
+            assert len(index.index) == 50
+
+            # Events after the build are applied as they arrive
+            client.redis_client.delete("k:1")
+            for _ in range(100):
+                if "k:1" not in index.index:
+                    break
+                await asyncio.sleep(0.02)
+            assert "k:1" not in index.index
+        finally:
+            await index.stop()
+            await async_registry.stop()
+
+    asyncio.run(scenario())
+
+
+def test_build_that_outlasts_its_budget_fails(fake_registries, client):
+    # More keys than the first SCAN call covers, so the walk is cut short
+    client.redis_client.mset({f"k:{i}": i for i in range(5000)})
+
+    async def scenario():
+        index = KeyIndex(PoolKey("localhost", 6379, 0, None), verify_interval=3600, build_budget=0)
+        index.start()
+        try:
+            await asyncio.wait_for(index._task, 5)
+            assert index.status == "failed" and not index.ready
+            assert index.error.startswith("The initial SCAN was stopped after 0s")
+        finally:
+            await index.stop()
+            await async_registry.stop()
+
+    asyncio.run(scenario())
@@ -0,0 +1,20 @@
+import asyncio
+
+from redislens.connection_pool import async_registry
+from redislens.latency import LatencyCollector
+
+
+def test_collector_forgets_idle_samplers(fake_registries):
+    collector = LatencyCollector(interval=3600)
+
+    async def scenario():
+        idle = await collector.get_sampler(port=7000)
+        await idle.stop()
+        running = await collector.get_sampler(port=7001)
+        assert await collector.get_sampler(port=7001) is running
+        ports = {key.port for key in collector._samplers}
+        await collector.stop()
+        await async_registry.stop()
+        return ports
+
+    assert asyncio.run(scenario()) == {7001}
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+from redis.exceptions import RedisClusterException
+
+from redislens import metrics
+from redislens.connection_pool import PoolKey
+from redislens.metrics import MetricsCollector, MetricsSampler
+
+
+async def unreachable_cluster(*args, **kwargs):
+    raise RedisClusterException("Redis Cluster cannot be connected. Please provide at least one reachable node")
+
+
+def test_cluster_errors_are_reported_to_subscribers(monkeypatch):
+    monkeypatch.setattr(metrics.async_cluster_registry, "get", unreachable_cluster)
+    sampler = MetricsSampler(PoolKey("localhost", 7000, 0, None), cluster=True)
+
+    async def sample():
+        subscription = sampler.subscribe()
+        await sampler.sample_once()
+        return await subscription.get(timeout=1)
+
+    update = asyncio.run(sample())
+    assert update["error"].startswith("Redis Cluster cannot be connected")
+    assert sampler.last_error == update["error"]
+    assert not sampler.samples
+
+
+def test_unexpected_errors_still_propagate(monkeypatch):
+    async def broken(*args, **kwargs):
+        raise RuntimeError("bug")
+
+    monkeypatch.setattr(metrics.async_cluster_registry, "get", broken)
+    sampler = MetricsSampler(PoolKey("localhost", 7000, 0, None), cluster=True)
+    with pytest.raises(RuntimeError):
+        asyncio.run(sampler.sample_once())
+
+
+def test_collector_forgets_idle_samplers(monkeypatch):
+    monkeypatch.setattr(metrics.async_cluster_registry, "get", unreachable_cluster)
+    collector = MetricsCollector(interval=3600)
+
+    async def scenario():
+        idle = await collector.get_sampler(port=7000, cluster=True)
+        # Stopped polling, as a sampler does once nobody read it for idle_timeout
+        await idle.stop()
+        assert await collector.get_sampler(port=7000, cluster=True) is idle
+        await idle.stop()
+
+        running = await collector.get_sampler(port=7001, cluster=True)
+        ports = {key.port for key, _ in collector._samplers}
+        assert await collector.get_sampler(port=7001, cluster=True) is running
+        await collector.get_sampler(port=7002, cluster=True)
+        ports_after = {key.port for key, _ in collector._samplers}
+        await collector.stop()
+        return ports, ports_after
+
+    assert asyncio.run(scenario()) == ({7001}, {7001, 7002})
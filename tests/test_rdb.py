@@ -0,0 +1,204 @@
+import json
+import struct
+
+import pytest
+
+from redislens.rdb import RdbAnalyzer, RdbError, RdbParser, listpack_count, ziplist_count
+
+CTIME = 1700000000
+
+
+def length(n):
+    if n < 64:
+        return bytes([n])
+    if n < 16384:
+        return bytes([0x40 | (n >> 8), n & 0xFF])
+    return b"\x80" + struct.pack(">I", n)
+
+
+def string(data):
+    data = data.encode() if isinstance(data, str) else data
+    return length(len(data)) + data
+
+
+def ziplist(entries, count=None):
+    body = b""
+    previous = 0
+    for entry in entries:
+        if isinstance(entry, int):
+            encoded = b"\xfe" + struct.pack("<b", entry)
+        else:
+            encoded = bytes([len(entry)]) + entry.encode()
+        item = bytes([previous]) + encoded
+        body += item
+        previous = len(item)
+    total = 10 + len(body) + 1
+    return struct.pack("<IIH", total, 10, len(entries) if count is None else count) + body + b"\xff"
+
+
+def listpack(entries, count=None):
+    body = b""
+    for entry in entries:
+        item = bytes([entry]) if isinstance(entry, int) else bytes([0x80 | len(entry)]) + entry.encode()
+        body += item + bytes([len(item)])
+    total = 6 + len(body) + 1
+    return struct.pack("<IH", total, len(entries) if count is None else count) + body + b"\xff"
+
+
+def intset(values):
+    return struct.pack("<II", 2, len(values)) + b"".join(struct.pack("<h", value) for value in values)
+
+
+def key(type_id, name, payload):
+    return bytes([type_id]) + string(name) + payload
+
+
+def stream(type_id, name):
+    """A stream with one node of 3 entries, one group with one pending entry and one consumer."""
+    out = length(1) + string(b"\0" * 16) + string(listpack(["f", "v", 1]))
+    out += length(3) + length(1) + length(0)  # length, last id
+    if type_id >= 19:
+        out += length(1) + length(0) + length(0) + length(0) + length(3)  # first id, max deleted id, entries added
+    out += length(1) + string("group") + length(1) + length(0)  # group name, last delivered id
+    if type_id >= 19:
+        out += length(3)  # entries read
+    out += length(1) + b"\0" * 24 + length(1)  # one pending entry: id, delivery time, count
+    out += length(1) + string("consumer") + b"\0" * (16 if type_id == 21 else 8)
+    out += length(1) + b"\0" * 16  # consumer pending ids
+    return key(type_id, name, out)
+
+
+def rdb(*records, version=11):
+    out = b"REDIS%04d" % version
+    out += b"\xfa" + string("redis-ver") + string("7.2.4")
+    out += b"\xfa" + string("ctime") + string(str(CTIME))
+    out += b"".join(records)
+    return out + b"\xff" + b"\0" * 8
+
+
+def rows(data):
+    return {row["key"]: row for row in RdbParser(data).rows()}
+
+
+def test_compact_encodings():
+    data = rdb(
+        b"\xfe" + length(0) + b"\xfb" + length(20) + length(2),
+        key(10, "list:ziplist", string(ziplist(["a", "b", 7]))),
+        key(12, "zset:ziplist", string(ziplist(["m1", 1, "m2", 2]))),
+        key(13, "hash:ziplist", string(ziplist(["f1", "v1", "f2", "v2", "f3", "v3"]))),
+        key(16, "hash:listpack", string(listpack(["f1", "v1"]))),
+        key(17, "zset:listpack", string(listpack(["m1", 1, "m2", 2, "m3", 3]))),
+        key(20, "set:listpack", string(listpack(["a", "b", "c", "d"]))),
+        key(11, "set:intset", string(intset([1, 2, 3, 4, 5]))),
+        key(14, "list:quicklist-ziplist", length(2) + string(ziplist(["a", "b"])) + string(ziplist(["c"]))),
+        key(18, "list:quicklist-listpack",
+            length(2) + length(2) + string(listpack(["a", "b", "c"])) + length(1) + string("x" * 100)),
+    )
+    found = rows(data)
+    expected = {
+        "list:ziplist": ("list", "ziplist", 3),
+        "zset:ziplist": ("zset", "ziplist", 2),
+        "hash:ziplist": ("hash", "ziplist", 3),
+        "hash:listpack": ("hash", "listpack", 1),
+        "zset:listpack": ("zset", "listpack", 3),
+        "set:listpack": ("set", "listpack", 4),
+        "set:intset": ("set", "intset", 5),
+        "list:quicklist-ziplist": ("list", "quicklist", 3),
+        "list:quicklist-listpack": ("list", "quicklist", 4),
+    }
+    assert {name: (row["type"], row["encoding"], row["length"]) for name, row in found.items()} == expected
+    assert all(row["memory_usage"] > 0 and row["ttl"] == -1 for row in found.values())
+
+
+def test_plain_encodings_and_strings():
+    # 'x' literal, then a back-reference of 9 bytes at distance 1: ten 'x' after LZF decompression
+    lzf = b"\xc3" + length(4) + length(10) + bytes([0, ord("x"), 0xE0, 0])
+    data = rdb(
+        key(0, "string:embstr", string("hello")),
+        key(0, "string:raw", string("y" * 100)),
+        key(0, "string:int", b"\xc1" + struct.pack("<h", 12345)),
+        key(0, "string:lzf", lzf),
+        key(1, "list:linked", length(2) + string("a") + string("b")),
+        key(2, "set:hashtable", length(3) + string("a") + string("bb") + string("ccc")),
+        key(4, "hash:hashtable", length(1) + string("f") + string("v")),
+        key(5, "zset:skiplist", length(2) + string("m1") + struct.pack("<d", 1) + string("m2") + struct.pack("<d", 2)),
+        key(3, "zset:skiplist-text", length(1) + string("m") + bytes([1]) + b"5"),
+    )
+    found = rows(data)
+    assert [found[name]["encoding"] for name in ("string:embstr", "string:raw", "string:int", "string:lzf")] == \
+        ["embstr", "raw", "int", "embstr"]
+    assert found["string:lzf"]["length"] == 10
+    assert (found["list:linked"]["type"], found["list:linked"]["length"]) == ("list", 2)
+    assert found["set:hashtable"]["length"] == 3
+    assert found["hash:hashtable"]["length"] == 1
+    assert found["zset:skiplist"]["length"] == 2 and found["zset:skiplist-text"]["length"] == 1
+
+
+@pytest.mark.parametrize("type_id", [15, 19, 21])
+def test_streams(type_id):
+    data = rdb(stream(type_id, "events"), key(0, "after", string("v")))
+    found = rows(data)
+    assert (found["events"]["type"], found["events"]["length"]) == ("stream", 3)
+    # The next key is only found if the whole stream, groups and consumers included, was consumed
+    assert found["after"]["type"] == "string"
+
+
+def test_expiry_opcodes_and_databases():
+    data = rdb(
+        b"\xfe" + length(0),
+        b"\xfc" + struct.pack("<q", (CTIME + 120) * 1000) + key(0, "expires:ms", string("v")),
+        b"\xfd" + struct.pack("<i", CTIME + 3600) + key(0, "expires:seconds", string("v")),
+        b"\xf8" + length(100) + key(0, "idle", string("v")),
+        b"\xf9" + bytes([5]) + key(0, "freq", string("v")),
+        b"\xfe" + length(3) + b"\xf4" + length(1) + length(2) + length(3),
+        key(0, "db3", string("v")),
+    )
+    found = rows(data)
+    assert (found["expires:ms"]["expiry"], found["expires:ms"]["ttl"]) == ((CTIME + 120) * 1000, 120)
+    assert (found["expires:seconds"]["expiry"], found["expires:seconds"]["ttl"]) == ((CTIME + 3600) * 1000, 3600)
+    # An expiry only applies to the key right after it
+    assert found["idle"]["expiry"] is None and found["freq"]["ttl"] == -1
+    assert [found[name]["db"] for name in ("expires:ms", "db3")] == [0, 3]
+
+
+def test_skips_functions_and_module_aux():
+    function = b"\xf5" + string("#!lua name=lib\nredis.register_function('f', function() return 1 end)")
+    function_pre_ga = b"\xf6" + string("f") + string("LUA") + length(1) + string("description") + string("return 1")
+    function_pre_ga_no_description = b"\xf6" + string("g") + string("LUA") + length(0) + string("return 2")
+    module_aux = b"\xf7" + length(12345) + length(2) + length(2) + length(5) + string("aux") + length(0)
+    data = rdb(function, function_pre_ga, function_pre_ga_no_description, module_aux, key(0, "k", string("v")))
+    assert list(rows(data)) == ["k"]
+
+
+def test_saturated_header_counts_are_walked():
+    assert ziplist_count(ziplist(["a", 1, "bc"], count=0xFFFF)) == 3
+    assert listpack_count(listpack(["a", 1, "bc", 2], count=0xFFFF)) == 4
+
+
+def test_invalid_files():
+    with pytest.raises(RdbError, match="Not an RDB file"):
+        list(RdbParser(b"NOTREDIS0").rows())
+    with pytest.raises(RdbError, match="Unexpected end of file"):
+        list(RdbParser(rdb(key(0, "k", string("value")))[:-15]).rows())
+    with pytest.raises(RdbError, match="Unsupported value type"):
+        list(RdbParser(rdb(key(99, "k", string("v")))).rows())
+
+
+def test_analyzer_report(tmp_path):
+    path = tmp_path / "dump.rdb"
+    path.write_bytes(rdb(
+        key(0, "user:1", string("alice")),
+        key(0, "user:2", string("bob")),
+        b"\xfc" + struct.pack("<q", (CTIME + 30) * 1000) + key(0, "session:1", string("s")),
+        key(16, "cart:1", string(listpack(["item", "2"]))),
+    ))
+    keys_out = tmp_path / "keys.jsonl"
+    with open(keys_out, "w") as out:
+        report = RdbAnalyzer(str(path), keys_out=out).run()
+    assert report["rdb_version"] == 11 and report["aux"]["redis-ver"] == "7.2.4"
+    assert report["totals"]["scanned"] == 4
+    assert {group["name"]: group["keys"] for group in report["by_prefix"]} == {"user": 2, "session": 1, "cart": 1}
+    assert {group["name"]: group["keys"] for group in report["by_ttl"]} == {"no expiry": 3, "< 1 minute": 1}
+    assert report["databases"] == [{"db": 0, "keys": 4, "expires": 1}]
+    assert [json.loads(line)["key"] for line in keys_out.read_text().splitlines()] == \
+        ["user:1", "user:2", "session:1", "cart:1"]
@@ -0,0 +1,124 @@
+import pytest
+
+from redislens.redis_client import (
+    SCAN_MAX_COUNT,
+    SCAN_MIN_COUNT,
+    ScanState,
+    decode_scan_token,
+    encode_scan_token,
+)
+
+
+@pytest.mark.parametrize("cursor, skip, count", [(0, 0, None), (17, 0, None), (2 ** 40, 35, 1000), (5, 1, 100)])
+def test_token_round_trip(cursor, skip, count):
+    token = encode_scan_token(cursor, skip, count)
+    assert "=" not in token
+    assert decode_scan_token(token) == (cursor, skip, count)
+
+
+@pytest.mark.parametrize("token", [None, "", "0"])
+def test_empty_token_starts_a_new_scan(token):
+    assert decode_scan_token(token) == (0, 0, None)
+
+
+@pytest.mark.parametrize("token", ["not a token", encode_scan_token(1)[:-1] + "!", "MTpmb28", "MToyOjM6NA"])
+def test_invalid_token(token):
+    with pytest.raises(ValueError, match="Invalid cursor token"):
+        decode_scan_token(token)
+
+
+def test_count_is_clamped():
+    assert ScanState(count=1).count == SCAN_MIN_COUNT
+    assert ScanState(count=10 ** 9).count == SCAN_MAX_COUNT
+
+
+def test_count_adapts_to_latency_and_matches():
+    scan = ScanState(count=1000, target_latency=0.01)
+    scan.record(5, [], 0.001)
+    assert scan.count == 2000  # cheap and empty: grow
+    scan.record(9, ["k"] * 10, 0.041)
+    assert scan.count == 500  # 40ms of server time over the round trip: shrink to hit 10ms
+    scan.record(12, ["k"] * 10, 0.008)
+    assert scan.count == 500  # close to the target: keep
+
+
+def test_row_budget_sizes_the_last_call():
+    scan = ScanState(count=1000, max_rows=100)
+    scan.record(5, ["k"] * 10, 0.001)
+    # 10 matches per 1000 slots, 90 rows left: grow, but at most 2x per call
+    assert scan.count == 2000
+    scan.record(9, ["k"] * 80, 0.001)
+    assert scan.count == 251
+    assert not scan.exhausted()
+    scan.record(12, ["k"] * 10, 0.001)
+    assert scan.exhausted() and scan.stop_reason == "row_budget"
+
+
+def test_stop_reasons():
+    scan = ScanState(time_budget=0)
+    # The time budget never prevents the first call
+    assert not scan.exhausted()
+    scan.record(5, [], 0.001)
+    assert scan.exhausted() and scan.stop_reason == "time_budget"
+
+    scan = ScanState(time_budget=0, max_rows=1)
+    scan.record(0, ["k"], 0.001)
+    assert scan.exhausted() and scan.stop_reason == "complete" and scan.complete
+    assert scan.stats()["rows"] == 1 and scan.stats()["calls"] == 1
+
+
+def test_iter_scan_walks_the_whole_keyspace(client):
+    client.redis_client.mset({f"key:{i}": i for i in range(1000)})
+    scan = client.new_scan(count=100)
+    keys = [key for batch in client.iter_scan(scan) for key in batch]
+    assert sorted(keys) == sorted(f"key:{i}" for i in range(1000))
+    assert scan.complete and scan.stop_reason == "complete"
+
+
+def walk_pages(client, **kwargs):
+    keys, token, pages = [], None, 0
+    while True:
+        page = client.scan_keys_page(cursor=token, **kwargs)
+        keys += page["keys"]
+        pages += 1
+        token = page["cursor"]
+        if token is None:
+            return keys, pages
+
+
+def test_pages_resume_from_tokens(client):
+    client.redis_client.mset({f"key:{i}": i for i in range(250)})
+    first = client.scan_keys_page(per_page=40, scan_count=100)
+    assert first["count"] == 40 and first["total"] == 250 and first["has_more"]
+    # The page ended inside a SCAN batch: the token replays that call and skips what was returned
+    assert decode_scan_token(first["cursor"]) == (0, 40, 100)
+
+    keys, pages = walk_pages(client, per_page=40, scan_count=100)
+    assert sorted(keys) == sorted(f"key:{i}" for i in range(250))
+    assert pages == 7
+
+
+def test_sparse_pattern_resumes_after_time_budget(client):
+    client.redis_client.mset({f"key:{i}": i for i in range(2000)})
+    client.redis_client.mset({f"match:{i}": i for i in range(5)})
+    page = client.scan_keys_page("match:*", per_page=50, scan_count=100, time_budget=0)
+    # One SCAN call per request: the page is cut short, and the cursor continues the walk
+    assert page["timed_out"] and page["has_more"] and page["scan"]["calls"] == 1
+    assert page["total"] is None
+
+    keys, _ = walk_pages(client, pattern="match:*", per_page=50, scan_count=100, time_budget=0)
+    assert sorted(keys) == sorted(f"match:{i}" for i in range(5))
+
+
+def test_scan_keys_uses_the_adaptive_walk(client, monkeypatch):
+    client.redis_client.mset({f"key:{i}": i for i in range(3000)})
+    counts = []
+    scan_step = client.scan_step
+
+    def recording_step(scan, raw=False):
+        counts.append(scan.count)
+        return scan_step(scan, raw)
+
+    monkeypatch.setattr(client, "scan_step", recording_step)
+    assert sorted(client._scan_keys("key:*")) == sorted(f"key:{i}" for i in range(3000))
+    assert len(counts) > 1
@@ -0,0 +1,147 @@
+import io
+import time
+
+import fakeredis
+import pytest
+
+from redislens.redis_client import RedisClient
+from redislens.transfer import (
+    END_OF_DUMP,
+    MAGIC,
+    MAX_RECORD_FIELD,
+    RECORD,
+    DumpDecoder,
+    DumpEncoder,
+    DumpFormatError,
+    KeyspaceExporter,
+    import_dump,
+)
+
+from conftest import fake_pool
+
+RECORDS = [
+    (b"plain", -1, b"payload one"),
+    (b"\xff\x00binary key", 5000, b"\x00" * 300),
+    (b"", 1, b"empty key"),
+]
+
+
+@pytest.fixture
+def target():
+    return RedisClient(connection_pool=fake_pool(fakeredis.FakeServer()))
+
+
+def fill(client):
+    r = client.redis_client
+    r.set("string", "value")
+    r.set("expiring", "soon", px=60000)
+    r.hset("hash", mapping={"a": "1", "b": "2"})
+    r.rpush("list", *range(50))
+    r.sadd("set", "x", "y")
+    r.zadd("zset", {"m1": 1.5, "m2": 2})
+    r.set(b"bin\xfe\xff", b"\x00\x01")
+
+
+def raw_keys(client):
+    return sorted(key for batch in client.iter_scan(client.new_scan(), raw=True) for key in batch)
+
+
+def encode(records, compress=False, chunk=2):
+    encoder = DumpEncoder(compress)
+    data = b"".join(encoder.encode(records[start:start + chunk]) for start in range(0, len(records), chunk))
+    return data + encoder.finish()
+
+
+def decode(data, chunk_size=None):
+    decoder = DumpDecoder()
+    chunk_size = chunk_size or len(data) or 1
+    records = []
+    for start in range(0, len(data), chunk_size):
+        records += decoder.feed(data[start:start + chunk_size])
+    decoder.close()
+    return records
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("chunk_size", [None, 1, 7])
+def test_encoder_decoder_round_trip(compress, chunk_size):
+    assert decode(encode(RECORDS, compress), chunk_size) == RECORDS
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_empty_dump(compress):
+    assert decode(encode([], compress), 1) == []
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_export_import_round_trip(client, target, compress):
+    fill(client)
+    stream = io.BytesIO()
+    exported = KeyspaceExporter(client, batch_size=3, compress=compress).export(stream)
+    assert exported["exported"] == 7 and exported["complete"]
+
+    stream.seek(0)
+    result = import_dump(target, stream, batch_size=2)
+    assert (result["records"], result["restored"], result["failed"]) == (7, 7, 0)
+    copy = target.redis_client
+    assert raw_keys(target) == raw_keys(client)
+    assert copy.get(b"bin\xfe\xff") is not None
+    assert copy.hgetall("hash") == {"a": "1", "b": "2"}
+    assert copy.lrange("list", 0, -1) == [str(i) for i in range(50)]
+    assert copy.zrange("zset", 0, -1, withscores=True) == [("m1", 1.5), ("m2", 2.0)]
+    assert copy.ttl("string") == -1 and 0 < copy.pttl("expiring") <= 60000
+
+
+def test_import_without_replace_keeps_existing_keys(client, target):
+    client.redis_client.mset({"a": "new", "b": "new"})
+    target.redis_client.set("a", "old")
+    stream = io.BytesIO()
+    KeyspaceExporter(client).export(stream)
+    stream.seek(0)
+    result = import_dump(target, stream, replace=False)
+    assert (result["restored"], result["existing"]) == (1, 1)
+    assert target.redis_client.mget("a", "b") == ["old", "new"]
+
+
+def test_key_dumped_with_no_time_left_is_not_restored_persistent(client, target):
+    client.redis_client.set("k", "v")
+    (_, _, payload), = client.dump_keys([b"k"])
+    assert target.restore_keys([(b"k", 0, payload)]) == [None]
+    time.sleep(0.01)
+    assert target.redis_client.exists("k") == 0
+
+
+def test_corrupt_inputs():
+    data = encode(RECORDS)
+    cases = {
+        "Not a RedisLens dump": b"NOTDUMP" + data[7:],
+        "Unsupported dump format version": MAGIC + b"\x09" + data[7:],
+        "truncated": data[:-RECORD.size - 3],
+        "claims 2": data[:-RECORD.size] + RECORD.pack(END_OF_DUMP, 0, 2),
+        "Unexpected data after the end": data + b"extra",
+    }
+    for message, corrupt in cases.items():
+        with pytest.raises(DumpFormatError, match=message):
+            decode(corrupt, 5)
+
+
+def test_corrupt_length_fails_without_buffering():
+    decoder = DumpDecoder()
+    header = MAGIC + b"\x01" + RECORD.pack(3, MAX_RECORD_FIELD + 1, -1)
+    with pytest.raises(DumpFormatError, match="claims"):
+        decoder.feed(header)
+
+
+def test_api_export_import(api, client):
+    fill(client)
+    exported = api.post("/api/export", params={"compress": True})
+    assert exported.status_code == 200
+    assert exported.headers["content-disposition"] == 'attachment; filename="redislens-db0.rldump.gz"'
+
+    client.redis_client.flushdb()
+    imported = api.post("/api/import", content=exported.content)
+    assert imported.status_code == 200 and imported.json()["restored"] == 7
+    assert client.redis_client.hgetall("hash") == {"a": "1", "b": "2"}
+
+    invalid = api.post("/api/import", content=b"not a dump")
+    assert invalid.status_code == 400 and invalid.json()["detail"].startswith("Invalid dump file")
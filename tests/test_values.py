@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from redislens.redis_client import MAX_VALUE_PAGE, parse_value_window
+
+
+def test_value_window_clamps_count():
+    assert parse_value_window(None, 0) == (0, 1)
+    assert parse_value_window("20", -5) == (20, 1)
+    assert parse_value_window("7", 10 ** 9) == (7, MAX_VALUE_PAGE)
+
+
+@pytest.mark.parametrize("cursor", ["abc", "-1", "1.5"])
+def test_value_window_rejects_bad_cursors(cursor):
+    with pytest.raises(ValueError, match="Invalid value cursor"):
+        parse_value_window(cursor, 100)
+
+
+def test_value_page_never_reads_everything(client):
+    client.redis_client.rpush("list", *range(500))
+    page = client.get_value_page("list", count=0)
+    assert (page["value"], page["cursor"], page["has_more"]) == (["0"], "1", True)
+    client.redis_client.zadd("zset", {f"m{i}": i for i in range(10)})
+    page = client.get_value_page("zset", count=-3, min_score=2)
+    assert page["value"] == [("m2", 2.0)] and page["cursor"] == "1"
+
+
+def test_key_value_paging_is_validated(api, client):
+    client.redis_client.rpush("list", *range(500))
+    for params in ({"count": 0}, {"count": -1}, {"count": MAX_VALUE_PAGE + 1}):
+        assert api.post("/api/key/list", params=params).status_code == 422
+    for cursor in ("abc", "-10"):
+        response = api.post("/api/key/list", params={"cursor": cursor})
+        assert response.status_code == 400 and response.json()["detail"].startswith("Invalid value cursor")
+
+    page = api.post("/api/key/list", params={"count": 200, "cursor": "400"}).json()
+    assert (len(page["value"]), page["cursor"], page["has_more"]) == (100, None, False)
+
+
+def test_iter_value_stops_on_a_page_that_makes_no_progress(client, monkeypatch):
+    client.redis_client.rpush("list", *range(5))
+    assert [chunk for chunk in client.iter_value("list", count=-1)] == [[str(i)] for i in range(5)]
+
+    stuck = {"value": [], "length": 5, "cursor": "3", "has_more": True}
+    monkeypatch.setattr(client, "get_value_page", lambda *args, **kwargs: stuck)
+    assert list(client.iter_value("list", key_type="list")) == []
+
+
+def test_stream_key_value(api, client):
+    client.redis_client.rpush("list", *range(25))
+    assert api.post("/api/key/list/stream", params={"count": -1}).status_code == 422
+    lines = [json.loads(line) for line in api.post("/api/key/list/stream", params={"count": 10}).iter_lines()]
+    assert [len(line["value"]) for line in lines[1:-1]] == [10, 10, 5]
+    assert lines[0]["type"] == "list" and lines[-1] == {"done": True}